@@ -0,0 +1,57 @@
+"""Add trigram search indexes
+
+Revision ID: c5a8d3f17e64
+Revises: 7b4e2f9a0c31
+Create Date: 2026-10-18 14:00:41.273905
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c5a8d3f17e64"
+down_revision: Union[str, None] = "7b4e2f9a0c31"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(sa.text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    op.create_index(
+        "ix_department_title_trgm",
+        "department",
+        ["title"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"title": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_employee_name_trgm",
+        "employee",
+        ["name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_employee_name_trgm",
+        table_name="employee",
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+    op.drop_index(
+        "ix_department_title_trgm",
+        table_name="department",
+        postgresql_using="gin",
+        postgresql_ops={"title": "gin_trgm_ops"},
+    )
+    # The extension is left in place, other objects of the database may depend on it
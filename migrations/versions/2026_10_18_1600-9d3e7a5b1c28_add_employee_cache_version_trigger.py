@@ -0,0 +1,39 @@
+"""Add employee cache version trigger
+
+Revision ID: 9d3e7a5b1c28
+Revises: 4f9b2c6d8a13
+Create Date: 2026-10-18 16:00:12.385047
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9d3e7a5b1c28"
+down_revision: Union[str, None] = "4f9b2c6d8a13"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        sa.text(
+            """
+            CREATE OR REPLACE TRIGGER employee_bump_cache_version
+            AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON employee
+            FOR EACH STATEMENT EXECUTE FUNCTION bump_cache_version()
+            """
+        )
+    )
+    op.execute(sa.text("INSERT INTO cache_version (name, version) VALUES ('employee', 0)"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(sa.text("DROP TRIGGER IF EXISTS employee_bump_cache_version ON employee"))
+    op.execute(sa.text("DELETE FROM cache_version WHERE name = 'employee'"))
@@ -3,11 +3,13 @@ from apps.company_structure.controllers.api.router import router as api_router
 from apps.company_structure.controllers.web_interface.router import router as templates_router
 from apps.company_structure.infrastructure.configs import AppConfig as CompanyStructureAppConfig
 from apps.company_structure.infrastructure.models import Base as CompanyStructureBase
+from apps.company_structure.infrastructure.response_cache import make_response_cache_store
 
 __all__ = [
     "CompanyStructureAppConfig",
     "CompanyStructureBase",
     "api_router",
     "ioc",
+    "make_response_cache_store",
     "templates_router",
 ]
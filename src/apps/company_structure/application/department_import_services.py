@@ -0,0 +1,108 @@
+import uuid
+from collections.abc import Container, Sequence
+from typing import override
+
+from apps.company_structure.application import (
+    import_ordering,
+    import_schemas,
+    ports,
+    schemas,
+    use_cases,
+)
+from apps.company_structure.domain import exceptions as domain_exceptions
+
+
+class DepartmentImportValidationError(Exception):
+    def __init__(self, errors: Sequence[str]) -> None:
+        super().__init__("Imported departments do not form a forest")
+        self.errors = list(errors)
+
+
+def _check_department_import_rows(rows: Sequence[import_schemas.DepartmentImportRowSchema]) -> None:
+    errors = []
+    keys = set()
+    for row in rows:
+        if row.key in keys:
+            errors.append(f"Duplicate department key {row.key!r}")
+        if row.parent_key is not None and row.parent_id is not None:
+            errors.append(f"Department {row.key!r} has both parent_key and parent_id")
+        keys.add(row.key)
+
+    if errors:
+        raise DepartmentImportValidationError(errors)
+
+
+def _describe_unreachable_department_import_rows(
+    rows: Sequence[import_schemas.DepartmentImportRowSchema],
+    unreachable_rows: Sequence[import_schemas.DepartmentImportRowSchema],
+) -> list[str]:
+    keys = {row.key for row in rows}
+    return [
+        f"Department {row.key!r} is in a parent_key cycle or under an invalid department"
+        if row.parent_key in keys
+        else f"Department {row.key!r} refers to unknown parent_key {row.parent_key!r}"
+        for row in unreachable_rows
+    ]
+
+
+def _describe_missing_parent_id_rows(
+    rows: Sequence[import_schemas.DepartmentImportRowSchema],
+    missing_parent_ids: Container[uuid.UUID],
+) -> list[str]:
+    return [
+        f"Department {row.key!r} in row {row_number} refers to missing parent_id {row.parent_id}"
+        for row_number, row in enumerate(rows, start=1)
+        if row.parent_id in missing_parent_ids
+    ]
+
+
+def _order_department_import_rows(
+    rows: Sequence[import_schemas.DepartmentImportRowSchema],
+) -> list[import_schemas.DepartmentImportRowSchema]:
+    """Check the rows form a forest, ordering parents before children."""
+    _check_department_import_rows(rows)
+    ordered_rows, unreachable_rows = import_ordering.order_parents_first(
+        rows,
+        get_key=lambda row: row.key,
+        get_parent_key=lambda row: row.parent_key,
+    )
+    if unreachable_rows:
+        raise DepartmentImportValidationError(
+            _describe_unreachable_department_import_rows(rows, unreachable_rows)
+        )
+    return ordered_rows
+
+
+class DepartmentImportService(use_cases.ImportDepartmentsUseCase):
+    def __init__(
+        self,
+        bulk_save_port: ports.GenericBulkSavePort[schemas.DepartmentSchema],
+        unit_of_work: ports.UnitOfWorkPort,
+    ) -> None:
+        self._bulk_save_port = bulk_save_port
+        self._unit_of_work = unit_of_work
+
+    @override
+    async def import_departments(
+        self,
+        rows: Sequence[import_schemas.DepartmentImportRowSchema],
+    ) -> import_schemas.ImportResultSchema:
+        ordered_rows = _order_department_import_rows(rows)
+        ids = {row.key: uuid.uuid4() for row in ordered_rows}
+        departments_data = [
+            schemas.DepartmentSchema(
+                id=ids[row.key],
+                title=row.title,
+                parent_id=row.parent_id if row.parent_key is None else ids[row.parent_key],
+            )
+            for row in ordered_rows
+        ]
+        try:
+            await self._bulk_save_port.save_all(departments_data)
+        except domain_exceptions.ParentDepartmentsNotFoundError as exc:
+            raise DepartmentImportValidationError(
+                _describe_missing_parent_id_rows(rows, exc.department_ids)
+            ) from None
+
+        await self._unit_of_work.commit()
+        return import_schemas.ImportResultSchema(created_count=len(departments_data), ids=ids)
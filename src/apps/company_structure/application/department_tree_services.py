@@ -0,0 +1,103 @@
+import builtins
+import uuid
+from collections.abc import Iterator
+from typing import override
+
+from litestar.repository import filters
+
+from apps.company_structure.application import ports, schemas, use_cases
+from apps.company_structure.domain import aggregates, entities
+from apps.company_structure.domain import exceptions as domain_exceptions
+
+
+class DepartmentTreeNotFoundError(Exception):
+    def __init__(self, root_department_id: uuid.UUID) -> None:
+        super().__init__(f"Department tree with root id {root_department_id} not found")
+
+
+def _iter_department_tree_rows(
+    department_tree: aggregates.DepartmentTreeAggregate,
+    max_depth: int | None = None,
+) -> Iterator[schemas.DepartmentNodeSchema]:
+    for step in aggregates.walk_department_tree(department_tree.root, max_depth):
+        yield schemas.DepartmentNodeSchema(
+            id=step.node.id,
+            title=step.node.title,
+            parent_id=step.parent_id,
+            children_count=len(step.node.children),
+            depth=step.depth,
+            headcount=step.node.headcount,
+            total_headcount=step.node.total_headcount,
+        )
+
+
+class DepartmentTreeService(  # noqa: WPS215  # reason: explicit define implemented interfaces
+    use_cases.GenericGetUseCase[uuid.UUID, aggregates.DepartmentTreeAggregate],
+    use_cases.GenericGetListUseCase[aggregates.DepartmentTreeAggregate],
+    use_cases.GetDepartmentTreeUseCase,
+    use_cases.GetDepartmentTreeAsListUseCase,
+    use_cases.GetDepartmentChildrenUseCase,
+    use_cases.GetDepartmentEmployeesUseCase,
+):
+    def __init__(
+        self,
+        fetch_port: ports.GenericFetchPort[uuid.UUID, aggregates.DepartmentTreeAggregate],
+        tree_port: ports.DepartmentTreeFetchPort,
+        hierarchy_port: ports.DepartmentHierarchyFetchPort,
+    ) -> None:
+        self._fetch_port = fetch_port
+        self._tree_port = tree_port
+        self._hierarchy_port = hierarchy_port
+
+    @override
+    async def get_list(self) -> list[aggregates.DepartmentTreeAggregate]:
+        return await self._fetch_port.fetch_all()
+
+    @override
+    async def get(self, root_department_id: uuid.UUID) -> aggregates.DepartmentTreeAggregate:
+        return await self.get_tree(root_department_id)
+
+    @override
+    async def get_tree(
+        self,
+        root_department_id: uuid.UUID,
+        max_depth: int | None = None,
+    ) -> aggregates.DepartmentTreeAggregate:
+        tree = await self._fetch_tree(root_department_id, max_depth)
+        if tree.root.id != root_department_id:
+            raise DepartmentTreeNotFoundError(root_department_id)
+        return tree
+
+    @override
+    async def get_one_as_list(
+        self,
+        department_id: uuid.UUID,
+        max_depth: int | None = None,
+    ) -> list[schemas.DepartmentNodeSchema]:
+        # One more level is fetched, so the deepest rows still count their children
+        fetched_depth = None if max_depth is None else max_depth + 1
+        tree = await self._fetch_tree(department_id, fetched_depth)
+        return list(_iter_department_tree_rows(tree, max_depth))
+
+    @override
+    async def get_children(self, department_id: uuid.UUID) -> list[schemas.DepartmentNodeSchema]:
+        return await self._hierarchy_port.fetch_children(department_id)
+
+    @override
+    async def get_employees(
+        self,
+        department_id: uuid.UUID,
+        limit_offset: filters.LimitOffset,
+        membership: schemas.DepartmentMembership = schemas.DepartmentMembership.all,
+    ) -> tuple[builtins.list[entities.EmployeeEntity], int]:
+        return await self._hierarchy_port.fetch_employees(department_id, membership, limit_offset)
+
+    async def _fetch_tree(
+        self,
+        department_id: uuid.UUID,
+        max_depth: int | None,
+    ) -> aggregates.DepartmentTreeAggregate:
+        try:
+            return await self._tree_port.fetch_tree(department_id, max_depth)
+        except domain_exceptions.DepartmentTreeNodeNotFoundError:
+            raise DepartmentTreeNotFoundError(department_id) from None
@@ -0,0 +1,71 @@
+import uuid
+from typing import override
+
+from litestar.dto import DTOData
+
+from apps.company_structure.application import ports, schemas, use_cases
+from apps.company_structure.domain import exceptions as domain_exceptions
+
+
+class DepartmentUpdateService(  # noqa: WPS215  # reason: explicit define implemented interfaces
+    use_cases.GenericUpdateUseCase[uuid.UUID, schemas.DepartmentSchema],
+    use_cases.MoveDepartmentSubtreeUseCase,
+):
+    def __init__(
+        self,
+        fetch_port: ports.GenericFetchPort[uuid.UUID, schemas.DepartmentSchema],
+        hierarchy_port: ports.DepartmentHierarchyFetchPort,
+        save_port: ports.GenericSavePort[schemas.DepartmentSchema],
+        unit_of_work: ports.UnitOfWorkPort,
+    ) -> None:
+        self._fetch_port = fetch_port
+        self._hierarchy_port = hierarchy_port
+        self._save_port = save_port
+        self._unit_of_work = unit_of_work
+
+    @override
+    async def update(
+        self,
+        department_id: uuid.UUID,
+        department_data: DTOData[schemas.DepartmentSchema],
+    ) -> schemas.DepartmentSchema:
+        department_entity_to_update = await self._fetch_port.fetch_one(department_id)
+        previous_parent_id = department_entity_to_update.parent_id
+        updated_department_entity = department_data.update_instance(department_entity_to_update)
+        if updated_department_entity.parent_id != previous_parent_id:
+            await self._check_parent_is_not_descendant(
+                department_id, updated_department_entity.parent_id
+            )
+        await self._save_port.save(updated_department_entity)
+        await self._unit_of_work.commit()
+        return updated_department_entity
+
+    @override
+    async def move_subtree(
+        self,
+        department_id: uuid.UUID,
+        parent_id: uuid.UUID | None,
+    ) -> schemas.DepartmentSchema:
+        department_data = await self._fetch_port.fetch_one(department_id)
+        await self._check_parent_is_not_descendant(department_id, parent_id)
+        moved_department_data = department_data.model_copy(update={"parent_id": parent_id})
+        # Descendant paths are rebased by one set-based update whatever the subtree size
+        await self._save_port.save(moved_department_data)
+        await self._unit_of_work.commit()
+        return moved_department_data
+
+    async def _check_parent_is_not_descendant(
+        self,
+        department_id: uuid.UUID,
+        parent_id: uuid.UUID | None,
+    ) -> None:
+        if parent_id is None:
+            return
+        if parent_id == department_id:
+            raise domain_exceptions.ForbiddenMoveDepartmentIntoSubtreeError
+        # Concurrent moves of the department or of the parent ancestors wait for this one,
+        # then read the committed paths, so two crossing moves can not both pass the check
+        await self._hierarchy_port.lock_for_move(department_id, parent_id)
+        parent_ancestors = await self._hierarchy_port.fetch_ancestors(parent_id)
+        if any(ancestor.id == department_id for ancestor in parent_ancestors):
+            raise domain_exceptions.ForbiddenMoveDepartmentIntoSubtreeError
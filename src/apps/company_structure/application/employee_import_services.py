@@ -0,0 +1,174 @@
+import uuid
+from collections.abc import Container, Mapping, Sequence
+from collections.abc import Set as AbstractSet
+from dataclasses import dataclass
+from typing import override
+
+from apps.company_structure.application import (
+    import_ordering,
+    import_schemas,
+    ports,
+    schemas,
+    use_cases,
+)
+
+
+class EmployeeImportValidationError(Exception):
+    def __init__(self, errors: Sequence[import_schemas.ImportRowErrorSchema]) -> None:
+        super().__init__("Some imported employees are invalid")
+        self.errors = sorted(errors, key=lambda error: error.row)
+
+
+def _check_employee_import_row(
+    row: import_schemas.EmployeeImportRowSchema,
+    previous_keys: Container[str],
+) -> str | None:
+    if row.key in previous_keys:
+        return f"Duplicate employee key {row.key!r}"
+    if row.manager_key is not None and row.manager_id is not None:
+        return "Set either manager_key or manager_id, not both"
+    if (row.department_id is None) == (row.department_slug is None):
+        return "Set exactly one of department_id and department_slug"
+    return None
+
+
+def _find_employee_import_row_errors(
+    rows: Sequence[import_schemas.EmployeeImportRowSchema],
+) -> list[import_schemas.ImportRowErrorSchema]:
+    errors = []
+    row_numbers: dict[str, int] = {}
+    for row_number, row in enumerate(rows, start=1):
+        message = _check_employee_import_row(row, previous_keys=row_numbers)
+        if message is not None:
+            errors.append(
+                import_schemas.ImportRowErrorSchema(row=row_number, key=row.key, message=message)
+            )
+        row_numbers.setdefault(row.key, row_number)
+    return errors
+
+
+def _describe_unreachable_employee_import_rows(
+    rows: Sequence[import_schemas.EmployeeImportRowSchema],
+    unreachable_rows: Sequence[import_schemas.EmployeeImportRowSchema],
+) -> list[import_schemas.ImportRowErrorSchema]:
+    row_numbers = {row.key: row_number for row_number, row in enumerate(rows, start=1)}
+    return [
+        import_schemas.ImportRowErrorSchema(
+            row=row_numbers[row.key],
+            key=row.key,
+            message=(
+                "Employee is in a manager_key cycle or under an invalid employee"
+                if row.manager_key in row_numbers
+                else f"Unknown manager_key {row.manager_key!r}"
+            ),
+        )
+        for row in unreachable_rows
+    ]
+
+
+@dataclass(frozen=True, slots=True)
+class _EmployeeImportReferences:
+    """Existing departments and managers the imported employees refer to."""
+
+    department_ids_by_slug: Mapping[str, uuid.UUID]
+    department_ids: AbstractSet[uuid.UUID]
+    manager_ids: AbstractSet[uuid.UUID]
+
+    def resolve_department_ids(
+        self,
+        rows: Sequence[import_schemas.EmployeeImportRowSchema],
+    ) -> tuple[dict[str, uuid.UUID], list[import_schemas.ImportRowErrorSchema]]:
+        department_ids = {}
+        errors = []
+        for row_number, row in enumerate(rows, start=1):
+            department_id = self._find_department_id(row)
+            if department_id is None:
+                errors.append(
+                    import_schemas.ImportRowErrorSchema(
+                        row=row_number, key=row.key, message="Department not found"
+                    )
+                )
+            else:
+                department_ids[row.key] = department_id
+            if row.manager_id is not None and row.manager_id not in self.manager_ids:
+                errors.append(
+                    import_schemas.ImportRowErrorSchema(
+                        row=row_number, key=row.key, message="Manager not found"
+                    )
+                )
+        return department_ids, errors
+
+    def _find_department_id(self, row: import_schemas.EmployeeImportRowSchema) -> uuid.UUID | None:
+        if row.department_slug is not None:
+            return self.department_ids_by_slug.get(row.department_slug)
+        if row.department_id in self.department_ids:
+            return row.department_id
+        return None
+
+
+class EmployeeImportService(use_cases.ImportEmployeesUseCase):
+    def __init__(
+        self,
+        lookup_port: ports.EmployeeImportLookupPort,
+        bulk_save_port: ports.GenericBulkSavePort[schemas.EmployeeSchema],
+        unit_of_work: ports.UnitOfWorkPort,
+    ) -> None:
+        self._lookup_port = lookup_port
+        self._bulk_save_port = bulk_save_port
+        self._unit_of_work = unit_of_work
+
+    @override
+    async def import_employees(
+        self,
+        rows: Sequence[import_schemas.EmployeeImportRowSchema],
+    ) -> import_schemas.ImportResultSchema:
+        ordered_rows, department_ids = await self._validate_rows(rows)
+        ids = {row.key: uuid.uuid4() for row in ordered_rows}
+        employees_data = [
+            schemas.EmployeeSchema(
+                id=ids[row.key],
+                name=row.name,
+                department_id=department_ids[row.key],
+                manager_id=row.manager_id if row.manager_key is None else ids[row.manager_key],
+            )
+            for row in ordered_rows
+        ]
+        await self._bulk_save_port.save_all(employees_data)
+        await self._unit_of_work.commit()
+        return import_schemas.ImportResultSchema(created_count=len(employees_data), ids=ids)
+
+    async def _validate_rows(
+        self,
+        rows: Sequence[import_schemas.EmployeeImportRowSchema],
+    ) -> tuple[list[import_schemas.EmployeeImportRowSchema], dict[str, uuid.UUID]]:
+        """Check the whole batch reporting every invalid row, order managers first."""
+        references = await self._fetch_references(rows)
+        department_ids, errors = references.resolve_department_ids(rows)
+        errors.extend(_find_employee_import_row_errors(rows))
+        if len({row.key for row in rows}) < len(rows):
+            # Managers are found by key, the rows are not ordered until keys are unique
+            raise EmployeeImportValidationError(errors)
+        ordered_rows, unreachable_rows = import_ordering.order_parents_first(
+            rows,
+            get_key=lambda row: row.key,
+            get_parent_key=lambda row: row.manager_key,
+        )
+        errors.extend(_describe_unreachable_employee_import_rows(rows, unreachable_rows))
+        if errors:
+            raise EmployeeImportValidationError(errors)
+        return ordered_rows, department_ids
+
+    async def _fetch_references(
+        self,
+        rows: Sequence[import_schemas.EmployeeImportRowSchema],
+    ) -> _EmployeeImportReferences:
+        department_slugs = {row.department_slug for row in rows if row.department_slug is not None}
+        department_ids = {row.department_id for row in rows if row.department_id is not None}
+        manager_ids = {row.manager_id for row in rows if row.manager_id is not None}
+        return _EmployeeImportReferences(
+            department_ids_by_slug=await self._lookup_port.fetch_department_ids_by_slug(
+                department_slugs
+            ),
+            department_ids=await self._lookup_port.fetch_existing_department_ids(department_ids),
+            manager_ids=await self._lookup_port.fetch_existing_employee_ids(manager_ids),
+        )
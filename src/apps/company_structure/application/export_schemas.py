@@ -0,0 +1,19 @@
+from collections.abc import AsyncIterator, Sequence
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Any
+
+type ExportBatch = Sequence[Sequence[Any]]
+
+
+class ExportFormat(StrEnum):
+    csv = "csv"
+    ndjson = "ndjson"
+
+
+@dataclass(frozen=True, slots=True)
+class ExportRows:
+    """Rows read from an open cursor, batches are fetched as they are iterated."""
+
+    columns: Sequence[str]
+    batches: AsyncIterator[ExportBatch]
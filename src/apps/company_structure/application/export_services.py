@@ -0,0 +1,58 @@
+import csv
+import io
+import json
+from collections.abc import AsyncIterator
+from typing import override
+
+from apps.company_structure.application import export_schemas, ports, use_cases
+
+
+async def _encode_ndjson(export_rows: export_schemas.ExportRows) -> AsyncIterator[bytes]:
+    async for batch in export_rows.batches:
+        lines = (
+            json.dumps(dict(zip(export_rows.columns, row, strict=True)), default=str)
+            for row in batch
+        )
+        yield "".join(f"{line}\n" for line in lines).encode()
+
+
+async def _encode_csv(export_rows: export_schemas.ExportRows) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(export_rows.columns)
+    async for batch in export_rows.batches:
+        writer.writerows(batch)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def _encode(
+    export_rows: export_schemas.ExportRows, export_format: export_schemas.ExportFormat
+) -> AsyncIterator[bytes]:
+    """Encode rows batch by batch, so memory does not grow with the export size."""
+    if export_format is export_schemas.ExportFormat.csv:
+        return _encode_csv(export_rows)
+    return _encode_ndjson(export_rows)
+
+
+class ExportService(  # noqa: WPS215  # reason: explicit define implemented interfaces
+    use_cases.ExportDepartmentsUseCase,
+    use_cases.ExportEmployeesUseCase,
+):
+    def __init__(self, export_port: ports.ExportRowsPort) -> None:
+        self._export_port = export_port
+
+    @override
+    async def export_departments(
+        self, export_format: export_schemas.ExportFormat
+    ) -> AsyncIterator[bytes]:
+        return _encode(await self._export_port.stream_departments(), export_format)
+
+    @override
+    async def export_employees(
+        self, export_format: export_schemas.ExportFormat
+    ) -> AsyncIterator[bytes]:
+        return _encode(await self._export_port.stream_employees(), export_format)
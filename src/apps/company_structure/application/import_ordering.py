@@ -0,0 +1,45 @@
+from collections import defaultdict
+from collections.abc import Callable, Mapping, Sequence
+
+
+def _group_by_parent_key[RowT](
+    rows: Sequence[RowT],
+    get_parent_key: Callable[[RowT], str | None],
+) -> defaultdict[str | None, list[RowT]]:
+    child_rows: defaultdict[str | None, list[RowT]] = defaultdict(list)
+    for row in rows:
+        child_rows[get_parent_key(row)].append(row)
+    return child_rows
+
+
+def _collect_reachable_rows[RowT](
+    child_rows: Mapping[str | None, list[RowT]],
+    get_key: Callable[[RowT], str],
+) -> dict[str, RowT]:
+    """Walk down from the rows without parent, keeping the first row of every key."""
+    reachable_rows: dict[str, RowT] = {}
+    stack = list(reversed(child_rows.get(None, [])))
+    while stack:
+        parent_row = stack.pop()
+        parent_key = get_key(parent_row)
+        if parent_key not in reachable_rows:
+            reachable_rows[parent_key] = parent_row
+            stack.extend(reversed(child_rows.get(parent_key, [])))
+    return reachable_rows
+
+
+def order_parents_first[RowT](
+    rows: Sequence[RowT],
+    get_key: Callable[[RowT], str],
+    get_parent_key: Callable[[RowT], str | None],
+) -> tuple[list[RowT], list[RowT]]:
+    """Order the rows of an imported forest in one pass, parents before children.
+
+    Keys must be unique, callers reject duplicates first. A row whose key was
+    already emitted is skipped, so duplicates cannot make the walk loop. Rows not
+    reachable from a row without parent refer to an unknown parent or are in
+    a cycle, they are returned as the second item.
+    """
+    reachable_rows = _collect_reachable_rows(_group_by_parent_key(rows, get_parent_key), get_key)
+    unreachable_rows = [row for row in rows if get_key(row) not in reachable_rows]
+    return list(reachable_rows.values()), unreachable_rows
@@ -0,0 +1,37 @@
+import uuid
+
+from pydantic import BaseModel
+
+
+class DepartmentImportRowSchema(BaseModel):
+    """Imported department, `parent_key` refers to a row of the same batch."""
+
+    key: str
+    title: str
+    parent_key: str | None = None
+    parent_id: uuid.UUID | None = None
+
+
+class EmployeeImportRowSchema(BaseModel):
+    """Imported employee, `manager_key` refers to a row of the same batch.
+
+    The department is referenced either by `department_id` or `department_slug`.
+    """
+
+    key: str
+    name: str
+    department_id: uuid.UUID | None = None
+    department_slug: str | None = None
+    manager_key: str | None = None
+    manager_id: uuid.UUID | None = None
+
+
+class ImportRowErrorSchema(BaseModel):
+    row: int
+    key: str | None
+    message: str
+
+
+class ImportResultSchema(BaseModel):
+    created_count: int
+    ids: dict[str, uuid.UUID]
@@ -0,0 +1,13 @@
+from typing import override
+
+from apps.company_structure.application import ports, use_cases
+from apps.company_structure.domain import entities
+
+
+class OrgStructureVersionService(use_cases.GetOrgStructureVersionUseCase):
+    def __init__(self, version_port: ports.OrgStructureVersionPort) -> None:
+        self._version_port = version_port
+
+    @override
+    async def get_version(self) -> entities.OrgStructureVersion:
+        return await self._version_port.fetch_version()
@@ -0,0 +1,103 @@
+import base64
+import binascii
+import json
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Any, Self
+
+
+class CountStrategy(StrEnum):
+    """How the total of an offset paginated listing is counted."""
+
+    exact = "exact"
+    estimated = "estimated"  # planner statistics, free but may be off after bulk writes
+    cached = "cached"  # exact count reused for a while, lags behind recent writes
+    none = "none"
+
+
+class InvalidCursorError(Exception):
+    def __init__(self) -> None:
+        super().__init__("Invalid pagination cursor")
+
+
+# Not frozen, the return DTO replaces the items with their encoded form
+@dataclass(slots=True)
+class OffsetPage[EntityT]:
+    items: list[EntityT]  # noqa: WPS110  # reason: named like the items of offset pagination
+    limit: int
+    offset: int
+    total: int | None
+    count_strategy: CountStrategy
+
+
+# Not frozen, the return DTO replaces the items with their encoded form
+@dataclass(slots=True)
+class CursorPage[EntityT]:
+    items: list[EntityT]  # noqa: WPS110  # reason: named like the items of offset pagination
+    next_cursor: str | None
+    prev_cursor: str | None
+
+
+def _is_cursor_payload(payload: list[Any]) -> bool:
+    """Check the payload is the direction flag followed by the string parts of the key."""
+    if not payload or not isinstance(payload[0], bool):
+        return False
+    return all(isinstance(key_part, str) for key_part in payload[1:])
+
+
+@dataclass(frozen=True, slots=True)
+class KeysetCursor:
+    """Opaque position in a keyset ordered listing.
+
+    The key is the sort key of the row the page starts after, or before when the cursor
+    points backward, so a page is found by an index seek whatever its depth.
+    """
+
+    key: tuple[str, ...]
+    is_backward: bool = False
+
+    def encode(self) -> str:
+        cursor_parts = [self.is_backward, *self.key]
+        payload = json.dumps(cursor_parts, separators=(",", ":"))
+        encoded_payload = base64.urlsafe_b64encode(payload.encode())
+        return encoded_payload.decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, cursor: str) -> Self:
+        padding = "=" * (-len(cursor) % 4)
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor + padding))
+        except (binascii.Error, ValueError):
+            raise InvalidCursorError from None
+
+        if not isinstance(payload, list) or not _is_cursor_payload(payload):
+            raise InvalidCursorError
+        is_backward, *key = payload
+        return cls(key=tuple(key), is_backward=is_backward)
+
+
+def build_cursor_page[EntityT](
+    fetched_entities: Sequence[EntityT],
+    limit: int,
+    cursor: KeysetCursor | None,
+    get_key: Callable[[EntityT], tuple[str, ...]],
+) -> CursorPage[EntityT]:
+    """Build the page from up to `limit + 1` items fetched in the cursor direction."""
+    is_backward = cursor is not None and cursor.is_backward
+    has_more = len(fetched_entities) > limit
+    page_items = list(fetched_entities[:limit])
+    if is_backward:
+        page_items.reverse()
+    if not page_items:
+        return CursorPage(items=[], next_cursor=None, prev_cursor=None)
+
+    has_next = is_backward or has_more
+    has_prev = has_more if is_backward else cursor is not None
+    return CursorPage(
+        items=page_items,
+        next_cursor=KeysetCursor(get_key(page_items[-1])).encode() if has_next else None,
+        prev_cursor=(
+            KeysetCursor(get_key(page_items[0]), is_backward=True).encode() if has_prev else None
+        ),
+    )
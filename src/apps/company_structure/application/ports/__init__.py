@@ -0,0 +1,42 @@
+from apps.company_structure.application.ports.department_ports import (
+    DepartmentHierarchyFetchPort,
+    DepartmentTreeFetchPort,
+    OrgStructureVersionPort,
+)
+from apps.company_structure.application.ports.employee_ports import (
+    EmployeeImportLookupPort,
+)
+from apps.company_structure.application.ports.export_ports import (
+    ExportRowsPort,
+)
+from apps.company_structure.application.ports.generic_ports import (
+    GenericBulkSavePort,
+    GenericDeletePort,
+    GenericFetchPort,
+    GenericSavePort,
+    UnitOfWorkPort,
+)
+from apps.company_structure.application.ports.search_ports import (
+    SearchPort,
+)
+
+__all__ = [
+    # Department
+    "DepartmentHierarchyFetchPort",
+    "DepartmentTreeFetchPort",
+    # Employee
+    "EmployeeImportLookupPort",
+    # Export
+    "ExportRowsPort",
+    # Generic
+    "GenericBulkSavePort",
+    "GenericDeletePort",
+    "GenericFetchPort",
+    "GenericSavePort",
+    # Org structure
+    "OrgStructureVersionPort",
+    # Search
+    "SearchPort",
+    # Unit of work
+    "UnitOfWorkPort",
+]
@@ -0,0 +1,61 @@
+import uuid
+from abc import abstractmethod
+from typing import Protocol
+
+from litestar.repository import filters
+
+from apps.company_structure.application import schemas
+from apps.company_structure.domain import aggregates, entities
+
+
+class DepartmentTreeFetchPort(Protocol):
+    @abstractmethod
+    async def fetch_tree(
+        self,
+        department_id: uuid.UUID,
+        max_depth: int | None,
+        /,
+    ) -> aggregates.DepartmentTreeAggregate:
+        """Fetch the tree of the department with nodes at most `max_depth` below its root."""
+        raise NotImplementedError
+
+
+class DepartmentHierarchyFetchPort(Protocol):
+    @abstractmethod
+    async def fetch_subtree(self, department_id: uuid.UUID, /) -> list[schemas.DepartmentSchema]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def fetch_children(
+        self, department_id: uuid.UUID, /
+    ) -> list[schemas.DepartmentNodeSchema]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def fetch_ancestors(self, department_id: uuid.UUID, /) -> list[schemas.DepartmentSchema]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def fetch_depth(self, department_id: uuid.UUID, /) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def lock_for_move(self, department_id: uuid.UUID, parent_id: uuid.UUID, /) -> None:
+        """Lock the moved department and the ancestors of its new parent until commit."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def fetch_employees(
+        self,
+        department_id: uuid.UUID,
+        membership: schemas.DepartmentMembership,
+        limit_offset: filters.LimitOffset,
+        /,
+    ) -> tuple[list[entities.EmployeeEntity], int]:
+        raise NotImplementedError
+
+
+class OrgStructureVersionPort(Protocol):
+    @abstractmethod
+    async def fetch_version(self) -> entities.OrgStructureVersion:
+        raise NotImplementedError
@@ -0,0 +1,22 @@
+import uuid
+from abc import abstractmethod
+from collections.abc import Collection
+from typing import Protocol
+
+
+class EmployeeImportLookupPort(Protocol):
+    @abstractmethod
+    async def fetch_department_ids_by_slug(self, slugs: Collection[str], /) -> dict[str, uuid.UUID]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def fetch_existing_department_ids(
+        self, department_ids: Collection[uuid.UUID], /
+    ) -> set[uuid.UUID]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def fetch_existing_employee_ids(
+        self, employee_ids: Collection[uuid.UUID], /
+    ) -> set[uuid.UUID]:
+        raise NotImplementedError
@@ -0,0 +1,14 @@
+from abc import abstractmethod
+from typing import Protocol
+
+from apps.company_structure.application import export_schemas
+
+
+class ExportRowsPort(Protocol):
+    @abstractmethod
+    async def stream_departments(self) -> export_schemas.ExportRows:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def stream_employees(self) -> export_schemas.ExportRows:
+        raise NotImplementedError
@@ -1,8 +1,11 @@
 from abc import abstractmethod
+from collections.abc import Sequence
 from typing import Protocol, TypeVar
 
 from litestar.repository import filters
 
+from apps.company_structure.application import pagination
+
 EntityT = TypeVar("EntityT")
 IdentifierT = TypeVar("IdentifierT")
 
@@ -15,7 +18,16 @@ class GenericFetchPort[IdentifierT, EntityT](Protocol):
     async def fetch_all(self) -> list[EntityT]:
         raise NotImplementedError
 
-    async def fetch_page(self, limit_offset: filters.LimitOffset) -> tuple[list[EntityT], int]:
+    async def fetch_page(
+        self,
+        limit_offset: filters.LimitOffset,
+        count_strategy: pagination.CountStrategy = pagination.CountStrategy.exact,
+    ) -> tuple[list[EntityT], int | None]:
+        raise NotImplementedError
+
+    async def fetch_cursor_page(
+        self, cursor: str | None, limit: int
+    ) -> pagination.CursorPage[EntityT]:
         raise NotImplementedError
 
 
@@ -25,7 +37,19 @@ class GenericSavePort[EntityT](Protocol):
         raise NotImplementedError
 
 
+class GenericBulkSavePort[EntityT](Protocol):
+    @abstractmethod
+    async def save_all(self, entities: Sequence[EntityT]) -> None:
+        raise NotImplementedError
+
+
 class GenericDeletePort[IdentifierT](Protocol):
     @abstractmethod
     async def delete(self, entity_id: IdentifierT) -> None:
         raise NotImplementedError
+
+
+class UnitOfWorkPort(Protocol):
+    @abstractmethod
+    async def commit(self) -> None:
+        raise NotImplementedError
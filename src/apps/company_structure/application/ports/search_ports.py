@@ -0,0 +1,17 @@
+from abc import abstractmethod
+from typing import Protocol
+
+from litestar.repository import filters
+
+from apps.company_structure.application import schemas
+
+
+class SearchPort(Protocol):
+    @abstractmethod
+    async def search(
+        self,
+        query: str,
+        limit_offset: filters.LimitOffset,
+        kind: schemas.SearchResultKind | None = None,
+    ) -> list[schemas.SearchResultSchema]:
+        raise NotImplementedError
@@ -1,4 +1,5 @@
 import uuid
+from enum import StrEnum
 
 from pydantic import BaseModel
 
@@ -7,3 +8,42 @@ class DepartmentSchema(BaseModel):
     id: uuid.UUID
     title: str
     parent_id: uuid.UUID | None
+
+
+class DepartmentNodeSchema(DepartmentSchema):
+    children_count: int
+    depth: int
+    headcount: int = 0
+    total_headcount: int = 0
+
+
+class DepartmentMoveSchema(BaseModel):
+    parent_id: uuid.UUID | None
+
+
+class EmployeeSchema(BaseModel):
+    id: uuid.UUID
+    name: str
+    department_id: uuid.UUID
+    manager_id: uuid.UUID | None
+
+
+class DepartmentMembership(StrEnum):
+    """Which employees of a department subtree are listed."""
+
+    all = "all"
+    direct = "direct"  # of the department itself
+    indirect = "indirect"  # of its descendants only
+
+
+class SearchResultKind(StrEnum):
+    department = "department"
+    employee = "employee"
+
+
+class SearchResultSchema(BaseModel):
+    kind: SearchResultKind
+    id: uuid.UUID
+    slug: str
+    label: str
+    score: float
@@ -0,0 +1,22 @@
+from typing import override
+
+from litestar.repository import filters
+
+from apps.company_structure.application import ports, schemas, use_cases
+
+
+class SearchService(use_cases.SearchUseCase):
+    def __init__(self, search_port: ports.SearchPort) -> None:
+        self._search_port = search_port
+
+    @override
+    async def search(
+        self,
+        query: str,
+        limit_offset: filters.LimitOffset,
+        kind: schemas.SearchResultKind | None = None,
+    ) -> list[schemas.SearchResultSchema]:
+        normalized_query = " ".join(query.split())
+        if not normalized_query:
+            return []
+        return await self._search_port.search(normalized_query, limit_offset, kind)
@@ -1,23 +1,53 @@
 from apps.company_structure.application.use_cases.department_use_cases import (
+    GetDepartmentChildrenUseCase,
+    GetDepartmentEmployeesUseCase,
     GetDepartmentTreeAsListUseCase,
+    GetDepartmentTreeUseCase,
+    GetOrgStructureVersionUseCase,
+    ImportDepartmentsUseCase,
+    MoveDepartmentSubtreeUseCase,
+)
+from apps.company_structure.application.use_cases.employee_use_cases import (
+    ImportEmployeesUseCase,
+)
+from apps.company_structure.application.use_cases.export_use_cases import (
+    ExportDepartmentsUseCase,
+    ExportEmployeesUseCase,
 )
 from apps.company_structure.application.use_cases.generic_use_cases import (
     GenericCreateUseCase,
     GenericDeleteUseCase,
+    GenericGetCursorPageUseCase,
     GenericGetListUseCase,
     GenericGetPaginatedListUseCase,
     GenericGetUseCase,
     GenericUpdateUseCase,
 )
+from apps.company_structure.application.use_cases.search_use_cases import (
+    SearchUseCase,
+)
 
 __all__ = [
+    # Export
+    "ExportDepartmentsUseCase",
+    "ExportEmployeesUseCase",
     # Generic
     "GenericCreateUseCase",
     "GenericDeleteUseCase",
+    "GenericGetCursorPageUseCase",
     "GenericGetListUseCase",
     "GenericGetPaginatedListUseCase",
     "GenericGetUseCase",
     "GenericUpdateUseCase",
     # Department
+    "GetDepartmentChildrenUseCase",
+    "GetDepartmentEmployeesUseCase",
     "GetDepartmentTreeAsListUseCase",
+    "GetDepartmentTreeUseCase",
+    "GetOrgStructureVersionUseCase",
+    "ImportDepartmentsUseCase",
+    "ImportEmployeesUseCase",
+    "MoveDepartmentSubtreeUseCase",
+    # Search
+    "SearchUseCase",
 ]
@@ -1,10 +1,70 @@
 import uuid
 from abc import abstractmethod
+from collections.abc import Sequence
 
-from apps.company_structure.application import schemas
+from litestar.repository import filters
+
+from apps.company_structure.application import import_schemas, schemas
+from apps.company_structure.domain import aggregates, entities
+
+
+class GetDepartmentTreeUseCase:
+    @abstractmethod
+    async def get_tree(
+        self,
+        root_id: uuid.UUID,
+        max_depth: int | None = None,
+    ) -> aggregates.DepartmentTreeAggregate:
+        raise NotImplementedError
 
 
 class GetDepartmentTreeAsListUseCase:
     @abstractmethod
-    async def get_one_as_list(self, root_id: uuid.UUID) -> list[schemas.DepartmentSchema]:
+    async def get_one_as_list(
+        self,
+        root_id: uuid.UUID,
+        max_depth: int | None = None,
+    ) -> list[schemas.DepartmentNodeSchema]:
+        raise NotImplementedError
+
+
+class GetDepartmentChildrenUseCase:
+    @abstractmethod
+    async def get_children(self, department_id: uuid.UUID) -> list[schemas.DepartmentNodeSchema]:
+        raise NotImplementedError
+
+
+class GetDepartmentEmployeesUseCase:
+    @abstractmethod
+    async def get_employees(
+        self,
+        department_id: uuid.UUID,
+        limit_offset: filters.LimitOffset,
+        membership: schemas.DepartmentMembership = schemas.DepartmentMembership.all,
+    ) -> tuple[list[entities.EmployeeEntity], int]:
+        raise NotImplementedError
+
+
+class GetOrgStructureVersionUseCase:
+    @abstractmethod
+    async def get_version(self) -> entities.OrgStructureVersion:
+        raise NotImplementedError
+
+
+class MoveDepartmentSubtreeUseCase:
+    @abstractmethod
+    async def move_subtree(
+        self,
+        department_id: uuid.UUID,
+        parent_id: uuid.UUID | None,
+    ) -> schemas.DepartmentSchema:
+        raise NotImplementedError
+
+
+class ImportDepartmentsUseCase:
+    @abstractmethod
+    async def import_departments(
+        self,
+        rows: Sequence[import_schemas.DepartmentImportRowSchema],
+    ) -> import_schemas.ImportResultSchema:
         raise NotImplementedError
@@ -0,0 +1,13 @@
+from abc import abstractmethod
+from collections.abc import Sequence
+
+from apps.company_structure.application import import_schemas
+
+
+class ImportEmployeesUseCase:
+    @abstractmethod
+    async def import_employees(
+        self,
+        rows: Sequence[import_schemas.EmployeeImportRowSchema],
+    ) -> import_schemas.ImportResultSchema:
+        raise NotImplementedError
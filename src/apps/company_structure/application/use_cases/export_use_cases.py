@@ -0,0 +1,20 @@
+from abc import abstractmethod
+from collections.abc import AsyncIterator
+
+from apps.company_structure.application import export_schemas
+
+
+class ExportDepartmentsUseCase:
+    @abstractmethod
+    async def export_departments(
+        self, export_format: export_schemas.ExportFormat
+    ) -> AsyncIterator[bytes]:
+        raise NotImplementedError
+
+
+class ExportEmployeesUseCase:
+    @abstractmethod
+    async def export_employees(
+        self, export_format: export_schemas.ExportFormat
+    ) -> AsyncIterator[bytes]:
+        raise NotImplementedError
@@ -4,6 +4,8 @@ from typing import Protocol, TypeVar
 from litestar.dto import DTOData
 from litestar.repository import filters
 
+from apps.company_structure.application import pagination
+
 EntityT = TypeVar("EntityT")
 IdentifierT = TypeVar("IdentifierT")
 
@@ -14,7 +16,16 @@ class GenericGetListUseCase[EntityT](Protocol):
 
 
 class GenericGetPaginatedListUseCase[EntityT](Protocol):
-    async def paginated_list(self, limit_offset: filters.LimitOffset) -> tuple[list[EntityT], int]:
+    async def paginated_list(
+        self,
+        limit_offset: filters.LimitOffset,
+        count_strategy: pagination.CountStrategy = pagination.CountStrategy.exact,
+    ) -> tuple[list[EntityT], int | None]:
+        raise NotImplementedError
+
+
+class GenericGetCursorPageUseCase[EntityT](Protocol):
+    async def cursor_page(self, cursor: str | None, limit: int) -> pagination.CursorPage[EntityT]:
         raise NotImplementedError
 
 
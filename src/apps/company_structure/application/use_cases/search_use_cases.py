@@ -0,0 +1,16 @@
+from abc import abstractmethod
+
+from litestar.repository import filters
+
+from apps.company_structure.application import schemas
+
+
+class SearchUseCase:
+    @abstractmethod
+    async def search(
+        self,
+        query: str,
+        limit_offset: filters.LimitOffset,
+        kind: schemas.SearchResultKind | None = None,
+    ) -> list[schemas.SearchResultSchema]:
+        raise NotImplementedError
@@ -0,0 +1,61 @@
+from typing import Any
+
+from litestar import Request, Response
+from litestar.status_codes import HTTP_400_BAD_REQUEST, HTTP_404_NOT_FOUND, HTTP_409_CONFLICT
+
+from apps.company_structure.application import (
+    department_import_services,
+    employee_import_services,
+    pagination,
+)
+from apps.company_structure.domain import exceptions as domain_exceptions
+
+
+def _build_error_response(
+    status_code: int,
+    exception: Exception,
+    extra: Any = None,  # noqa: ANN401  # reason: any serializable error details
+) -> Response[dict[str, Any]]:
+    content = {"status_code": status_code, "detail": str(exception)}
+    if extra is not None:
+        content["extra"] = extra
+    return Response(content=content, status_code=status_code)
+
+
+def forbidden_move_department_handler(
+    request: Request[Any, Any, Any],  # noqa: ARG001  # reason: litestar exception handler signature
+    exception: domain_exceptions.ForbiddenMoveDepartmentIntoSubtreeError,
+) -> Response[dict[str, Any]]:
+    return _build_error_response(HTTP_409_CONFLICT, exception)
+
+
+def department_not_found_handler(
+    request: Request[Any, Any, Any],  # noqa: ARG001  # reason: litestar exception handler signature
+    exception: domain_exceptions.DepartmentTreeNodeNotFoundError,
+) -> Response[dict[str, Any]]:
+    return _build_error_response(HTTP_404_NOT_FOUND, exception)
+
+
+def invalid_cursor_handler(
+    request: Request[Any, Any, Any],  # noqa: ARG001  # reason: litestar exception handler signature
+    exception: pagination.InvalidCursorError,
+) -> Response[dict[str, Any]]:
+    return _build_error_response(HTTP_400_BAD_REQUEST, exception)
+
+
+def department_import_validation_handler(
+    request: Request[Any, Any, Any],  # noqa: ARG001  # reason: litestar exception handler signature
+    exception: department_import_services.DepartmentImportValidationError,
+) -> Response[dict[str, Any]]:
+    return _build_error_response(HTTP_400_BAD_REQUEST, exception, extra=exception.errors)
+
+
+def employee_import_validation_handler(
+    request: Request[Any, Any, Any],  # noqa: ARG001  # reason: litestar exception handler signature
+    exception: employee_import_services.EmployeeImportValidationError,
+) -> Response[dict[str, Any]]:
+    return _build_error_response(
+        HTTP_400_BAD_REQUEST,
+        exception,
+        extra=[error.model_dump() for error in exception.errors],
+    )
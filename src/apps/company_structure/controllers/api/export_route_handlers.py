@@ -0,0 +1,63 @@
+from collections.abc import AsyncIterator, Sequence
+from typing import Annotated
+
+from dishka.integrations.litestar import FromDishka, inject
+from litestar import Controller, get
+from litestar.params import Parameter
+from litestar.response import Stream
+
+from apps.company_structure.application import export_schemas, use_cases
+from apps.company_structure.controllers.api.route_handlers import Tags
+
+_EXPORT_MEDIA_TYPES = {  # noqa: WPS407  # reason: read only lookup table
+    export_schemas.ExportFormat.csv: "text/csv; charset=utf-8",
+    export_schemas.ExportFormat.ndjson: "application/x-ndjson",
+}
+
+
+def _make_export_response(
+    export_chunks: AsyncIterator[bytes],
+    export_format: export_schemas.ExportFormat,
+    file_stem: str,
+) -> Stream:
+    return Stream(
+        export_chunks,
+        media_type=_EXPORT_MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{file_stem}.{export_format.value}"'
+        },
+    )
+
+
+class ExportHTTPController(Controller):
+    """Whole table exports streamed while they are read, gzipped if the client accepts it.
+
+    A client disconnect cancels the stream and closes the database cursor.
+    """
+
+    path = "/export"
+    tags: Sequence[str] | None = [Tags.export.value]
+
+    @get(path="/departments")
+    @inject
+    async def export_departments(
+        self,
+        use_case: FromDishka[use_cases.ExportDepartmentsUseCase],
+        export_format: Annotated[
+            export_schemas.ExportFormat, Parameter(query="format")
+        ] = export_schemas.ExportFormat.ndjson,
+    ) -> Stream:
+        export_chunks = await use_case.export_departments(export_format)
+        return _make_export_response(export_chunks, export_format, "departments")
+
+    @get(path="/employees")
+    @inject
+    async def export_employees(
+        self,
+        use_case: FromDishka[use_cases.ExportEmployeesUseCase],
+        export_format: Annotated[
+            export_schemas.ExportFormat, Parameter(query="format")
+        ] = export_schemas.ExportFormat.ndjson,
+    ) -> Stream:
+        export_chunks = await use_case.export_employees(export_format)
+        return _make_export_response(export_chunks, export_format, "employees")
@@ -0,0 +1,133 @@
+import csv
+import io
+from collections.abc import Callable, Iterable, Sequence
+from typing import Annotated, Any
+
+import pydantic
+from dishka.integrations.litestar import FromDishka, inject
+from litestar import Controller, Request, post
+from litestar.datastructures import UploadFile
+from litestar.enums import RequestEncodingType
+from litestar.exceptions import ValidationException
+from litestar.params import Body
+
+from apps.company_structure.application import employee_import_services, import_schemas, use_cases
+from apps.company_structure.controllers.api.route_handlers import Tags
+
+_department_import_rows_adapter = pydantic.TypeAdapter(
+    list[import_schemas.DepartmentImportRowSchema]
+)
+
+
+async def _read_csv_rows(upload: UploadFile) -> list[dict[str, str | None]]:
+    """Read rows keyed by the header columns, empty cells stand for no value."""
+    try:
+        content = (await upload.read()).decode("utf-8-sig")
+    except UnicodeDecodeError as exc:
+        raise ValidationException(detail="The CSV file is not UTF-8 encoded") from exc
+    return [
+        {column: cell or None for column, cell in csv_row.items()}
+        for csv_row in csv.DictReader(io.StringIO(content))
+    ]
+
+
+async def _parse_department_import_csv(
+    upload: UploadFile,
+) -> list[import_schemas.DepartmentImportRowSchema]:
+    """Read `key,title,parent_key,parent_id` rows."""
+    csv_rows = await _read_csv_rows(upload)
+    try:
+        return _department_import_rows_adapter.validate_python(csv_rows)
+    except pydantic.ValidationError as exc:
+        raise ValidationException(extra=exc.errors(include_url=False)) from exc
+
+
+def _format_validation_error(exc: pydantic.ValidationError) -> str:
+    messages = []
+    for error in exc.errors(include_url=False):
+        location = ".".join(str(part) for part in error["loc"])
+        messages.append(f"{location}: {error['msg']}" if location else error["msg"])
+    return "; ".join(messages)
+
+
+def _validate_employee_import_rows[RawRowT](
+    numbered_raw_rows: Iterable[tuple[int, RawRowT]],
+    validate_row: Callable[[RawRowT], import_schemas.EmployeeImportRowSchema],
+) -> list[import_schemas.EmployeeImportRowSchema]:
+    """Validate rows one by one, so every malformed row is reported with its number."""
+    rows = []
+    errors = []
+    for row_number, raw_row in numbered_raw_rows:
+        try:
+            rows.append(validate_row(raw_row))
+        except pydantic.ValidationError as exc:
+            errors.append(
+                import_schemas.ImportRowErrorSchema(
+                    row=row_number, key=None, message=_format_validation_error(exc)
+                )
+            )
+
+    if errors:
+        raise employee_import_services.EmployeeImportValidationError(errors)
+    return rows
+
+
+class DepartmentImportHTTPController(Controller):
+    path = "/departments/import"
+    tags: Sequence[str] | None = [Tags.departments.value]
+
+    @post()
+    @inject
+    async def import_departments(
+        self,
+        use_case: FromDishka[use_cases.ImportDepartmentsUseCase],
+        data: list[import_schemas.DepartmentImportRowSchema],
+    ) -> import_schemas.ImportResultSchema:
+        return await use_case.import_departments(data)
+
+    @post("/csv")
+    @inject
+    async def import_departments_csv(
+        self,
+        use_case: FromDishka[use_cases.ImportDepartmentsUseCase],
+        data: Annotated[UploadFile, Body(media_type=RequestEncodingType.MULTI_PART)],
+    ) -> import_schemas.ImportResultSchema:
+        return await use_case.import_departments(await _parse_department_import_csv(data))
+
+
+class EmployeeImportHTTPController(Controller):
+    path = "/employees/import"
+    tags: Sequence[str] | None = [Tags.employees.value]
+
+    @post()
+    @inject
+    async def import_employees(
+        self,
+        use_case: FromDishka[use_cases.ImportEmployeesUseCase],
+        request: Request[Any, Any, Any],
+    ) -> import_schemas.ImportResultSchema:
+        """Import employees sent as NDJSON, rows are numbered by their line."""
+        lines = (await request.body()).splitlines()
+        rows = _validate_employee_import_rows(
+            (
+                (line_number, line)
+                for line_number, line in enumerate(lines, start=1)
+                if line.strip()
+            ),
+            validate_row=import_schemas.EmployeeImportRowSchema.model_validate_json,
+        )
+        return await use_case.import_employees(rows)
+
+    @post("/csv")
+    @inject
+    async def import_employees_csv(
+        self,
+        use_case: FromDishka[use_cases.ImportEmployeesUseCase],
+        data: Annotated[UploadFile, Body(media_type=RequestEncodingType.MULTI_PART)],
+    ) -> import_schemas.ImportResultSchema:
+        """Import employees from CSV, rows are numbered without the header."""
+        rows = _validate_employee_import_rows(
+            enumerate(await _read_csv_rows(data), start=1),
+            validate_row=import_schemas.EmployeeImportRowSchema.model_validate,
+        )
+        return await use_case.import_employees(rows)
@@ -0,0 +1,26 @@
+from collections.abc import Sequence
+
+from dishka.integrations.litestar import FromDishka, inject
+from litestar import Controller, get
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from apps.company_structure.controllers.api.route_handlers import Tags
+from apps.company_structure.infrastructure import connection_pool, transactions
+
+
+class InstrumentationHTTPController(Controller):
+    path = "/instrumentation"
+    tags: Sequence[str] | None = [Tags.instrumentation.value]
+
+    @get(path="/db-pools")
+    @inject
+    async def get_db_pools_statistics(
+        self,
+        db_engine: AsyncEngine,
+        read_replica: FromDishka[transactions.ReadReplica],
+    ) -> connection_pool.DatabasePoolsStatistics:
+        """Report connection pool saturation, wait times are cumulative since the start."""
+        return connection_pool.DatabasePoolsStatistics(
+            primary=connection_pool.collect_pool_statistics(db_engine),
+            replica=read_replica.pool_statistics(),
+        )
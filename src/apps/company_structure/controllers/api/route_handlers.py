@@ -1,22 +1,29 @@
 import uuid
 from collections.abc import Sequence
 from enum import Enum
+from typing import Annotated
 
-from advanced_alchemy.service import OffsetPagination
 from dishka.integrations.litestar import FromDishka, inject
 from litestar import Controller, delete, get, patch, post, put
 from litestar.dto import AbstractDTO, DTOData
+from litestar.params import Parameter
 from litestar.repository import filters
 from litestar.types.empty import EmptyType
 
-from apps.company_structure.application import schemas, use_cases
-from apps.company_structure.controllers import dtos
+from apps.company_structure.application import pagination, schemas, use_cases
+from apps.company_structure.controllers import cached_responses, conditional_requests, dtos
 from apps.company_structure.domain import aggregates, entities
 
+_MAX_SEARCH_QUERY_LENGTH = 100
+_conditional_get_middleware = conditional_requests.OrgStructureConditionalGetMiddleware()
+
 
 class Tags(Enum):
     departments = "Departments"
     employees = "Employees"
+    export = "Export"
+    instrumentation = "Instrumentation"
+    search = "Search"
 
 
 class DepartmentHTTPController(Controller):
@@ -25,34 +32,6 @@ class DepartmentHTTPController(Controller):
     dto: type[AbstractDTO[schemas.DepartmentSchema]] | None | EmptyType = dtos.WriteDepartmentDTO
     tags: Sequence[str] | None = [Tags.departments.value]
 
-    @get("/trees", dto=None, return_dto=None)
-    @inject
-    async def get_trees(
-        self,
-        use_case: FromDishka[use_cases.GenericGetListUseCase[aggregates.DepartmentTreeAggregate]],
-    ) -> list[aggregates.DepartmentTreeAggregate]:
-        return await use_case.get_list()
-
-    @get("trees/{root_id:uuid}", dto=None, return_dto=None)
-    @inject
-    async def get_tree(
-        self,
-        use_case: FromDishka[
-            use_cases.GenericGetUseCase[uuid.UUID, aggregates.DepartmentTreeAggregate]
-        ],
-        root_id: uuid.UUID,
-    ) -> aggregates.DepartmentTreeAggregate:
-        return await use_case.get(root_id)
-
-    @get("/trees/{root_id:uuid}/as_list")
-    @inject
-    async def get_tree_as_list(
-        self,
-        use_case: FromDishka[use_cases.GetDepartmentTreeAsListUseCase],
-        root_id: uuid.UUID,
-    ) -> list[schemas.DepartmentSchema]:
-        return await use_case.get_one_as_list(root_id)
-
     @get(path=id_path_param)
     @inject
     async def get(
@@ -101,6 +80,92 @@ class DepartmentHTTPController(Controller):
         await use_case.delete(department_id)
 
 
+class DepartmentHierarchyHTTPController(Controller):
+    path = "/departments"
+    tags: Sequence[str] | None = [Tags.departments.value]
+
+    @get(
+        "/trees",
+        cache=True,
+        cache_key_builder=cached_responses.build_tagged_cache_key,
+        middleware=[_conditional_get_middleware, cached_responses.org_structure_tags_middleware],
+    )
+    @inject
+    async def get_trees(
+        self,
+        use_case: FromDishka[use_cases.GenericGetListUseCase[aggregates.DepartmentTreeAggregate]],
+    ) -> list[aggregates.DepartmentTreeAggregate]:
+        return await use_case.get_list()
+
+    @get(
+        "trees/{root_id:uuid}",
+        cache=True,
+        cache_key_builder=cached_responses.build_tagged_cache_key,
+        middleware=[_conditional_get_middleware, cached_responses.org_structure_tags_middleware],
+    )
+    @inject
+    async def get_tree(
+        self,
+        use_case: FromDishka[use_cases.GetDepartmentTreeUseCase],
+        root_id: uuid.UUID,
+        depth: Annotated[int | None, Parameter(ge=0)] = None,
+    ) -> aggregates.DepartmentTreeAggregate:
+        return await use_case.get_tree(root_id, max_depth=depth)
+
+    @get(
+        "/trees/{root_id:uuid}/as_list",
+        cache=True,
+        cache_key_builder=cached_responses.build_tagged_cache_key,
+        middleware=[_conditional_get_middleware, cached_responses.org_structure_tags_middleware],
+    )
+    @inject
+    async def get_tree_as_list(
+        self,
+        use_case: FromDishka[use_cases.GetDepartmentTreeAsListUseCase],
+        root_id: uuid.UUID,
+        depth: Annotated[int | None, Parameter(ge=0)] = None,
+    ) -> list[schemas.DepartmentNodeSchema]:
+        return await use_case.get_one_as_list(root_id, max_depth=depth)
+
+    @get(path="/{department_id:uuid}/children")
+    @inject
+    async def get_children(
+        self,
+        use_case: FromDishka[use_cases.GetDepartmentChildrenUseCase],
+        department_id: uuid.UUID,
+    ) -> list[schemas.DepartmentNodeSchema]:
+        return await use_case.get_children(department_id)
+
+    @get(path="/{department_id:uuid}/employees", return_dto=dtos.ReadEmployeeDTO)
+    @inject
+    async def get_employees(
+        self,
+        use_case: FromDishka[use_cases.GetDepartmentEmployeesUseCase],
+        department_id: uuid.UUID,
+        limit_offset: filters.LimitOffset,
+        membership: schemas.DepartmentMembership = schemas.DepartmentMembership.all,
+    ) -> pagination.OffsetPage[entities.EmployeeEntity]:
+        """List employees of the department subtree ordered by name."""
+        employees, total = await use_case.get_employees(department_id, limit_offset, membership)
+        return pagination.OffsetPage(
+            items=employees,
+            limit=limit_offset.limit,
+            offset=limit_offset.offset,
+            total=total,
+            count_strategy=pagination.CountStrategy.exact,
+        )
+
+    @post(path="/{department_id:uuid}/move")
+    @inject
+    async def move_subtree(
+        self,
+        use_case: FromDishka[use_cases.MoveDepartmentSubtreeUseCase],
+        department_id: uuid.UUID,
+        data: schemas.DepartmentMoveSchema,
+    ) -> schemas.DepartmentSchema:
+        return await use_case.move_subtree(department_id, data.parent_id)
+
+
 class EmployeeHTTPController(Controller):
     path = "/employees"
     slug_path_param = "/{slug:str}"
@@ -116,16 +181,37 @@ class EmployeeHTTPController(Controller):
         self,
         use_case: FromDishka[use_cases.GenericGetPaginatedListUseCase[entities.EmployeeEntity]],
         limit_offset: filters.LimitOffset,
-    ) -> OffsetPagination[entities.EmployeeEntity]:
-        results, total = await use_case.paginated_list(limit_offset)
-        return OffsetPagination(
+        count: Annotated[
+            pagination.CountStrategy, Parameter(query="count")
+        ] = pagination.CountStrategy.exact,
+    ) -> pagination.OffsetPage[entities.EmployeeEntity]:
+        """List employees by offset, `count` picks how the total is counted."""
+        results, total = await use_case.paginated_list(limit_offset, count)
+        return pagination.OffsetPage(
             items=results,
-            total=total,
             limit=limit_offset.limit,
             offset=limit_offset.offset,
+            total=total,
+            count_strategy=count,
         )
 
-    @get(path=slug_path_param)
+    @get(path="/cursor")
+    @inject
+    async def list_by_cursor(
+        self,
+        use_case: FromDishka[use_cases.GenericGetCursorPageUseCase[entities.EmployeeEntity]],
+        cursor: Annotated[str | None, Parameter(query="cursor")] = None,
+        page_size: Annotated[int, Parameter(query="pageSize", ge=1)] = 10,
+    ) -> pagination.CursorPage[entities.EmployeeEntity]:
+        """List employees ordered by name, any page costs the same as the first one."""
+        return await use_case.cursor_page(cursor, page_size)
+
+    @get(
+        path=slug_path_param,
+        cache=True,
+        cache_key_builder=cached_responses.build_tagged_cache_key,
+        middleware=[cached_responses.employee_tags_middleware],
+    )
     @inject
     async def get(
         self,
@@ -142,3 +228,22 @@ class EmployeeHTTPController(Controller):
         data: DTOData[entities.EmployeeEntity],
     ) -> entities.EmployeeEntity:
         return await use_case.create(data)
+
+
+class SearchHTTPController(Controller):
+    path = "/search"
+    tags: Sequence[str] | None = [Tags.search.value]
+
+    @get()
+    @inject
+    async def search(
+        self,
+        use_case: FromDishka[use_cases.SearchUseCase],
+        search_text: Annotated[
+            str, Parameter(query="q", min_length=1, max_length=_MAX_SEARCH_QUERY_LENGTH)
+        ],
+        limit_offset: filters.LimitOffset,
+        kind: schemas.SearchResultKind | None = None,
+    ) -> list[schemas.SearchResultSchema]:
+        """Find departments and employees by title or name, tolerating typos, best first."""
+        return await use_case.search(search_text, limit_offset, kind)
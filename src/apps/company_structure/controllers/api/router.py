@@ -1,11 +1,36 @@
 from litestar import Router
 
-from apps.company_structure.controllers.api import route_handlers
+from apps.company_structure.application import (
+    department_import_services,
+    employee_import_services,
+    pagination,
+)
+from apps.company_structure.controllers.api import (
+    exception_handlers,
+    export_route_handlers,
+    import_route_handlers,
+    instrumentation_route_handlers,
+    route_handlers,
+)
+from apps.company_structure.domain import exceptions as domain_exceptions
 
 router = Router(
     path="/company_structure/api",
     route_handlers=[
         route_handlers.DepartmentHTTPController,
+        route_handlers.DepartmentHierarchyHTTPController,
+        import_route_handlers.DepartmentImportHTTPController,
         route_handlers.EmployeeHTTPController,
+        import_route_handlers.EmployeeImportHTTPController,
+        route_handlers.SearchHTTPController,
+        export_route_handlers.ExportHTTPController,
+        instrumentation_route_handlers.InstrumentationHTTPController,
     ],
+    exception_handlers={
+        domain_exceptions.ForbiddenMoveDepartmentIntoSubtreeError: exception_handlers.forbidden_move_department_handler,  # noqa: E501
+        domain_exceptions.DepartmentTreeNodeNotFoundError: exception_handlers.department_not_found_handler,  # noqa: E501
+        pagination.InvalidCursorError: exception_handlers.invalid_cursor_handler,
+        department_import_services.DepartmentImportValidationError: exception_handlers.department_import_validation_handler,  # noqa: E501
+        employee_import_services.EmployeeImportValidationError: exception_handlers.employee_import_validation_handler,  # noqa: E501
+    },
 )
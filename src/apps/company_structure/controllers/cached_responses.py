@@ -0,0 +1,69 @@
+from operator import attrgetter
+from typing import Any, override
+
+from litestar import Request
+from litestar.config.response_cache import default_cache_key_builder
+from litestar.enums import ScopeType
+from litestar.middleware import ASGIMiddleware
+from litestar.types import ASGIApp, Receive, Scope, Send
+
+from apps.company_structure.controllers import conditional_requests
+from apps.company_structure.infrastructure import response_cache
+
+_VERSIONS_STATE_KEY = "response_cache_versions"
+_TAG_DATABASE_VERSIONS = {  # noqa: WPS407  # reason: read only lookup table
+    response_cache.ResponseCacheTag.departments: attrgetter("department_version"),
+    response_cache.ResponseCacheTag.employees: attrgetter("employee_version"),
+}
+
+
+def build_tagged_cache_key(request: Request[Any, Any, Any]) -> str:
+    """Prefix the route and parameters key with the versions and accepted encodings.
+
+    Responses are cached once compressed, so clients accepting other encodings
+    get entries of their own.
+    """
+    cache_versions = request.state.get(_VERSIONS_STATE_KEY, "")
+    accept_encoding = request.headers.get("accept-encoding", "")
+    return f"{cache_versions}|{accept_encoding}|{default_cache_key_builder(request)}"
+
+
+class ResponseCacheTagsMiddleware(ASGIMiddleware):
+    """Read the versions of the route cache tags before the cached response is looked up.
+
+    The versions of the tagged aggregates in the database come first, so every worker
+    and replica agrees on them and a response is cached only under the version it was
+    read at. The tag versions only add to them, so a per worker or lost tag store can not
+    serve stale responses.
+
+    Cache keys are built synchronously, so the versions are put in the request state
+    for `build_tagged_cache_key`.
+    """
+
+    scopes: tuple[ScopeType, ...] = (ScopeType.HTTP,)
+
+    def __init__(self, *tags: response_cache.ResponseCacheTag) -> None:
+        self._tags = tags
+
+    @override
+    async def handle(self, scope: Scope, receive: Receive, send: Send, next_app: ASGIApp) -> None:
+        request: Request[Any, Any, Any] = Request(scope)
+        version = await conditional_requests.get_org_structure_version(request)
+        database_versions = ".".join(
+            str(_TAG_DATABASE_VERSIONS[tag](version)) for tag in self._tags
+        )
+        cache_tags = await request.state.dishka_container.get(response_cache.ResponseCacheTags)
+        tag_versions = await cache_tags.get_versions(self._tags)
+        request.state[_VERSIONS_STATE_KEY] = f"{database_versions}.{tag_versions}"
+        await next_app(scope, receive, send)
+
+
+department_tags_middleware = ResponseCacheTagsMiddleware(
+    response_cache.ResponseCacheTag.departments
+)
+employee_tags_middleware = ResponseCacheTagsMiddleware(response_cache.ResponseCacheTag.employees)
+# Trees and the org chart carry headcounts, hiring changes them as much as moving a department
+org_structure_tags_middleware = ResponseCacheTagsMiddleware(
+    response_cache.ResponseCacheTag.departments,
+    response_cache.ResponseCacheTag.employees,
+)
@@ -0,0 +1,116 @@
+from datetime import UTC
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, override
+
+from litestar import Request, status_codes
+from litestar.datastructures import MutableScopeHeaders
+from litestar.enums import ScopeType
+from litestar.middleware import ASGIMiddleware
+from litestar.response.base import ASGIResponse
+from litestar.types import ASGIApp, Message, Receive, Scope, Send
+
+from apps.company_structure.application import use_cases
+from apps.company_structure.domain import entities
+
+_CONDITIONAL_METHODS = frozenset(("GET", "HEAD"))
+_ORG_STRUCTURE_VERSION_STATE_KEY = "org_structure_version"
+
+
+async def get_org_structure_version(
+    request: Request[Any, Any, Any],
+) -> entities.OrgStructureVersion:
+    """Read the version once per request, the middlewares of a route share it."""
+    version: entities.OrgStructureVersion | None = request.state.get(
+        _ORG_STRUCTURE_VERSION_STATE_KEY
+    )
+    if version is None:
+        use_case = await request.state.dishka_container.get(use_cases.GetOrgStructureVersionUseCase)
+        version = await use_case.get_version()
+        request.state[_ORG_STRUCTURE_VERSION_STATE_KEY] = version
+    return version
+
+
+def _make_validator_headers(version: entities.OrgStructureVersion) -> dict[str, str]:
+    # no-cache makes clients revalidate every time instead of guessing a freshness lifetime
+    validator_headers = {
+        "cache-control": "no-cache",
+        "etag": f'"{version.department_version}-{version.employee_version}"',
+    }
+    if version.modified_at is not None:
+        validator_headers["last-modified"] = format_datetime(
+            version.modified_at.astimezone(UTC), usegmt=True
+        )
+    return validator_headers
+
+
+def _is_etag_matched(if_none_match: str, etag: str) -> bool:
+    """Compare weakly as If-None-Match requires, `*` matches any current version."""
+    candidate_tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidate_tags or etag in candidate_tags
+
+
+def _is_unmodified_since(if_modified_since: str, last_modified: str | None) -> bool:
+    if last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=UTC)
+    return parsedate_to_datetime(last_modified) <= since
+
+
+def _is_not_modified(request: Request[Any, Any, Any], validator_headers: dict[str, str]) -> bool:
+    """If-Modified-Since only counts without If-None-Match, as the ETag is more precise."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _is_etag_matched(if_none_match, validator_headers["etag"])
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None:
+        return False
+    return _is_unmodified_since(if_modified_since, validator_headers.get("last-modified"))
+
+
+class _ValidatorHeadersSender:
+    """Send wrapper adding the validators to successful responses."""
+
+    def __init__(self, send: Send, validator_headers: dict[str, str]) -> None:
+        self._send = send
+        self._validator_headers = validator_headers
+
+    async def __call__(self, message: Message) -> None:
+        if (
+            message["type"] == "http.response.start"
+            and message["status"] == status_codes.HTTP_200_OK
+        ):
+            response_headers = MutableScopeHeaders.from_message(message)
+            for header_name, header_value in self._validator_headers.items():
+                response_headers[header_name] = header_value
+        await self._send(message)
+
+
+class OrgStructureConditionalGetMiddleware(ASGIMiddleware):
+    """Answer 304 Not Modified to clients that already have the current org structure.
+
+    The version is read from the cache version table before the handler runs,
+    so an unchanged tree is never loaded, and successful responses get the validators.
+    """
+
+    scopes: tuple[ScopeType, ...] = (ScopeType.HTTP,)
+
+    @override
+    async def handle(self, scope: Scope, receive: Receive, send: Send, next_app: ASGIApp) -> None:
+        request: Request[Any, Any, Any] = Request(scope)
+        if request.method not in _CONDITIONAL_METHODS:
+            await next_app(scope, receive, send)
+            return
+
+        validator_headers = _make_validator_headers(await get_org_structure_version(request))
+        if _is_not_modified(request, validator_headers):
+            not_modified_response = ASGIResponse(
+                status_code=status_codes.HTTP_304_NOT_MODIFIED, headers=validator_headers
+            )
+            await not_modified_response(scope, receive, send)
+            return
+        await next_app(scope, receive, _ValidatorHeadersSender(send, validator_headers))
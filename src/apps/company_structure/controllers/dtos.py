@@ -14,7 +14,7 @@ class PatchDepartmentDTO(PydanticDTO[schemas.DepartmentSchema]):
 
 
 class ReadEmployeeDTO(DataclassDTO[entities.EmployeeEntity]):
-    config = DTOConfig(max_nested_depth=1)
+    config = DTOConfig(max_nested_depth=entities.MANAGER_CHAIN_DEPTH)
 
 
 class WriteEmployeeDTO(DataclassDTO[entities.EmployeeEntity]):
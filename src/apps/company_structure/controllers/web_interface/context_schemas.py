@@ -28,15 +28,23 @@ class OrgChartDepartmentNodeSchema(pydantic.BaseModel):
     id: uuid.UUID
     title: str
     parent_id: uuid.UUID | None = pydantic.Field(serialization_alias="parentId")
+    children_count: int = pydantic.Field(serialization_alias="childrenCount")
+    headcount: int
+    total_headcount: int = pydantic.Field(serialization_alias="totalHeadcount")
 
 
 class OrgChartComponentContext(pydantic.BaseModel):
     department_list: list[OrgChartDepartmentNodeSchema]
 
 
+class OrgChartChildrenComponentContext(pydantic.BaseModel):
+    parent_id: uuid.UUID
+    department_list: list[OrgChartDepartmentNodeSchema]
+
+
 class CreateDepartmentModalContext(pydantic.BaseModel):
     selected_parent_department: schemas.DepartmentSchema
-    department_list: list[schemas.DepartmentSchema]
+    department_list: list[schemas.DepartmentNodeSchema]
 
 
 class ResultToastContext(pydantic.BaseModel):
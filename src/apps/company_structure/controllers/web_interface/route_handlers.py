@@ -1,21 +1,22 @@
 import uuid
 from datetime import UTC, datetime
-from typing import Literal
+from typing import Annotated, Literal
 
 from dishka import FromDishka
 from dishka.integrations.litestar import inject
-from litestar import Controller, delete, get, post, status_codes
+from litestar import Controller, delete, get, params, post, status_codes
 from litestar.dto import DTOData
 from litestar.response import Template
 from litestar_htmx import HTMXTemplate
 
 from apps.company_structure.application import schemas, use_cases
-from apps.company_structure.controllers import dtos
+from apps.company_structure.controllers import cached_responses, conditional_requests, dtos
 from apps.company_structure.controllers.web_interface import context_schemas
 from apps.company_structure.domain import aggregates
 from common.controllers import context_schemas as common_context_schemas
 
 _CONTEXT_MODEL_SERIALIZATION_MODE: Literal["json", "python"] = "json"
+_ORG_CHART_DEFAULT_DEPTH = 2
 
 
 class IndexHTTPController(Controller):
@@ -49,14 +50,24 @@ class IndexHTTPController(Controller):
 
 
 class OrgChartController(Controller):
-    @get(path="/org-chart/{root_id:uuid}", name="company_structure.org_chart")
+    @get(
+        path="/org-chart/{root_id:uuid}",
+        name="company_structure.org_chart",
+        cache=True,
+        cache_key_builder=cached_responses.build_tagged_cache_key,
+        middleware=[
+            conditional_requests.OrgStructureConditionalGetMiddleware(),
+            cached_responses.org_structure_tags_middleware,
+        ],
+    )
     @inject
     async def get_org_chart(
         self,
         root_id: uuid.UUID,
         use_case: FromDishka[use_cases.GetDepartmentTreeAsListUseCase],
+        depth: Annotated[int, params.Parameter(ge=0)] = _ORG_CHART_DEFAULT_DEPTH,
     ) -> HTMXTemplate:
-        department_list = await use_case.get_one_as_list(root_id)
+        department_list = await use_case.get_one_as_list(root_id, max_depth=depth)
         context = context_schemas.OrgChartComponentContext(
             department_list=[
                 context_schemas.OrgChartDepartmentNodeSchema(**department.model_dump())
@@ -68,11 +79,40 @@ class OrgChartController(Controller):
             context=context.model_dump(mode=_CONTEXT_MODEL_SERIALIZATION_MODE),
         )
 
+    @get(
+        path="/org-chart/nodes/{department_id:uuid}/children",
+        name="company_structure.org_chart_children",
+        cache=True,
+        cache_key_builder=cached_responses.build_tagged_cache_key,
+        middleware=[cached_responses.org_structure_tags_middleware],
+    )
+    @inject
+    async def get_org_chart_children(
+        self,
+        department_id: uuid.UUID,
+        use_case: FromDishka[use_cases.GetDepartmentChildrenUseCase],
+    ) -> HTMXTemplate:
+        department_list = await use_case.get_children(department_id)
+        context = context_schemas.OrgChartChildrenComponentContext(
+            parent_id=department_id,
+            department_list=[
+                context_schemas.OrgChartDepartmentNodeSchema(**department.model_dump())
+                for department in department_list
+            ],
+        )
+        return HTMXTemplate(
+            template_name="company_structure/htmx/org-chart-children.html.jinja",
+            context=context.model_dump(mode=_CONTEXT_MODEL_SERIALIZATION_MODE),
+        )
+
 
 class CreateDepartmentController(Controller):
     @get(
         path="departments/{department_id:uuid}/create_modal",
         name="company_structure.create_department_modal",
+        cache=True,
+        cache_key_builder=cached_responses.build_tagged_cache_key,
+        middleware=[cached_responses.department_tags_middleware],
     )
     @inject
     async def get_create_department_modal(
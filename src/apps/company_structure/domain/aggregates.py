@@ -1,7 +1,8 @@
 import uuid
-from collections.abc import Iterator
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass
 
+from apps.company_structure.domain import entities
 from apps.company_structure.domain import exceptions as domain_exceptions
 
 
@@ -10,54 +11,119 @@ class DepartmentTreeNode:
     id: uuid.UUID
     title: str
     children: list["DepartmentTreeNode"]
+    headcount: int = 0
+    total_headcount: int = 0  # including employees of all descendants
+
+
+@dataclass(frozen=True, slots=True)
+class DepartmentTreeWalkStep:
+    node: DepartmentTreeNode
+    parent_id: uuid.UUID | None
+    depth: int
+
+
+def walk_department_tree(
+    subtree_root: DepartmentTreeNode,
+    max_depth: int | None = None,
+) -> Iterator[DepartmentTreeWalkStep]:
+    """Walk the tree in pre-order keeping children order, without recursion.
+
+    Nodes deeper than `max_depth` levels below the subtree root are skipped.
+    """
+    stack = [DepartmentTreeWalkStep(node=subtree_root, parent_id=None, depth=0)]
+    while stack:
+        step = stack.pop()
+        yield step
+        if max_depth is not None and step.depth >= max_depth:
+            continue
+        stack.extend(
+            DepartmentTreeWalkStep(node=child, parent_id=step.node.id, depth=step.depth + 1)
+            for child in reversed(step.node.children)
+        )
+
+
+def _iter_subtree(subtree_root: DepartmentTreeNode) -> Iterator[DepartmentTreeNode]:
+    stack = [subtree_root]
+    while stack:
+        node = stack.pop()
+        yield node
+        stack.extend(node.children)
+
+
+def _index_subtree(
+    subtree_root: DepartmentTreeNode,
+    nodes: dict[uuid.UUID, DepartmentTreeNode],
+    parents: dict[uuid.UUID, DepartmentTreeNode],
+) -> None:
+    for node in _iter_subtree(subtree_root):
+        nodes[node.id] = node
+        for child in node.children:
+            parents[child.id] = node
 
 
 @dataclass
 class DepartmentTreeAggregate:
+    """Department tree with id-to-node and id-to-parent indexes.
+
+    Indexes are kept as plain attributes rather than dataclass fields, so they are
+    never serialized. Nodes must be attached and detached through the aggregate
+    methods to keep the indexes in sync with the tree.
+    """
+
     root: DepartmentTreeNode
 
+    def __post_init__(self) -> None:
+        self._nodes: dict[uuid.UUID, DepartmentTreeNode] = {}
+        self._parents: dict[uuid.UUID, DepartmentTreeNode] = {}
+        _index_subtree(self.root, self._nodes, self._parents)
+
     def __iter__(self) -> Iterator[DepartmentTreeNode]:
-        stack = [self.root]
-        while stack:
-            node = stack.pop()
-            yield node
-            stack.extend(node.children)
+        return _iter_subtree(self.root)
 
     def __contains__(self, node_id: uuid.UUID, /) -> bool:
-        return any(node.id == node_id for node in self)
+        return node_id in self._nodes
 
     def __len__(self) -> int:
-        return len(list(self))
+        return len(self._nodes)
 
     def __getitem__(self, node_id: uuid.UUID) -> DepartmentTreeNode:
-        for node in self:
-            if node.id == node_id:
-                return node
-        raise domain_exceptions.DepartmentTreeNodeNotFoundError
+        try:
+            return self._nodes[node_id]
+        except KeyError:
+            raise domain_exceptions.DepartmentTreeNodeNotFoundError from None
 
     def remove_if_has_no_children(self, node_id: uuid.UUID) -> None:
         node = self[node_id]
         if node.children:
             raise domain_exceptions.ForbiddenDeleteDepartmentWithChildrenError
-        self._remove_department(node_id)
+        self._remove_department(node)
 
     def remove_with_children(self, node_id: uuid.UUID) -> None:
-        self._remove_department(node_id)
+        self._remove_department(self[node_id])
 
     def add_child(self, parent_id: uuid.UUID, child: DepartmentTreeNode) -> None:
         parent = self[parent_id]
         parent.children.append(child)
+        self._parents[child.id] = parent
+        _index_subtree(child, self._nodes, self._parents)
 
-    def _find_parent(self, node_id: uuid.UUID, /) -> DepartmentTreeNode:
-        for node in self:
-            for child in node.children:
-                if child.id == node_id:
-                    return node
-        raise domain_exceptions.DepartmentTreeNodeNotFoundError
-
-    def _remove_department(self, node_id: uuid.UUID) -> None:
-        node = self[node_id]
+    def _remove_department(self, node: DepartmentTreeNode) -> None:
         if node is self.root:
             raise domain_exceptions.ForbiddenDeleteRootDepartmentError
-        parent = self._find_parent(node_id)
+        parent = self._parents[node.id]
         parent.children.remove(node)
+        for removed_node in _iter_subtree(node):
+            self._nodes.pop(removed_node.id)
+            self._parents.pop(removed_node.id)
+
+
+def apply_department_headcounts(
+    department_tree: DepartmentTreeAggregate,
+    headcounts: Mapping[uuid.UUID, entities.DepartmentHeadcount],
+) -> None:
+    """Set headcounts of all nodes, nodes missing from the mapping have no employees."""
+    no_headcount = entities.DepartmentHeadcount(direct=0, total=0)
+    for node in department_tree:
+        headcount = headcounts.get(node.id, no_headcount)
+        node.headcount = headcount.direct
+        node.total_headcount = headcount.total
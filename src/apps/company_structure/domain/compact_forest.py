@@ -0,0 +1,214 @@
+import uuid
+from array import array
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+from apps.company_structure.domain import aggregates
+from apps.company_structure.domain import exceptions as domain_exceptions
+
+_UUID_SIZE = 16
+_SENTINEL = 0  # virtual parent of the forest roots
+_NO_NODE = -1
+_REMOVED = -2
+_INDEX_TYPECODE = "i"
+
+
+@dataclass(frozen=True, slots=True)
+class DepartmentRecord:
+    id: uuid.UUID
+    title: str
+    parent_id: uuid.UUID | None
+
+
+class _NodeArrays:
+    """Parallel arrays, the node `i` is described by the i-th item of every array.
+
+    Children are chained through first-child/next-sibling links, titles are kept
+    in one UTF-8 buffer addressed by offsets. Slot 0 is the sentinel parent of roots.
+    """
+
+    def __init__(self) -> None:
+        self._ids = bytearray(_UUID_SIZE)
+        self.parents = array(_INDEX_TYPECODE, [_NO_NODE])
+        self.first_children = array(_INDEX_TYPECODE, [_NO_NODE])
+        self._last_children = array(_INDEX_TYPECODE, [_NO_NODE])
+        self._next_siblings = array(_INDEX_TYPECODE, [_NO_NODE])
+        self._title_offsets = array("I", [0, 0])
+        self._titles = bytearray()
+
+    def append(self, department_id: uuid.UUID, title: str) -> int:
+        self._ids += department_id.bytes
+        self.parents.append(_NO_NODE)
+        self.first_children.append(_NO_NODE)
+        self._last_children.append(_NO_NODE)
+        self._next_siblings.append(_NO_NODE)
+        self._titles += title.encode()
+        self._title_offsets.append(len(self._titles))
+        return len(self.parents) - 1
+
+    def link(self, node: int, parent: int) -> None:
+        self.parents[node] = parent
+        last_child = self._last_children[parent]
+        if last_child == _NO_NODE:
+            self.first_children[parent] = node
+        else:
+            self._next_siblings[last_child] = node
+        self._last_children[parent] = node
+
+    def unlink(self, node: int) -> None:
+        parent = self.parents[node]
+        previous_sibling = _NO_NODE
+        for sibling in self.iter_children(parent):
+            if sibling == node:
+                break
+            previous_sibling = sibling
+
+        next_sibling = self._next_siblings[node]
+        if previous_sibling == _NO_NODE:
+            self.first_children[parent] = next_sibling
+        else:
+            self._next_siblings[previous_sibling] = next_sibling
+        if self._last_children[parent] == node:
+            self._last_children[parent] = previous_sibling
+
+        self._next_siblings[node] = _NO_NODE
+        self.parents[node] = _REMOVED
+
+    def get_id(self, node: int) -> uuid.UUID:
+        start = node * _UUID_SIZE
+        id_bytes = self._ids[start : start + _UUID_SIZE]
+        return uuid.UUID(bytes=bytes(id_bytes))
+
+    def get_record(self, node: int) -> DepartmentRecord:
+        parent = self.parents[node]
+        title_start = self._title_offsets[node]
+        title_end = self._title_offsets[node + 1]
+        title_bytes = self._titles[title_start:title_end]
+        return DepartmentRecord(
+            id=self.get_id(node),
+            title=title_bytes.decode(),
+            parent_id=None if parent == _SENTINEL else self.get_id(parent),
+        )
+
+    def iter_children(self, node: int) -> Iterator[int]:
+        child = self.first_children[node]
+        while child != _NO_NODE:
+            yield child
+            child = self._next_siblings[child]
+
+    def iter_subtree(self, node: int) -> Iterator[int]:
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            yield current
+            stack.extend(reversed(list(self.iter_children(current))))
+
+    def find_root(self, node: int) -> int:
+        while self.parents[node] != _SENTINEL:
+            node = self.parents[node]
+        return node
+
+
+class CompactDepartmentForest:  # noqa: WPS214  # reason: mirrors DepartmentTreeAggregate interface
+    """Memory efficient department forest for hundreds of thousands of nodes.
+
+    Nodes live in parallel arrays instead of per-node objects and lists, only the
+    id index is a dict. Removed nodes keep their slots until the forest is rebuilt.
+    """
+
+    def __init__(self, records: Iterable[DepartmentRecord] = ()) -> None:
+        self._arrays = _NodeArrays()
+        self._index: dict[int, int] = {}
+
+        # Records may come in any order, so nodes are linked once all of them exist
+        parent_ids = []
+        for record in records:
+            node = self._arrays.append(record.id, record.title)
+            self._index[record.id.int] = node
+            parent_ids.append(record.parent_id)
+        for node, parent_id in enumerate(parent_ids, start=_SENTINEL + 1):
+            parent = _SENTINEL if parent_id is None else self._index[parent_id.int]
+            self._arrays.link(node, parent)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, department_id: uuid.UUID, /) -> bool:
+        return department_id.int in self._index
+
+    def __iter__(self) -> Iterator[DepartmentRecord]:
+        """Iterate over all departments in pre-order, tree by tree."""
+        for root in self._arrays.iter_children(_SENTINEL):
+            for node in self._arrays.iter_subtree(root):
+                yield self._arrays.get_record(node)
+
+    def __getitem__(self, department_id: uuid.UUID) -> DepartmentRecord:
+        return self._arrays.get_record(self._find(department_id))
+
+    @property
+    def root_ids(self) -> list[uuid.UUID]:
+        return [self._arrays.get_id(root) for root in self._arrays.iter_children(_SENTINEL)]
+
+    def add_child(
+        self,
+        parent_id: uuid.UUID | None,
+        child: aggregates.DepartmentTreeNode,
+    ) -> None:
+        """Attach the child subtree to the parent or add it as a new tree if no parent."""
+        parent = _SENTINEL if parent_id is None else self._find(parent_id)
+        for step in aggregates.walk_department_tree(child):
+            node = self._arrays.append(step.node.id, step.node.title)
+            self._index[step.node.id.int] = node
+            self._arrays.link(
+                node, parent if step.parent_id is None else self._find(step.parent_id)
+            )
+
+    def remove_if_has_no_children(self, department_id: uuid.UUID) -> None:
+        node = self._find(department_id)
+        if self._arrays.first_children[node] != _NO_NODE:
+            raise domain_exceptions.ForbiddenDeleteDepartmentWithChildrenError
+        self._remove(node)
+
+    def remove_with_children(self, department_id: uuid.UUID) -> None:
+        self._remove(self._find(department_id))
+
+    def to_tree(
+        self,
+        department_id: uuid.UUID,
+        max_depth: int | None = None,
+    ) -> aggregates.DepartmentTreeAggregate:
+        """Build the tree containing the department as a regular aggregate.
+
+        Only nodes at most `max_depth` levels below the root are built, if it is given.
+        """
+        root_node = self._create_tree_node(self._arrays.find_root(self._find(department_id)))
+        stack = [(root_node, 0)]
+        while stack:
+            tree_node, depth = stack.pop()
+            if max_depth is not None and depth >= max_depth:
+                continue
+            child_nodes = [
+                self._create_tree_node(child)
+                for child in self._arrays.iter_children(self._index[tree_node.id.int])
+            ]
+            tree_node.children.extend(child_nodes)
+            stack.extend((child_node, depth + 1) for child_node in child_nodes)
+
+        return aggregates.DepartmentTreeAggregate(root=root_node)
+
+    def _create_tree_node(self, node: int) -> aggregates.DepartmentTreeNode:
+        record = self._arrays.get_record(node)
+        return aggregates.DepartmentTreeNode(id=record.id, title=record.title, children=[])
+
+    def _find(self, department_id: uuid.UUID) -> int:
+        try:
+            return self._index[department_id.int]
+        except KeyError:
+            raise domain_exceptions.DepartmentTreeNodeNotFoundError from None
+
+    def _remove(self, node: int) -> None:
+        if self._arrays.parents[node] == _SENTINEL:
+            raise domain_exceptions.ForbiddenDeleteRootDepartmentError
+        for removed_node in self._arrays.iter_subtree(node):
+            self._index.pop(self._arrays.get_id(removed_node).int)
+        self._arrays.unlink(node)
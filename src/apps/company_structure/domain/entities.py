@@ -1,6 +1,10 @@
 from dataclasses import dataclass, field
+from datetime import datetime
 from uuid import UUID
 
+# Levels of managers loaded along with an employee, read DTOs render the same depth
+MANAGER_CHAIN_DEPTH = 1
+
 
 @dataclass(slots=True)
 class EmployeeEntity:
@@ -9,3 +13,18 @@ class EmployeeEntity:
     department_id: UUID
 
     manager: "EmployeeEntity | None" = field(default=None)
+
+
+@dataclass(frozen=True, slots=True)
+class DepartmentHeadcount:
+    direct: int
+    total: int  # including employees of all descendants
+
+
+@dataclass(frozen=True, slots=True)
+class OrgStructureVersion:
+    """Changes whenever any department or employee is written."""
+
+    department_version: int
+    employee_version: int
+    modified_at: datetime | None
@@ -1,4 +1,6 @@
+import uuid
 from abc import ABC
+from collections.abc import Collection
 
 
 class ForbiddenDeleteDepartmentError(Exception, ABC):
@@ -21,3 +23,14 @@ class ForbiddenDeleteDepartmentWithChildrenError(ForbiddenDeleteDepartmentError)
 class DepartmentTreeNodeNotFoundError(Exception):
     def __init__(self) -> None:
         super().__init__("Department tree node not found")
+
+
+class ParentDepartmentsNotFoundError(DepartmentTreeNodeNotFoundError):
+    def __init__(self, department_ids: Collection[uuid.UUID]) -> None:
+        super().__init__()
+        self.department_ids = set(department_ids)
+
+
+class ForbiddenMoveDepartmentIntoSubtreeError(Exception):
+    def __init__(self) -> None:
+        super().__init__("Cannot move department into its own subtree")
@@ -0,0 +1,120 @@
+import asyncio
+import time
+import uuid
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from dataclasses import dataclass
+
+from apps.company_structure.domain import compact_forest, entities
+
+type DepartmentRecordsLoader = Callable[[], Awaitable[Iterable[compact_forest.DepartmentRecord]]]
+# Rows of department id, direct headcount and headcount of the whole subtree
+type DepartmentHeadcountsLoader = Callable[[], Awaitable[Iterable[tuple[uuid.UUID, int, int]]]]
+
+
+@dataclass(frozen=True, slots=True)
+class DepartmentForestSnapshot:
+    """View of all departments shared by concurrent readers, never mutated after load.
+
+    Trees built from the forest are fresh aggregates, so callers may mutate them.
+    """
+
+    version: int
+    forest: compact_forest.CompactDepartmentForest
+
+
+class DepartmentForestCache:
+    """Process-wide department forest cache owned by the application container.
+
+    Snapshots are labeled with the database cache version read before loading them,
+    so every worker notices writes made by the other ones and reloads only then.
+    """
+
+    def __init__(self) -> None:
+        self._snapshot: DepartmentForestSnapshot | None = None
+        self._lock = asyncio.Lock()
+
+    def get(self, version: int) -> DepartmentForestSnapshot | None:
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.version != version:
+            return None
+        return snapshot
+
+    async def get_or_load(
+        self,
+        version: int,
+        load_records: DepartmentRecordsLoader,
+    ) -> DepartmentForestSnapshot:
+        snapshot = self.get(version)
+        if snapshot is not None:
+            return snapshot
+
+        async with self._lock:
+            snapshot = self.get(version)
+            if snapshot is None:
+                snapshot = DepartmentForestSnapshot(
+                    version=version,
+                    forest=compact_forest.CompactDepartmentForest(await load_records()),
+                )
+                if self._snapshot is None or self._snapshot.version < version:
+                    self._snapshot = snapshot
+            return snapshot
+
+    def invalidate(self) -> None:
+        self._snapshot = None
+
+
+@dataclass(frozen=True, slots=True)
+class DepartmentHeadcountSnapshot:
+    version: tuple[int, int]
+    headcounts: Mapping[uuid.UUID, entities.DepartmentHeadcount]
+
+
+class DepartmentHeadcountCache:
+    """Process-wide headcounts of all departments, cached next to the department forest.
+
+    Snapshots are labeled with the department and employee cache versions, as moving
+    a department changes the rolled-up headcounts as much as hiring does.
+    """
+
+    def __init__(self) -> None:
+        self._snapshot: DepartmentHeadcountSnapshot | None = None
+        self._lock = asyncio.Lock()
+
+    async def get_or_load(
+        self,
+        version: tuple[int, int],
+        load_headcounts: DepartmentHeadcountsLoader,
+    ) -> Mapping[uuid.UUID, entities.DepartmentHeadcount]:
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.version == version:
+            return snapshot.headcounts
+
+        async with self._lock:
+            snapshot = self._snapshot
+            if snapshot is None or snapshot.version != version:
+                snapshot = DepartmentHeadcountSnapshot(
+                    version=version,
+                    headcounts={
+                        department_id: entities.DepartmentHeadcount(direct=direct, total=total)
+                        for department_id, direct, total in await load_headcounts()
+                    },
+                )
+                self._snapshot = snapshot
+            return snapshot.headcounts
+
+
+class RowCountCache:
+    """Process-wide exact row counts reused until they are older than the TTL."""
+
+    def __init__(self, ttl_seconds: float) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._counts: dict[str, tuple[float, int]] = {}
+
+    async def get_or_count(self, name: str, count_rows: Callable[[], Awaitable[int]]) -> int:
+        counted_at, row_count = self._counts.get(name, (None, 0))
+        if counted_at is not None and time.monotonic() - counted_at < self._ttl_seconds:
+            return row_count
+
+        row_count = await count_rows()
+        self._counts[name] = (time.monotonic(), row_count)
+        return row_count
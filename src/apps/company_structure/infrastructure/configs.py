@@ -1,6 +1,13 @@
 import os
+from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+
+from apps.company_structure.infrastructure import connection_pool
+
+_DEFAULT_POOL_TIMEOUT_SECONDS = 30
+_DEFAULT_COUNT_CACHE_TTL_SECONDS = 60
+_DEFAULT_RESPONSE_CACHE_EXPIRATION_SECONDS = 60
 
 
 class PostgresConfig(BaseModel):
@@ -9,14 +16,81 @@ class PostgresConfig(BaseModel):
     login: str = Field(alias="POSTGRES_USER")
     password: str = Field(alias="POSTGRES_PASSWORD")
     database: str = Field(alias="POSTGRES_DB")
+    # Serializable read only deferrable transactions wait for a snapshot that can not
+    # cause serialization failures, useful for long reads such as exports
+    read_only_deferrable: bool = Field(default=False, alias="POSTGRES_READ_ONLY_DEFERRABLE")
+    # Optional streaming replica serving read only requests, same credentials and database
+    replica_host: str | None = Field(default=None, alias="POSTGRES_REPLICA_HOST")
+    replica_port: int | None = Field(default=None, alias="POSTGRES_REPLICA_PORT")
+    pool_size: int = Field(default=5, alias="POSTGRES_POOL_SIZE")
+    pool_max_overflow: int = Field(default=10, alias="POSTGRES_POOL_MAX_OVERFLOW")
+    pool_timeout: float = Field(
+        default=_DEFAULT_POOL_TIMEOUT_SECONDS, alias="POSTGRES_POOL_TIMEOUT"
+    )
+    pool_recycle: int = Field(default=-1, alias="POSTGRES_POOL_RECYCLE")
+    pool_pre_ping: bool = Field(default=False, alias="POSTGRES_POOL_PRE_PING")
+    # Executions of a query before psycopg prepares it on the server,
+    # empty value disables prepared statements, e.g. behind a transaction pooler
+    prepare_threshold: int | None = Field(default=5, alias="POSTGRES_PREPARE_THRESHOLD")
 
     @property
     def uri(self) -> str:
-        return (
-            f"postgresql+psycopg://{self.login}:{self.password}@{self.host}:{self.port}"
-            f"/{self.database}"
-        )
+        return self._build_uri(self.host, self.port)
+
+    @property
+    def replica_uri(self) -> str | None:
+        if self.replica_host is None:
+            return None
+        return self._build_uri(self.replica_host, self.replica_port or self.port)
+
+    @property
+    def engine_options(self) -> dict[str, Any]:
+        return {
+            "poolclass": connection_pool.InstrumentedAsyncAdaptedQueuePool,
+            "pool_size": self.pool_size,
+            "max_overflow": self.pool_max_overflow,
+            "pool_timeout": self.pool_timeout,
+            "pool_recycle": self.pool_recycle,
+            "pool_pre_ping": self.pool_pre_ping,
+            "connect_args": {"prepare_threshold": self.prepare_threshold},
+        }
+
+    @property
+    def read_only_execution_options(self) -> dict[str, Any]:
+        if not self.read_only_deferrable:
+            return {"postgresql_readonly": True}
+        return {
+            "isolation_level": "SERIALIZABLE",
+            "postgresql_readonly": True,
+            "postgresql_deferrable": True,
+        }
+
+    @field_validator("prepare_threshold", mode="before")
+    @classmethod
+    def _parse_disabled_prepare_threshold(cls, prepare_threshold: object) -> object:
+        return None if prepare_threshold == "" else prepare_threshold
+
+    def _build_uri(self, host: str, port: int) -> str:
+        return f"postgresql+psycopg://{self.login}:{self.password}@{host}:{port}/{self.database}"
 
 
 class AppConfig(BaseModel):
-    postgres: PostgresConfig = Field(default_factory=lambda: PostgresConfig(**os.environ))
+    count_cache_ttl_seconds: float = Field(
+        default_factory=lambda: float(
+            os.environ.get("COUNT_CACHE_TTL_SECONDS", _DEFAULT_COUNT_CACHE_TTL_SECONDS)
+        )
+    )
+    postgres: PostgresConfig = Field(
+        default_factory=lambda: PostgresConfig.model_validate(os.environ)
+    )
+    response_cache_expiration_seconds: int = Field(
+        default_factory=lambda: int(
+            os.environ.get(
+                "RESPONSE_CACHE_EXPIRATION_SECONDS", _DEFAULT_RESPONSE_CACHE_EXPIRATION_SECONDS
+            )
+        )
+    )
+    # Redis shared by all workers, requires the redis package, the default is process memory
+    response_cache_redis_url: str | None = Field(
+        default_factory=lambda: os.environ.get("RESPONSE_CACHE_REDIS_URL") or None
+    )
@@ -0,0 +1,85 @@
+import time
+from dataclasses import dataclass
+from typing import cast, override
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+from sqlalchemy.util.queue import AsyncAdaptedQueue, QueueCommon
+
+
+@dataclass(frozen=True, slots=True)
+class PoolStatistics:
+    size: int
+    checked_out: int
+    overflow: int
+    waiting: int
+    waited_checkouts: int
+    total_wait_seconds: float
+    max_wait_seconds: float
+
+
+@dataclass(frozen=True, slots=True)
+class DatabasePoolsStatistics:
+    primary: PoolStatistics | None
+    replica: PoolStatistics | None
+
+
+class _WaitRecordingQueue(AsyncAdaptedQueue[ConnectionPoolEntry]):
+    """Queue of idle connections recording the checkouts that wait for one to be returned.
+
+    Only a blocking get on an empty queue waits, the pool asks for that once the
+    overflow is used up. Checkouts served at once or by a new overflow connection
+    are not counted.
+    """
+
+    @override
+    def __init__(self, maxsize: int = 0, use_lifo: bool = False) -> None:
+        super().__init__(maxsize, use_lifo)
+        self.waiting = 0
+        self.waited_checkouts = 0
+        self.total_wait_seconds: float = 0
+        self.max_wait_seconds: float = 0
+
+    @override
+    def get(self, block: bool = True, timeout: float | None = None) -> ConnectionPoolEntry:
+        if not block or not self.empty():
+            return super().get(block, timeout)
+
+        self.waiting += 1
+        started_at = time.perf_counter()
+        try:
+            return super().get(block, timeout)
+        finally:
+            self.waiting -= 1
+            self._record_wait(time.perf_counter() - started_at)
+
+    def _record_wait(self, wait_seconds: float) -> None:
+        self.waited_checkouts += 1
+        self.total_wait_seconds += wait_seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that also counts requests waiting for a returned connection and the wait time."""
+
+    _queue_class: type[QueueCommon[ConnectionPoolEntry]] = _WaitRecordingQueue
+
+    def statistics(self) -> PoolStatistics:
+        idle_connections = cast("_WaitRecordingQueue", self._pool)
+        return PoolStatistics(
+            size=self.size(),
+            checked_out=self.checkedout(),
+            overflow=max(self.overflow(), 0),
+            waiting=idle_connections.waiting,
+            waited_checkouts=idle_connections.waited_checkouts,
+            total_wait_seconds=idle_connections.total_wait_seconds,
+            max_wait_seconds=idle_connections.max_wait_seconds,
+        )
+
+
+def collect_pool_statistics(engine: AsyncEngine) -> PoolStatistics | None:
+    """Return statistics of the engine pool, or None if the pool is not instrumented."""
+    pool = engine.pool
+    if not isinstance(pool, InstrumentedAsyncAdaptedQueuePool):
+        return None
+    return pool.statistics()
@@ -1,7 +1,19 @@
+import uuid
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any, override
+
 import sqlalchemy as sa
+from advanced_alchemy.exceptions import wrap_sqlalchemy_exception
 from litestar.plugins.sqlalchemy import repository as litestar_repository
+from sqlalchemy import orm
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql.selectable import TypedReturnsRows
+
+from apps.company_structure.infrastructure import models, slug_allocator, upserts
 
-from apps.company_structure.infrastructure import models
+_reltuples_column = sa.column("reltuples", sa.Float)
+_pg_class = sa.table("pg_class", sa.column("oid"), _reltuples_column)
 
 
 class RootDepartmentDoesNotExistError(Exception):
@@ -17,9 +29,60 @@ class GottenMoreThanOneRootDepartmentError(Exception):
         super().__init__("More than one root department fetched from the database.")
 
 
+def _select_root_department_id(department_id: uuid.UUID) -> sa.ScalarSelect[uuid.UUID]:
+    ancestors = (
+        sa.select(models.Department.id, models.Department.parent_id)
+        .where(models.Department.id == department_id)
+        .cte("ancestors", recursive=True)
+    )
+    is_ancestor = models.Department.id == ancestors.c.parent_id
+    ancestors = ancestors.union_all(
+        sa.select(models.Department.id, models.Department.parent_id).join(ancestors, is_ancestor)
+    )
+    is_root = ancestors.c.parent_id.is_(None)
+    return sa.select(ancestors.c.id).where(is_root).scalar_subquery()
+
+
+def _select_tree_department_ids(
+    root_id: sa.ScalarSelect[uuid.UUID],
+    max_depth: int | None,
+) -> sa.CTE:
+    tree = (
+        sa.select(models.Department.id)
+        .where(models.Department.id == root_id)
+        .cte("tree", recursive=True)
+    )
+    is_tree_child = models.Department.parent_id == tree.c.id
+    tree_children = sa.select(models.Department.id).join(tree, is_tree_child)
+    if max_depth is not None:
+        # The root path holds only the root, so a node path is one longer than its depth
+        tree_children = tree_children.where(
+            sa.func.cardinality(models.Department.path) <= max_depth + 1
+        )
+    return tree.union_all(tree_children)
+
+
+async def _execute_upsert(
+    gateway: litestar_repository.SQLAlchemyAsyncRepository[Any],
+    upsert_statement: TypedReturnsRows[str],
+) -> str:
+    with wrap_sqlalchemy_exception(
+        error_messages=gateway.error_messages,
+        wrap_exceptions=gateway.wrap_exceptions,
+    ):
+        query_result = await gateway.session.execute(upsert_statement)
+    return query_result.scalar_one()
+
+
 class DepartmentGateway(litestar_repository.SQLAlchemyAsyncSlugRepository[models.Department]):
     model_type = models.Department
 
+    @override
+    async def get_available_slug(self, value_to_slugify: str, **kwargs: Any) -> str:
+        return await slug_allocator.allocate_slug(
+            self.session, slug_allocator.DEPARTMENT_SLUG_SCOPE, value_to_slugify
+        )
+
     async def fetch_root_department(self) -> models.Department:
         query_result = await self.session.execute(
             sa.select(models.Department).where(models.Department.parent_id == None),  # noqa: E711  # reason: alchemy syntax
@@ -33,6 +96,174 @@ class DepartmentGateway(litestar_repository.SQLAlchemyAsyncSlugRepository[models
 
         return departments[0]
 
+    async def get_cache_version(self) -> int:
+        """Fetch the version bumped by every committed write to the department table."""
+        query_result = await self.session.execute(
+            sa.select(models.cache_version_table.c.version).where(
+                models.cache_version_table.c.name == models.DEPARTMENT_CACHE_VERSION_NAME
+            ),
+        )
+        return query_result.scalar_one_or_none() or 0
+
+    async def list_tree(
+        self,
+        department_id: uuid.UUID,
+        max_depth: int | None = None,
+    ) -> Sequence[models.Department]:
+        """Fetch departments of the tree that contains the given department.
+
+        The first recursive query climbs from the department up to its root, the second
+        one descends from that root at most `max_depth` levels, so only the rows
+        of a single tree are loaded.
+        """
+        tree = _select_tree_department_ids(_select_root_department_id(department_id), max_depth)
+        is_tree_member = models.Department.id == tree.c.id
+        query_result = await self.session.execute(
+            sa.select(models.Department).join(tree, is_tree_member),
+        )
+        return query_result.scalars().all()
+
+    async def list_subtree(self, department_id: uuid.UUID) -> Sequence[models.Department]:
+        """Fetch the department with all its descendants ordered by path."""
+        query_result = await self.session.execute(
+            sa.select(models.Department)
+            .where(models.Department.path.contains([department_id]))
+            .order_by(models.Department.path),
+        )
+        return query_result.scalars().all()
+
+    async def list_children_with_count(
+        self,
+        department_id: uuid.UUID,
+    ) -> Sequence[tuple[models.Department, int]]:
+        """Fetch direct children of the department along with their own children count."""
+        grandchild = orm.aliased(models.Department)
+        children_count = (
+            sa.select(sa.func.count())
+            .where(grandchild.parent_id == models.Department.id)
+            .scalar_subquery()
+        )
+        query_result = await self.session.execute(
+            sa.select(models.Department, children_count)
+            .where(models.Department.parent_id == department_id)
+            .order_by(models.Department.title),
+        )
+        return [(orm_department, count) for orm_department, count in query_result.tuples()]
+
+    async def list_ancestors(self, department_id: uuid.UUID) -> Sequence[models.Department]:
+        """Fetch the ancestors of the department ordered from the root down."""
+        descendant = orm.aliased(models.Department)
+        query_result = await self.session.execute(
+            sa.select(models.Department)
+            .join(descendant, models.Department.id == sa.any_(descendant.path))
+            .where(descendant.id == department_id, models.Department.id != department_id)
+            .order_by(sa.func.array_position(descendant.path, models.Department.id)),
+        )
+        return query_result.scalars().all()
+
+    async def get_depth(self, department_id: uuid.UUID) -> int | None:
+        query_result = await self.session.execute(
+            sa.select(sa.func.cardinality(models.Department.path) - 1).where(
+                models.Department.id == department_id
+            ),
+        )
+        return query_result.scalar_one_or_none()
+
+    async def upsert_returning_slug(self, orm_department: models.Department) -> str:
+        """Insert or update the department with one statement, rebasing its subtree."""
+        return await _execute_upsert(self, upserts.build_department_upsert(orm_department))
+
 
 class EmployeeGateway(litestar_repository.SQLAlchemyAsyncSlugRepository[models.Employee]):
     model_type = models.Employee
+
+    @override
+    async def get_available_slug(self, value_to_slugify: str, **kwargs: Any) -> str:
+        return await slug_allocator.allocate_slug(
+            self.session, slug_allocator.EMPLOYEE_SLUG_SCOPE, value_to_slugify
+        )
+
+    async def get_org_structure_version(self) -> tuple[int, int, datetime | None]:
+        """Fetch the department and employee versions with the time either table changed."""
+        versions_table = models.cache_version_table
+        department_version = sa.func.max(versions_table.c.version).filter(
+            versions_table.c.name == models.DEPARTMENT_CACHE_VERSION_NAME
+        )
+        employee_version = sa.func.max(versions_table.c.version).filter(
+            versions_table.c.name == models.EMPLOYEE_CACHE_VERSION_NAME
+        )
+        query_result = await self.session.execute(
+            sa.select(
+                sa.func.coalesce(department_version, 0),
+                sa.func.coalesce(employee_version, 0),
+                sa.func.max(versions_table.c.updated_at),
+            ),
+        )
+        return query_result.tuples().one()
+
+    async def get_headcount_cache_version(self) -> tuple[int, int]:
+        """Fetch the department and employee versions, headcounts depend on both tables."""
+        department_version, employee_version, _ = await self.get_org_structure_version()
+        return department_version, employee_version
+
+    async def list_headcounts(self) -> Sequence[tuple[uuid.UUID, int, int]]:
+        """Count direct and subtree employees of every department that has any.
+
+        Every employee is counted once for each department of its department path,
+        so the whole forest is rolled up by a single grouped query.
+        """
+        memberships = (
+            sa.select(
+                sa.func.unnest(models.Department.path).label("department_id"),
+                models.Employee.department_id.label("employee_department_id"),
+            )
+            .join(models.Department, models.Employee.department_id == models.Department.id)
+            .subquery("memberships")
+        )
+        is_direct = memberships.c.department_id == memberships.c.employee_department_id
+        query_result = await self.session.execute(
+            sa.select(
+                memberships.c.department_id,
+                sa.func.count().filter(is_direct),
+                sa.func.count(),
+            ).group_by(memberships.c.department_id),
+        )
+        return query_result.tuples().all()
+
+    async def estimate_count(self) -> int | None:
+        """Read the row count estimated by the planner, None if it was never estimated."""
+        query_result = await self.session.execute(
+            sa.select(_pg_class.c.reltuples).where(
+                _pg_class.c.oid == sa.cast(self.model_type.__tablename__, postgresql.REGCLASS)
+            ),
+        )
+        estimated_count = query_result.scalar_one()
+        return None if estimated_count < 0 else int(estimated_count)
+
+    async def list_by_name_keyset(
+        self,
+        key: tuple[str, uuid.UUID] | None,
+        limit: int,
+        *,
+        is_backward: bool = False,
+        load: Sequence[orm.interfaces.LoaderOption] = (),
+    ) -> Sequence[models.Employee]:
+        """Fetch employees ordered by name and id, starting after or before the key."""
+        sort_key = sa.tuple_(models.Employee.name, models.Employee.id)
+        query = sa.select(models.Employee).options(*load).limit(limit)
+        if is_backward:
+            descending_sort_key = (models.Employee.name.desc(), models.Employee.id.desc())
+            query = query.order_by(*descending_sort_key)
+        else:
+            query = query.order_by(models.Employee.name, models.Employee.id)
+        if key is not None and is_backward:
+            query = query.where(sort_key < sa.tuple_(*key))
+        elif key is not None:
+            query = query.where(sort_key > sa.tuple_(*key))
+
+        query_result = await self.session.execute(query)
+        return query_result.scalars().all()
+
+    async def upsert_returning_slug(self, orm_employee: models.Employee) -> str:
+        """Insert or update the employee with one statement."""
+        return await _execute_upsert(self, upserts.build_employee_upsert(orm_employee))
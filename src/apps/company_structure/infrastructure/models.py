@@ -2,9 +2,23 @@ from uuid import UUID
 
 import sqlalchemy as sa
 from litestar.plugins.sqlalchemy import base
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import Mapped, declarative_mixin, mapped_column, relationship
 
 _DEFAULT_VARCHAR_LENGTH = 255
+SLUG_LENGTH = 100
+_CACHE_VERSION_NAME_LENGTH = 63
+_SLUG_SCOPE_LENGTH = 63
+
+
+def _make_trigram_index(index_name: str, column_name: str) -> sa.Index:
+    """Index serving similarity operators and LIKE patterns over the column, needs pg_trgm."""
+    return sa.Index(
+        index_name,
+        column_name,
+        postgresql_using="gin",
+        postgresql_ops={column_name: "gin_trgm_ops"},
+    )
 
 
 class Base(base.UUIDAuditBase):
@@ -19,19 +33,32 @@ class SlugKey:
 
     __abstract__ = True
     slug: Mapped[str] = mapped_column(
-        sa.String(length=100), nullable=False, unique=True, sort_order=-9
+        sa.String(length=SLUG_LENGTH), nullable=False, unique=True, sort_order=-9
     )
 
 
 class Department(Base, SlugKey):
-    __table_args__ = (sa.Index("ix_department_parent_id", "parent_id"),)
+    __table_args__ = (
+        sa.Index("ix_department_parent_id", "parent_id"),
+        sa.Index("ix_department_path", "path", postgresql_using="gin"),
+        _make_trigram_index("ix_department_title_trgm", "title"),
+    )
 
     title: Mapped[str] = mapped_column(sa.String(_DEFAULT_VARCHAR_LENGTH))
     parent_id: Mapped[UUID | None] = mapped_column(sa.ForeignKey("department.id"), nullable=True)
+    # Materialized path: ids from the tree root down to the department itself.
+    path: Mapped[list[UUID]] = mapped_column(postgresql.ARRAY(sa.Uuid))
     head_id: Mapped[UUID | None] = mapped_column(sa.ForeignKey("employee.id"), nullable=True)
 
 
 class Employee(Base, SlugKey):
+    __table_args__ = (
+        sa.Index("ix_employee_name_id", "name", "id"),
+        sa.Index("ix_employee_department_id", "department_id"),
+        sa.Index("ix_employee_manager_id", "manager_id"),
+        _make_trigram_index("ix_employee_name_trgm", "name"),
+    )
+
     name: Mapped[str] = mapped_column(sa.String(_DEFAULT_VARCHAR_LENGTH))
     manager_id: Mapped[UUID | None] = mapped_column(sa.ForeignKey("employee.id"), nullable=True)
     department_id: Mapped[UUID] = mapped_column(sa.ForeignKey("department.id"))
@@ -40,4 +67,122 @@ class Employee(Base, SlugKey):
         "Employee",
         remote_side="Employee.id",
         foreign_keys=[manager_id],
+        # Managers are loaded eagerly by the repository, lazy loads do not work with asyncio
+        lazy="raise",
     )
+
+
+# Enables pg_trgm for the search indexes in `create_all` setups
+sa.event.listen(
+    Base.metadata,
+    "before_create",
+    sa.DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),  # type: ignore[no-untyped-call]  # reason: untyped in sqlalchemy
+)
+
+
+DEPARTMENT_CACHE_VERSION_NAME = "department"
+EMPLOYEE_CACHE_VERSION_NAME = "employee"
+
+# Monotonic per-table versions used by workers to check their cached data.
+# Versions are bumped by a statement level trigger, so any writer is accounted for.
+cache_version_table = sa.Table(
+    "cache_version",
+    Base.metadata,
+    sa.Column("name", sa.String(_CACHE_VERSION_NAME_LENGTH), primary_key=True),
+    sa.Column("version", sa.BigInteger, nullable=False, server_default="0"),
+    sa.Column(
+        "updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()
+    ),
+)
+
+_CREATE_BUMP_CACHE_VERSION_FUNCTION = sa.text(
+    """
+    CREATE OR REPLACE FUNCTION bump_cache_version() RETURNS trigger AS $$
+    BEGIN
+        INSERT INTO cache_version (name, version, updated_at)
+        VALUES (TG_TABLE_NAME, 1, statement_timestamp())
+        ON CONFLICT (name) DO UPDATE
+        SET version = cache_version.version + 1, updated_at = EXCLUDED.updated_at;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """
+)
+_CREATE_DEPARTMENT_BUMP_CACHE_VERSION_TRIGGER = sa.text(
+    """
+    CREATE OR REPLACE TRIGGER department_bump_cache_version
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON department
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_cache_version()
+    """
+)
+
+_CREATE_EMPLOYEE_BUMP_CACHE_VERSION_TRIGGER = sa.text(
+    """
+    CREATE OR REPLACE TRIGGER employee_bump_cache_version
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON employee
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_cache_version()
+    """
+)
+
+
+@sa.event.listens_for(Base.metadata, "after_create")
+def _create_cache_version_triggers(
+    target: sa.MetaData,  # noqa: ARG001  # reason: event listener signature
+    connection: sa.Connection,
+    **kwargs: object,  # noqa: ARG001  # reason: event listener signature
+) -> None:
+    """Create the version triggers along with tables for `create_all` setups."""
+    connection.execute(_CREATE_BUMP_CACHE_VERSION_FUNCTION)
+    connection.execute(_CREATE_DEPARTMENT_BUMP_CACHE_VERSION_TRIGGER)
+    connection.execute(_CREATE_EMPLOYEE_BUMP_CACHE_VERSION_TRIGGER)
+
+
+# Last suffix handed out per slug base, so a free slug is found without probing the table.
+# Suffix 0 stands for the bare base slug.
+slug_counter_table = sa.Table(
+    "slug_counter",
+    Base.metadata,
+    sa.Column("scope", sa.String(_SLUG_SCOPE_LENGTH), primary_key=True),
+    sa.Column("base", sa.String(SLUG_LENGTH), primary_key=True),
+    sa.Column("last_suffix", sa.BigInteger, nullable=False, server_default="0"),
+)
+
+# The scope is the table holding the slugs. The counter row lock serializes allocations
+# of the same base, the table is only checked for slugs created outside the counter.
+# Keep identical to the function created by migration 3d7a9c1e5b20, migrations do not
+# import application code, and a change here needs a new migration replacing it.
+_CREATE_ALLOCATE_SLUG_FUNCTION = sa.text(
+    """
+    CREATE OR REPLACE FUNCTION allocate_slug(slug_scope text, slug_base text) RETURNS text AS $$
+    DECLARE
+        suffix bigint;
+        candidate text;
+        is_taken boolean;
+    BEGIN
+        LOOP
+            INSERT INTO slug_counter AS counter (scope, base, last_suffix)
+            VALUES (slug_scope, slug_base, 0)
+            ON CONFLICT (scope, base) DO UPDATE SET last_suffix = counter.last_suffix + 1
+            RETURNING counter.last_suffix INTO suffix;
+
+            candidate := CASE WHEN suffix = 0 THEN slug_base ELSE slug_base || '-' || suffix END;
+            EXECUTE format('SELECT EXISTS (SELECT 1 FROM %I WHERE slug = $1)', slug_scope)
+            INTO is_taken USING candidate;
+            IF NOT is_taken THEN
+                RETURN candidate;
+            END IF;
+        END LOOP;
+    END;
+    $$ LANGUAGE plpgsql
+    """
+)
+
+
+@sa.event.listens_for(Base.metadata, "after_create")
+def _create_allocate_slug_function(
+    target: sa.MetaData,  # noqa: ARG001  # reason: event listener signature
+    connection: sa.Connection,
+    **kwargs: object,  # noqa: ARG001  # reason: event listener signature
+) -> None:
+    """Create the slug allocation function along with tables for `create_all` setups."""
+    connection.execute(_CREATE_ALLOCATE_SLUG_FUNCTION)
@@ -1,6 +1,21 @@
 from apps.company_structure.infrastructure.repositories import (
+    department_hierarchy_repository,
+    department_import_repository,
     department_repository,
+    employee_import_repository,
     employee_repository,
+    export_repository,
+    org_structure_version_repository,
+    search_repository,
 )
 
-__all__ = ["department_repository", "employee_repository"]
+__all__ = [
+    "department_hierarchy_repository",
+    "department_import_repository",
+    "department_repository",
+    "employee_import_repository",
+    "employee_repository",
+    "export_repository",
+    "org_structure_version_repository",
+    "search_repository",
+]
@@ -0,0 +1,144 @@
+import uuid
+from typing import override
+
+import sqlalchemy as sa
+from litestar.repository import filters
+
+from apps.company_structure.application import ports, schemas
+from apps.company_structure.domain import entities
+from apps.company_structure.domain import exceptions as domain_exceptions
+from apps.company_structure.infrastructure import caches, gateways, models
+from apps.company_structure.infrastructure.repositories import (
+    department_repository,
+    employee_repository,
+)
+
+
+def _convert_orm_child_to_node_schema(
+    orm_department: models.Department,
+    children_count: int,
+    headcount: entities.DepartmentHeadcount,
+) -> schemas.DepartmentNodeSchema:
+    return schemas.DepartmentNodeSchema.model_validate(
+        {
+            **orm_department.__dict__,
+            "children_count": children_count,
+            "depth": len(orm_department.path) - 1,
+            "headcount": headcount.direct,
+            "total_headcount": headcount.total,
+        }
+    )
+
+
+def _filter_department_members(
+    department_id: uuid.UUID,
+    membership: schemas.DepartmentMembership,
+) -> sa.ColumnElement[bool]:
+    """Match employees by department, the subtree is resolved by the path index."""
+    if membership is schemas.DepartmentMembership.direct:
+        return models.Employee.department_id == department_id
+    subtree_department_ids = sa.select(models.Department.id).where(
+        models.Department.path.contains([department_id])
+    )
+    if membership is schemas.DepartmentMembership.indirect:
+        subtree_department_ids = subtree_department_ids.where(models.Department.id != department_id)
+    return models.Employee.department_id.in_(subtree_department_ids)
+
+
+def _select_move_locked_ids(
+    department_id: uuid.UUID,
+    parent_id: uuid.UUID,
+) -> sa.Select[uuid.UUID]:
+    is_parent = models.Department.id == parent_id
+    parent_path = sa.select(models.Department.path).where(is_parent).scalar_subquery()
+    # The cast makes ANY compare with the elements of the path, not with subquery rows
+    parent_path_ids = sa.cast(parent_path, models.Department.path.type)
+    is_locked = sa.or_(
+        models.Department.id == department_id,
+        models.Department.id == sa.any_(parent_path_ids),
+    )
+    # Rows are locked in id order, so crossing moves wait for each other instead of deadlocking
+    locked_ids = sa.select(models.Department.id).where(is_locked)
+    return locked_ids.order_by(models.Department.id).with_for_update()
+
+
+class DepartmentHierarchyRepository(ports.DepartmentHierarchyFetchPort):
+    """Hierarchy queries answered by the materialized department path."""
+
+    def __init__(
+        self,
+        department_gateway: gateways.DepartmentGateway,
+        employee_gateway: gateways.EmployeeGateway,
+        headcount_cache: caches.DepartmentHeadcountCache,
+    ) -> None:
+        self._department_gateway = department_gateway
+        self._employee_gateway = employee_gateway
+        self._headcount_cache = headcount_cache
+
+    @override
+    async def fetch_subtree(self, department_id: uuid.UUID) -> list[schemas.DepartmentSchema]:
+        orm_departments = await self._department_gateway.list_subtree(department_id)
+        return [
+            department_repository.convert_orm_department_to_schema(orm_department)
+            for orm_department in orm_departments
+        ]
+
+    @override
+    async def fetch_children(self, department_id: uuid.UUID) -> list[schemas.DepartmentNodeSchema]:
+        orm_children = await self._department_gateway.list_children_with_count(department_id)
+        headcounts = await self._headcount_cache.get_or_load(
+            await self._employee_gateway.get_headcount_cache_version(),
+            self._employee_gateway.list_headcounts,
+        )
+        no_headcount = entities.DepartmentHeadcount(direct=0, total=0)
+        return [
+            _convert_orm_child_to_node_schema(
+                orm_department, children_count, headcounts.get(orm_department.id, no_headcount)
+            )
+            for orm_department, children_count in orm_children
+        ]
+
+    @override
+    async def fetch_ancestors(self, department_id: uuid.UUID) -> list[schemas.DepartmentSchema]:
+        orm_departments = await self._department_gateway.list_ancestors(department_id)
+        return [
+            department_repository.convert_orm_department_to_schema(orm_department)
+            for orm_department in orm_departments
+        ]
+
+    @override
+    async def fetch_depth(self, department_id: uuid.UUID) -> int:
+        depth = await self._department_gateway.get_depth(department_id)
+        if depth is None:
+            raise domain_exceptions.DepartmentTreeNodeNotFoundError
+        return depth
+
+    @override
+    async def lock_for_move(self, department_id: uuid.UUID, parent_id: uuid.UUID) -> None:
+        await self._department_gateway.session.execute(
+            _select_move_locked_ids(department_id, parent_id),
+        )
+
+    @override
+    async def fetch_employees(
+        self,
+        department_id: uuid.UUID,
+        membership: schemas.DepartmentMembership,
+        limit_offset: filters.LimitOffset,
+    ) -> tuple[list[entities.EmployeeEntity], int]:
+        orm_employees, total = await self._employee_gateway.list_and_count(
+            limit_offset,
+            _filter_department_members(department_id, membership),
+            order_by=[(models.Employee.name, False), (models.Employee.id, False)],
+            load=employee_repository.load_manager_chain(entities.MANAGER_CHAIN_DEPTH),
+        )
+        # An empty page is the only case where an unknown department is possible
+        if not orm_employees:
+            await self.fetch_depth(department_id)
+        employees = [
+            employee_repository.convert_orm_employee_to_entity(
+                orm_employee, entities.MANAGER_CHAIN_DEPTH
+            )
+            for orm_employee in orm_employees
+        ]
+        return employees, total
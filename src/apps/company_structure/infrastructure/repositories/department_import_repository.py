@@ -0,0 +1,105 @@
+import functools
+import uuid
+from collections.abc import Sequence
+from typing import Any, override
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from apps.company_structure.application import ports, schemas
+from apps.company_structure.domain import exceptions as domain_exceptions
+from apps.company_structure.infrastructure import (
+    caches,
+    models,
+    response_cache,
+    slug_allocator,
+    transactions,
+)
+
+
+def _collect_existing_parent_ids(
+    departments_data: Sequence[schemas.DepartmentSchema],
+) -> set[uuid.UUID]:
+    new_ids = {department_data.id for department_data in departments_data}
+    return {
+        department_data.parent_id
+        for department_data in departments_data
+        if department_data.parent_id is not None and department_data.parent_id not in new_ids
+    }
+
+
+def _build_department_rows(
+    departments_data: Sequence[schemas.DepartmentSchema],
+    slugs: Sequence[str],
+    paths: dict[uuid.UUID, list[uuid.UUID]],
+) -> list[dict[str, Any]]:
+    """Compute materialized paths in memory, extending `paths` with the new departments."""
+    rows = []
+    for department_data, slug in zip(departments_data, slugs, strict=True):
+        parent_path = [] if department_data.parent_id is None else paths[department_data.parent_id]
+        paths[department_data.id] = [*parent_path, department_data.id]
+        rows.append(
+            {
+                "id": department_data.id,
+                "slug": slug,
+                "title": department_data.title,
+                "parent_id": department_data.parent_id,
+                "path": paths[department_data.id],
+            }
+        )
+    return rows
+
+
+class DepartmentImportRepository(ports.GenericBulkSavePort[schemas.DepartmentSchema]):
+    """Bulk department writes done with a fixed number of statements."""
+
+    def __init__(
+        self,
+        db_session: AsyncSession,
+        unit_of_work: transactions.SQLAlchemyUnitOfWork,
+        forest_cache: caches.DepartmentForestCache,
+        response_cache_tags: response_cache.ResponseCacheTags,
+    ) -> None:
+        self._db_session = db_session
+        self._unit_of_work = unit_of_work
+        self._forest_cache = forest_cache
+        self._response_cache_tags = response_cache_tags
+
+    @override
+    async def save_all(self, departments_data: Sequence[schemas.DepartmentSchema]) -> None:
+        """Insert new departments, parents must come before their children."""
+        if not departments_data:
+            return
+
+        paths = await self._fetch_parent_paths(departments_data)
+        slugs = await slug_allocator.allocate_slugs(
+            self._db_session,
+            slug_allocator.DEPARTMENT_SLUG_SCOPE,
+            [department_data.title for department_data in departments_data],
+        )
+        await self._db_session.execute(
+            sa.insert(models.Department),
+            _build_department_rows(departments_data, slugs, paths),
+        )
+        self._unit_of_work.call_after_commit(self._forest_cache.invalidate)
+        self._unit_of_work.call_after_commit(
+            functools.partial(
+                self._response_cache_tags.invalidate, response_cache.ResponseCacheTag.departments
+            ),
+        )
+
+    async def _fetch_parent_paths(
+        self,
+        departments_data: Sequence[schemas.DepartmentSchema],
+    ) -> dict[uuid.UUID, list[uuid.UUID]]:
+        """Fetch paths of the existing parents the new departments are attached to."""
+        parent_ids = _collect_existing_parent_ids(departments_data)
+        query_result = await self._db_session.execute(
+            sa.select(models.Department.id, models.Department.path).where(
+                models.Department.id.in_(parent_ids)
+            ),
+        )
+        paths = {department_id: list(path) for department_id, path in query_result.tuples()}
+        if len(paths) != len(parent_ids):
+            raise domain_exceptions.ParentDepartmentsNotFoundError(parent_ids - paths.keys())
+        return paths
@@ -1,15 +1,21 @@
+import functools
 import uuid
+from collections.abc import Iterator, Mapping, Sequence
 from typing import override
 
-from sqlalchemy.ext.asyncio import AsyncSession
-
 from apps.company_structure.application import ports, schemas
-from apps.company_structure.domain import aggregates
+from apps.company_structure.domain import aggregates, compact_forest, entities
 from apps.company_structure.domain import exceptions as domain_exceptions
-from apps.company_structure.infrastructure import gateways, models
+from apps.company_structure.infrastructure import (
+    caches,
+    gateways,
+    models,
+    response_cache,
+    transactions,
+)
 
 
-def _convert_orm_department_to_schema(
+def convert_orm_department_to_schema(
     orm_department: models.Department,
 ) -> schemas.DepartmentSchema:
     return schemas.DepartmentSchema.model_validate(orm_department.__dict__)
@@ -22,43 +28,43 @@ class DepartmentRepository(  # noqa: WPS215  # reason: explicit define implement
 ):
     def __init__(
         self,
-        db_session: AsyncSession,
+        unit_of_work: transactions.SQLAlchemyUnitOfWork,
         department_gateway: gateways.DepartmentGateway,
+        forest_cache: caches.DepartmentForestCache,
+        response_cache_tags: response_cache.ResponseCacheTags,
     ) -> None:
-        self._db_session = db_session
+        self._unit_of_work = unit_of_work
         self._department_gateway = department_gateway
+        self._forest_cache = forest_cache
+        self._response_cache_tags = response_cache_tags
 
     @override
     async def fetch_one(self, department_id: uuid.UUID) -> schemas.DepartmentSchema:
         orm_department = await self._department_gateway.get(department_id)
-        return _convert_orm_department_to_schema(orm_department)
+        return convert_orm_department_to_schema(orm_department)
 
     @override
     async def save(self, department_data: schemas.DepartmentSchema) -> None:
-        orm_object = await self._convert_to_orm(department_data)
-        await self._department_gateway.upsert(orm_object)
-        await self._db_session.commit()
+        await self._department_gateway.upsert_returning_slug(
+            models.Department(
+                id=department_data.id,
+                title=department_data.title,
+                parent_id=department_data.parent_id,
+            ),
+        )
+        self._invalidate_caches_after_commit()
 
     @override
     async def delete(self, department_id: uuid.UUID) -> None:
         await self._department_gateway.delete(department_id)
-        await self._db_session.commit()
-
-    async def _convert_to_orm(
-        self,
-        department_data: schemas.DepartmentSchema,
-    ) -> models.Department:
-        existent_orm_object = await self._department_gateway.get_one_or_none(id=department_data.id)
-        if existent_orm_object is None:
-            slug = await self._department_gateway.get_available_slug(department_data.title)
-        else:
-            slug = existent_orm_object.slug
-
-        return models.Department(
-            id=department_data.id,
-            slug=slug,
-            title=department_data.title,
-            parent_id=department_data.parent_id,
+        self._invalidate_caches_after_commit()
+
+    def _invalidate_caches_after_commit(self) -> None:
+        self._unit_of_work.call_after_commit(self._forest_cache.invalidate)
+        self._unit_of_work.call_after_commit(
+            functools.partial(
+                self._response_cache_tags.invalidate, response_cache.ResponseCacheTag.departments
+            ),
         )
 
 
@@ -70,30 +76,19 @@ class GottenWrongDepartmentSubclassError(TypeError):
         )
 
 
-def _convert_tree_to_orm_departments(
+def _iter_tree_orm_departments(
     department_tree: aggregates.DepartmentTreeAggregate,
-) -> list[models.Department]:
-    def _flatten_department_node(  # noqa: WPS430  # allowed nested function
-        current_node: aggregates.DepartmentTreeNode, parent_id: uuid.UUID | None
-    ) -> list[models.Department]:
-        """Recursively processes department nodes depth-first while tracking parents."""
-        current_department = models.Department(
-            id=current_node.id, title=current_node.title, parent_id=parent_id
+) -> Iterator[models.Department]:
+    for step in aggregates.walk_department_tree(department_tree.root):
+        yield models.Department(
+            id=step.node.id,
+            title=step.node.title,
+            parent_id=step.parent_id,
         )
 
-        flattened_departments = [current_department]
-        for child_node in current_node.children:
-            flattened_departments.extend(
-                _flatten_department_node(child_node, parent_id=current_node.id)
-            )
-
-        return flattened_departments
-
-    return _flatten_department_node(department_tree.root, parent_id=None)
-
 
 def _build_department_trees(
-    orm_departments: list[models.Department],
+    orm_departments: Sequence[models.Department],
 ) -> list[aggregates.DepartmentTreeAggregate]:
     node_dict = {}
     for orm_department in orm_departments:
@@ -111,21 +106,80 @@ def _build_department_trees(
     return [aggregates.DepartmentTreeAggregate(root=root_node) for root_node in root_nodes]
 
 
+def _convert_orm_department_to_record(
+    orm_department: models.Department,
+) -> compact_forest.DepartmentRecord:
+    return compact_forest.DepartmentRecord(
+        id=orm_department.id,
+        title=orm_department.title,
+        parent_id=orm_department.parent_id,
+    )
+
+
 class DepartmentTreeRepository(  # noqa: WPS215  # reason: explicit define implemented interfaces
     ports.GenericFetchPort[uuid.UUID, aggregates.DepartmentTreeAggregate],
+    ports.DepartmentTreeFetchPort,
 ):
-    def __init__(self, department_gateway: gateways.DepartmentGateway) -> None:
+    def __init__(
+        self,
+        department_gateway: gateways.DepartmentGateway,
+        employee_gateway: gateways.EmployeeGateway,
+        forest_cache: caches.DepartmentForestCache,
+        headcount_cache: caches.DepartmentHeadcountCache,
+    ) -> None:
         self._department_gateway = department_gateway
+        self._employee_gateway = employee_gateway
+        self._forest_cache = forest_cache
+        self._headcount_cache = headcount_cache
 
     @override
     async def fetch_one(self, department_id: uuid.UUID) -> aggregates.DepartmentTreeAggregate:
-        tree_list = await self.fetch_all()
-        for tree in tree_list:
-            if department_id in tree:
-                return tree
-        raise domain_exceptions.DepartmentTreeNodeNotFoundError
+        return await self.fetch_tree(department_id, None)
+
+    @override
+    async def fetch_tree(
+        self,
+        department_id: uuid.UUID,
+        max_depth: int | None,
+    ) -> aggregates.DepartmentTreeAggregate:
+        tree = await self._fetch_tree(department_id, max_depth)
+        aggregates.apply_department_headcounts(tree, await self._fetch_headcounts())
+        return tree
 
     @override
     async def fetch_all(self) -> list[aggregates.DepartmentTreeAggregate]:
+        version = await self._department_gateway.get_cache_version()
+        snapshot = await self._forest_cache.get_or_load(version, self._load_records)
+        headcounts = await self._fetch_headcounts()
+        trees = [snapshot.forest.to_tree(root_id) for root_id in snapshot.forest.root_ids]
+        for tree in trees:
+            aggregates.apply_department_headcounts(tree, headcounts)
+        return trees
+
+    async def _fetch_tree(
+        self,
+        department_id: uuid.UUID,
+        max_depth: int | None,
+    ) -> aggregates.DepartmentTreeAggregate:
+        version = await self._department_gateway.get_cache_version()
+        snapshot = self._forest_cache.get(version)
+        if snapshot is None:
+            orm_departments = await self._department_gateway.list_tree(department_id, max_depth)
+            tree_list = _build_department_trees(orm_departments)
+            if not tree_list:
+                raise domain_exceptions.DepartmentTreeNodeNotFoundError
+            return tree_list[0]
+
+        return snapshot.forest.to_tree(department_id, max_depth)
+
+    async def _fetch_headcounts(self) -> Mapping[uuid.UUID, entities.DepartmentHeadcount]:
+        version = await self._employee_gateway.get_headcount_cache_version()
+        return await self._headcount_cache.get_or_load(
+            version, self._employee_gateway.list_headcounts
+        )
+
+    async def _load_records(self) -> list[compact_forest.DepartmentRecord]:
         orm_departments = await self._department_gateway.list()
-        return _build_department_trees(orm_departments)
+        return [
+            _convert_orm_department_to_record(orm_department) for orm_department in orm_departments
+        ]
@@ -0,0 +1,115 @@
+import functools
+import uuid
+from collections.abc import Collection, Iterable, Iterator, Sequence
+from datetime import UTC, datetime
+from typing import Any, cast, override
+
+import psycopg
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from apps.company_structure.application import ports, schemas
+from apps.company_structure.infrastructure import (
+    models,
+    response_cache,
+    slug_allocator,
+    transactions,
+)
+
+_COPY_EMPLOYEES_SQL = (
+    "COPY employee (id, slug, name, department_id, manager_id, created_at, updated_at) FROM STDIN"
+)
+
+
+def _iter_employee_copy_rows(
+    employees_data: Sequence[schemas.EmployeeSchema],
+    slugs: Sequence[str],
+) -> Iterator[list[Any]]:
+    # COPY skips ORM defaults, so audit timestamps are filled in here
+    created_at = datetime.now(tz=UTC)
+    for employee_data, slug in zip(employees_data, slugs, strict=True):
+        yield [
+            employee_data.id,
+            slug,
+            employee_data.name,
+            employee_data.department_id,
+            employee_data.manager_id,
+            created_at,
+            created_at,
+        ]
+
+
+class EmployeeImportRepository(  # noqa: WPS215  # reason: explicit define implemented interfaces
+    ports.EmployeeImportLookupPort,
+    ports.GenericBulkSavePort[schemas.EmployeeSchema],
+):
+    """Bulk employee writes done with a fixed number of statements."""
+
+    def __init__(
+        self,
+        db_session: AsyncSession,
+        unit_of_work: transactions.SQLAlchemyUnitOfWork,
+        response_cache_tags: response_cache.ResponseCacheTags,
+    ) -> None:
+        self._db_session = db_session
+        self._unit_of_work = unit_of_work
+        self._response_cache_tags = response_cache_tags
+
+    @override
+    async def fetch_department_ids_by_slug(self, slugs: Collection[str]) -> dict[str, uuid.UUID]:
+        query_result = await self._db_session.execute(
+            sa.select(models.Department.slug, models.Department.id).where(
+                models.Department.slug.in_(slugs)
+            ),
+        )
+        return dict(query_result.tuples().all())
+
+    @override
+    async def fetch_existing_department_ids(
+        self,
+        department_ids: Collection[uuid.UUID],
+    ) -> set[uuid.UUID]:
+        query_result = await self._db_session.execute(
+            sa.select(models.Department.id).where(models.Department.id.in_(department_ids)),
+        )
+        return set(query_result.scalars())
+
+    @override
+    async def fetch_existing_employee_ids(
+        self,
+        employee_ids: Collection[uuid.UUID],
+    ) -> set[uuid.UUID]:
+        query_result = await self._db_session.execute(
+            sa.select(models.Employee.id).where(models.Employee.id.in_(employee_ids)),
+        )
+        return set(query_result.scalars())
+
+    @override
+    async def save_all(self, employees_data: Sequence[schemas.EmployeeSchema]) -> None:
+        """Load new employees with COPY, managers must come before their subordinates."""
+        if not employees_data:
+            return
+
+        slugs = await slug_allocator.allocate_slugs(
+            self._db_session,
+            slug_allocator.EMPLOYEE_SLUG_SCOPE,
+            [employee_data.name for employee_data in employees_data],
+        )
+        await self._copy_rows(_iter_employee_copy_rows(employees_data, slugs))
+        self._unit_of_work.call_after_commit(
+            functools.partial(
+                self._response_cache_tags.invalidate, response_cache.ResponseCacheTag.employees
+            ),
+        )
+
+    async def _copy_rows(self, rows: Iterable[Sequence[Any]]) -> None:
+        psycopg_connection = await self._get_psycopg_connection()
+        async with psycopg_connection.cursor() as cursor, cursor.copy(_COPY_EMPLOYEES_SQL) as copy:
+            for row in rows:
+                await copy.write_row(row)  # noqa: WPS476  # reason: rows are streamed to COPY
+
+    async def _get_psycopg_connection(self) -> psycopg.AsyncConnection[Any]:
+        # Use the session connection, so COPY joins the transaction of the request
+        connection = await self._db_session.connection()
+        raw_connection = await connection.get_raw_connection()
+        return cast("psycopg.AsyncConnection[Any]", raw_connection.driver_connection)
@@ -1,11 +1,23 @@
+import functools
+import uuid
 from typing import override
 
 from litestar.repository import filters
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import orm
 
-from apps.company_structure.application import ports
+from apps.company_structure.application import pagination, ports
 from apps.company_structure.domain import entities
-from apps.company_structure.infrastructure import gateways, models
+from apps.company_structure.infrastructure import (
+    caches,
+    gateways,
+    models,
+    response_cache,
+    transactions,
+)
+
+# Employees are listed by name, the id breaks ties between namesakes
+_EMPLOYEE_SORT_KEY_LENGTH = 2
+_EMPLOYEE_ROW_COUNT_KEY = "employee"
 
 
 class EmployeeRepository(
@@ -15,61 +27,138 @@ class EmployeeRepository(
     def __init__(
         self,
         employee_gateway: gateways.EmployeeGateway,
-        db_session: AsyncSession,
+        row_count_cache: caches.RowCountCache,
+        unit_of_work: transactions.SQLAlchemyUnitOfWork,
+        response_cache_tags: response_cache.ResponseCacheTags,
     ) -> None:
         self._employee_gateway = employee_gateway
-        self._db_session = db_session
+        self._row_count_cache = row_count_cache
+        self._unit_of_work = unit_of_work
+        self._response_cache_tags = response_cache_tags
 
     @override
     async def fetch_one(self, slug: str) -> entities.EmployeeEntity:
-        orm_employee = await self._employee_gateway.get_one(slug=slug)
-        return _convert_orm_employee_to_entity(orm_employee)
+        orm_employee = await self._employee_gateway.get_one(
+            slug=slug, load=load_manager_chain(entities.MANAGER_CHAIN_DEPTH)
+        )
+        return convert_orm_employee_to_entity(orm_employee, entities.MANAGER_CHAIN_DEPTH)
 
     @override
     async def fetch_all(self) -> list[entities.EmployeeEntity]:
-        orm_objects = await self._employee_gateway.list()
-        return [_convert_orm_employee_to_entity(orm_object) for orm_object in orm_objects]
+        orm_objects = await self._employee_gateway.list(
+            load=load_manager_chain(entities.MANAGER_CHAIN_DEPTH)
+        )
+        return [
+            convert_orm_employee_to_entity(orm_object, entities.MANAGER_CHAIN_DEPTH)
+            for orm_object in orm_objects
+        ]
 
     @override
     async def fetch_page(
         self,
         limit_offset: filters.LimitOffset,
-    ) -> tuple[list[entities.EmployeeEntity], int]:
-        orm_objects, total = await self._employee_gateway.list_and_count(limit_offset)
-        return [_convert_orm_employee_to_entity(orm_object) for orm_object in orm_objects], total
+        count_strategy: pagination.CountStrategy = pagination.CountStrategy.exact,
+    ) -> tuple[list[entities.EmployeeEntity], int | None]:
+        load = load_manager_chain(entities.MANAGER_CHAIN_DEPTH)
+        total: int | None
+        if count_strategy is pagination.CountStrategy.exact:
+            orm_objects, total = await self._employee_gateway.list_and_count(
+                limit_offset, load=load
+            )
+        else:
+            orm_objects = await self._employee_gateway.list(limit_offset, load=load)
+            total = await self._count_without_exact_query(count_strategy)
+        employees = [
+            convert_orm_employee_to_entity(orm_object, entities.MANAGER_CHAIN_DEPTH)
+            for orm_object in orm_objects
+        ]
+        return employees, total
+
+    @override
+    async def fetch_cursor_page(
+        self,
+        cursor: str | None,
+        limit: int,
+    ) -> pagination.CursorPage[entities.EmployeeEntity]:
+        keyset_cursor = None if cursor is None else pagination.KeysetCursor.decode(cursor)
+        orm_objects = await self._employee_gateway.list_by_name_keyset(
+            None if keyset_cursor is None else _parse_employee_sort_key(keyset_cursor.key),
+            limit + 1,
+            is_backward=keyset_cursor is not None and keyset_cursor.is_backward,
+            load=load_manager_chain(entities.MANAGER_CHAIN_DEPTH),
+        )
+        return pagination.build_cursor_page(
+            [
+                convert_orm_employee_to_entity(orm_object, entities.MANAGER_CHAIN_DEPTH)
+                for orm_object in orm_objects
+            ],
+            limit,
+            keyset_cursor,
+            get_key=lambda employee: (employee.name, str(employee.id)),
+        )
 
     @override
     async def save(self, employee: entities.EmployeeEntity) -> None:
-        await self._employee_gateway.upsert(await self._convert_entity_to_orm_employee(employee))
-        await self._db_session.commit()
+        await self._employee_gateway.upsert_returning_slug(
+            models.Employee(
+                id=employee.id,
+                name=employee.name,
+                manager_id=employee.manager.id if employee.manager else None,
+                department_id=employee.department_id,
+            ),
+        )
+        self._unit_of_work.call_after_commit(
+            functools.partial(
+                self._response_cache_tags.invalidate, response_cache.ResponseCacheTag.employees
+            ),
+        )
 
-    async def _convert_entity_to_orm_employee(
+    async def _count_without_exact_query(
         self,
-        entity: entities.EmployeeEntity,
-    ) -> models.Employee:
-        existent_orm_object = await self._employee_gateway.get_one_or_none(id=entity.id)
-        if existent_orm_object is None:
-            slug = await self._employee_gateway.get_available_slug(entity.name)
-        else:
-            slug = existent_orm_object.slug
-
-        return models.Employee(
-            id=entity.id,
-            slug=slug,
-            name=entity.name,
-            manager=entity.manager,
-            department_id=entity.department_id,
+        count_strategy: pagination.CountStrategy,
+    ) -> int | None:
+        if count_strategy is pagination.CountStrategy.none:
+            return None
+        if count_strategy is pagination.CountStrategy.estimated:
+            estimated_count = await self._employee_gateway.estimate_count()
+            if estimated_count is not None:
+                return estimated_count
+        return await self._row_count_cache.get_or_count(
+            _EMPLOYEE_ROW_COUNT_KEY, self._employee_gateway.count
         )
 
 
-def _convert_orm_employee_to_entity(
+def _parse_employee_sort_key(key: tuple[str, ...]) -> tuple[str, uuid.UUID]:
+    if len(key) != _EMPLOYEE_SORT_KEY_LENGTH:
+        raise pagination.InvalidCursorError
+    name, employee_id = key
+    try:
+        return name, uuid.UUID(employee_id)
+    except ValueError:
+        raise pagination.InvalidCursorError from None
+
+
+def load_manager_chain(depth: int) -> list[orm.interfaces.LoaderOption]:
+    """Load managers `depth` levels up in bulk, one query per level for all employees."""
+    if depth <= 0:
+        return []
+    loader = orm.selectinload(models.Employee.manager)
+    for _ in range(depth - 1):
+        loader = loader.selectinload(models.Employee.manager)
+    return [loader]
+
+
+def convert_orm_employee_to_entity(
     orm_employee: models.Employee,
+    manager_depth: int,
 ) -> entities.EmployeeEntity:
+    """Convert the employee with managers up to the depth they were loaded to."""
+    manager = None
+    if manager_depth > 0 and orm_employee.manager is not None:
+        manager = convert_orm_employee_to_entity(orm_employee.manager, manager_depth - 1)
     return entities.EmployeeEntity(
         id=orm_employee.id,
         name=orm_employee.name,
-        manager=(
-            _convert_orm_employee_to_entity(orm_employee.manager) if orm_employee.manager else None
-        ),
+        manager=manager,
         department_id=orm_employee.department_id,
     )
@@ -0,0 +1,60 @@
+from collections.abc import AsyncIterator
+from typing import Any, override
+
+import sqlalchemy as sa
+
+from apps.company_structure.application import export_schemas, ports
+from apps.company_structure.infrastructure import models, transactions
+
+_EXPORT_BATCH_SIZE = 1000
+
+
+class ExportRepository(ports.ExportRowsPort):
+    """Export rows read through a server side cursor, a batch at a time.
+
+    Batches are read while the response is sent, after the request session is closed,
+    so the batch iterator opens a session of its own and closes it when it is finished,
+    exhausted or abandoned by a disconnected client.
+    """
+
+    def __init__(self, session_maker: transactions.DetachedSessionMaker) -> None:
+        self._session_maker = session_maker
+
+    @override
+    async def stream_departments(self) -> export_schemas.ExportRows:
+        return self._stream(
+            sa.select(
+                models.Department.id,
+                models.Department.slug,
+                models.Department.title,
+                models.Department.parent_id,
+            ).order_by(models.Department.path),
+        )
+
+    @override
+    async def stream_employees(self) -> export_schemas.ExportRows:
+        return self._stream(
+            sa.select(
+                models.Employee.id,
+                models.Employee.slug,
+                models.Employee.name,
+                models.Employee.department_id,
+                models.Employee.manager_id,
+            ).order_by(models.Employee.name, models.Employee.id),
+        )
+
+    def _stream(self, query: sa.Select[*tuple[Any, ...]]) -> export_schemas.ExportRows:
+        return export_schemas.ExportRows(
+            columns=list(query.selected_columns.keys()),
+            batches=self._iter_batches(query),
+        )
+
+    async def _iter_batches(
+        self, query: sa.Select[*tuple[Any, ...]]
+    ) -> AsyncIterator[export_schemas.ExportBatch]:
+        async with self._session_maker.make_session() as db_session:
+            query_result = await db_session.stream(
+                query.execution_options(yield_per=_EXPORT_BATCH_SIZE),
+            )
+            async for batch in query_result.partitions():
+                yield batch
@@ -0,0 +1,25 @@
+from typing import override
+
+from apps.company_structure.application import ports
+from apps.company_structure.domain import entities
+from apps.company_structure.infrastructure import gateways
+
+
+class OrgStructureVersionRepository(ports.OrgStructureVersionPort):
+    """Versions kept by the cache version triggers, read without touching the trees."""
+
+    def __init__(self, employee_gateway: gateways.EmployeeGateway) -> None:
+        self._employee_gateway = employee_gateway
+
+    @override
+    async def fetch_version(self) -> entities.OrgStructureVersion:
+        (
+            department_version,
+            employee_version,
+            modified_at,
+        ) = await self._employee_gateway.get_org_structure_version()
+        return entities.OrgStructureVersion(
+            department_version=department_version,
+            employee_version=employee_version,
+            modified_at=modified_at,
+        )
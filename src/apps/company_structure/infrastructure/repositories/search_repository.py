@@ -0,0 +1,29 @@
+from typing import override
+
+from litestar.repository import filters
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from apps.company_structure.application import ports, schemas
+from apps.company_structure.infrastructure import search_queries
+
+
+class SearchRepository(ports.SearchPort):
+    """Typeahead search over department titles and employee names."""
+
+    def __init__(self, db_session: AsyncSession) -> None:
+        self._db_session = db_session
+
+    @override
+    async def search(
+        self,
+        query: str,
+        limit_offset: filters.LimitOffset,
+        kind: schemas.SearchResultKind | None = None,
+    ) -> list[schemas.SearchResultSchema]:
+        query_result = await self._db_session.execute(
+            search_queries.build_search_query(query, limit_offset, kind),
+        )
+        return [
+            schemas.SearchResultSchema.model_validate(search_row, from_attributes=True)
+            for search_row in query_result
+        ]
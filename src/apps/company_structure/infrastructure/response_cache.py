@@ -0,0 +1,95 @@
+import asyncio
+import time
+import uuid
+from collections.abc import Iterable
+from datetime import timedelta
+from enum import StrEnum
+from typing import override
+
+from litestar.stores.base import Store
+from litestar.stores.memory import MemoryStore
+
+from apps.company_structure.infrastructure import configs
+
+_TAG_VERSION_KEY_PREFIX = "tag:"
+_REDIS_STORE_NAMESPACE = "response_cache"
+
+
+class ResponseCacheTag(StrEnum):
+    """Aggregate a cached response is built from, written ones invalidate their responses."""
+
+    departments = "departments"
+    employees = "employees"
+
+
+class SweepingMemoryStore(MemoryStore):
+    """Memory store that drops expired entries once in a while.
+
+    The plain memory store drops an entry only when it is read after expiring,
+    so entries orphaned by tag invalidation or unique query strings would stay forever.
+    """
+
+    def __init__(self, sweep_interval_seconds: float) -> None:
+        super().__init__()
+        self._sweep_interval_seconds = sweep_interval_seconds
+        self._swept_at = time.monotonic()
+
+    @override
+    async def set(
+        self,
+        key: str,
+        value: str | bytes,  # noqa: WPS110  # reason: named like the overridden argument
+        expires_in: int | timedelta | None = None,
+    ) -> None:
+        await super().set(key, value, expires_in)
+        if time.monotonic() - self._swept_at >= self._sweep_interval_seconds:
+            self._swept_at = time.monotonic()
+            await self.delete_expired()
+
+
+class ResponseCacheTags:
+    """Versions of the cache tags, kept in the response cache store next to the responses.
+
+    Cache keys contain the versions of their tags, so invalidating a tag only replaces
+    its version and the writing worker stops reading the stale responses at once.
+    The keys also contain the database versions, which other workers see as well.
+    """
+
+    def __init__(self, store: Store) -> None:
+        self._store = store
+
+    async def get_versions(self, tags: Iterable[ResponseCacheTag]) -> str:
+        tag_versions = await asyncio.gather(*(self._get_version(tag) for tag in tags))
+        return ".".join(tag_version.decode() for tag_version in tag_versions)
+
+    async def invalidate(self, *tags: ResponseCacheTag) -> None:
+        await asyncio.gather(*(self._set_new_version(tag) for tag in tags))
+
+    async def _get_version(self, tag: ResponseCacheTag) -> bytes:
+        tag_version = await self._store.get(f"{_TAG_VERSION_KEY_PREFIX}{tag}")
+        if tag_version is None:
+            return await self._set_new_version(tag)
+        return tag_version
+
+    async def _set_new_version(self, tag: ResponseCacheTag) -> bytes:
+        # Random versions can not go back to an old one, unlike a counter lost by the store
+        tag_version = uuid.uuid4().hex.encode()
+        await self._store.set(f"{_TAG_VERSION_KEY_PREFIX}{tag}", tag_version)
+        return tag_version
+
+
+def make_response_cache_store(app_config: configs.AppConfig) -> Store:
+    """Keep responses in process memory unless a Redis URL is configured.
+
+    The memory store is private to a worker, so with several workers each one caches
+    the responses again, keys carry the database versions and none of them is stale.
+    """
+    if app_config.response_cache_redis_url is None:
+        return SweepingMemoryStore(app_config.response_cache_expiration_seconds)
+
+    from litestar.stores.redis import RedisStore  # noqa: PLC0415, WPS433  # reason: redis is an optional dependency
+
+    return RedisStore.with_client(
+        url=app_config.response_cache_redis_url,
+        namespace=_REDIS_STORE_NAMESPACE,
+    )
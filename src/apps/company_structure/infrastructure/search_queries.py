@@ -0,0 +1,63 @@
+import sqlalchemy as sa
+from litestar.repository import filters
+from sqlalchemy import orm
+
+from apps.company_structure.application import schemas
+from apps.company_structure.infrastructure import models
+
+_LIKE_ESCAPE_CHARACTER = "\\"
+
+
+def _escape_like_pattern(query: str) -> str:
+    for special_character in (_LIKE_ESCAPE_CHARACTER, "%", "_"):
+        query = query.replace(special_character, _LIKE_ESCAPE_CHARACTER + special_character)
+    return query
+
+
+def _get_searched_label(kind: schemas.SearchResultKind) -> orm.InstrumentedAttribute[str]:
+    if kind is schemas.SearchResultKind.department:
+        return models.Department.title
+    return models.Employee.name
+
+
+def _select_matches(kind: schemas.SearchResultKind, query: str) -> sa.Select[tuple[str, ...]]:
+    """Select rows whose label starts with the query or contains a word similar to it.
+
+    Both conditions are served by the trigram index on the label.
+    """
+    label = _get_searched_label(kind)
+    is_prefix_match = label.ilike(f"{_escape_like_pattern(query)}%", escape=_LIKE_ESCAPE_CHARACTER)
+    is_similar = sa.literal(query).op("<%")(label)
+    return sa.select(
+        sa.literal(kind.value).label("kind"),
+        label.class_.id,
+        label.class_.slug,
+        label.label("label"),
+        is_prefix_match.label("is_prefix_match"),
+        sa.func.word_similarity(query, label).label("score"),
+    ).where(sa.or_(is_prefix_match, is_similar))
+
+
+def build_search_query(
+    query: str,
+    limit_offset: filters.LimitOffset,
+    kind: schemas.SearchResultKind | None = None,
+) -> sa.Select[tuple[str, ...]]:
+    """Build the ranked search, prefix matches first and then by word similarity."""
+    searched_kinds = list(schemas.SearchResultKind) if kind is None else [kind]
+    matches = [_select_matches(searched_kind, query) for searched_kind in searched_kinds]
+    ranked = sa.union_all(*matches).subquery("matches")
+    result_columns = [
+        ranked.c[field_name] for field_name in schemas.SearchResultSchema.model_fields
+    ]
+    return (
+        sa.select(*result_columns)
+        .order_by(
+            ranked.c.is_prefix_match.desc(),
+            ranked.c.score.desc(),
+            ranked.c.label,
+            ranked.c.id,
+        )
+        .limit(limit_offset.limit)
+        .offset(limit_offset.offset)
+    )
@@ -0,0 +1,76 @@
+import uuid
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from advanced_alchemy.utils.text import slugify
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, async_scoped_session
+
+from apps.company_structure.infrastructure import models
+
+DEPARTMENT_SLUG_SCOPE = "department"
+EMPLOYEE_SLUG_SCOPE = "employee"
+
+# "-" and up to 19 digits of the bigint counter, so allocated slugs fit the column
+_MAX_SLUG_SUFFIX_LENGTH = 20
+_SLUG_BASE_LENGTH = models.SLUG_LENGTH - _MAX_SLUG_SUFFIX_LENGTH
+
+type _AnyAsyncSession = AsyncSession | async_scoped_session[AsyncSession]
+
+
+def _make_slug_base(value_to_slugify: str) -> str:
+    return slugify(value_to_slugify)[:_SLUG_BASE_LENGTH].rstrip("-")
+
+
+def _unnest_slug_bases(values_to_slugify: Sequence[str]) -> sa.TableValuedAlias:
+    bases_literal = sa.literal(
+        [_make_slug_base(value_to_slugify) for value_to_slugify in values_to_slugify],
+        postgresql.ARRAY(sa.Text),
+    )
+    return sa.func.unnest(bases_literal).table_valued("base", with_ordinality="position")
+
+
+def _allocate_slug_expression(scope: str, value_to_slugify: str) -> sa.Function[str]:
+    return sa.func.allocate_slug(scope, _make_slug_base(value_to_slugify), type_=sa.String)
+
+
+def keep_or_allocate_slug(
+    model_type: type[models.Department | models.Employee],
+    scope: str,
+    entity_id: uuid.UUID,
+    value_to_slugify: str,
+) -> sa.ColumnElement[str]:
+    """Build an expression keeping the slug of an existing row or allocating a new one.
+
+    COALESCE stops at the existing slug, so updates do not spend counter suffixes.
+    """
+    existing_slug = sa.select(model_type.slug).where(model_type.id == entity_id)
+    return sa.func.coalesce(
+        existing_slug.scalar_subquery(),
+        _allocate_slug_expression(scope, value_to_slugify),
+    )
+
+
+async def allocate_slug(session: _AnyAsyncSession, scope: str, value_to_slugify: str) -> str:
+    """Reserve a unique slug in the scope table with one statement.
+
+    The next free suffix comes from the per-base counter, so the cost does not grow
+    with the number of departments or employees sharing the same title or name.
+    """
+    query_result = await session.execute(
+        sa.select(_allocate_slug_expression(scope, value_to_slugify)),
+    )
+    return query_result.scalar_one()
+
+
+async def allocate_slugs(
+    session: _AnyAsyncSession,
+    scope: str,
+    values_to_slugify: Sequence[str],
+) -> list[str]:
+    """Reserve unique slugs for a batch with one statement, in the order of the values."""
+    bases = _unnest_slug_bases(values_to_slugify)
+    allocated_slug = sa.func.allocate_slug(scope, bases.c.base, type_=sa.String)
+    slugs = sa.select(allocated_slug).order_by(bases.c.position)
+    query_result = await session.execute(slugs)
+    return list(query_result.scalars())
@@ -0,0 +1,75 @@
+from collections.abc import Awaitable, Callable
+from typing import Any, override
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+
+from apps.company_structure.application import ports
+from apps.company_structure.infrastructure import connection_pool
+
+type AfterCommitCallback = Callable[[], Awaitable[None] | None]
+
+
+class SQLAlchemyUnitOfWork(ports.UnitOfWorkPort):
+    """Request transaction, the write use case commits it once when it is done.
+
+    Repositories only write through the session and register callbacks, such as cache
+    invalidation, that must run once the writes are visible to other transactions.
+    """
+
+    def __init__(self, db_session: AsyncSession) -> None:
+        self._db_session = db_session
+        self._after_commit_callbacks: list[AfterCommitCallback] = []
+
+    def call_after_commit(self, callback: AfterCommitCallback) -> None:
+        self._after_commit_callbacks.append(callback)
+
+    @override
+    async def commit(self) -> None:
+        await self._db_session.commit()
+        callbacks = self._after_commit_callbacks
+        self._after_commit_callbacks = []
+        for callback in callbacks:
+            callback_result = callback()
+            if callback_result is not None:
+                await callback_result  # noqa: WPS476  # reason: callbacks run in registration order
+
+
+class DetachedSessionMaker:
+    """Opens read only sessions that are not closed with the request.
+
+    A streamed response body is read after the request session is closed,
+    so it reads through a session of its own and closes it once done.
+    """
+
+    def __init__(self, engine: AsyncEngine, read_only_execution_options: dict[str, Any]) -> None:
+        self._engine = engine.execution_options(**read_only_execution_options)
+
+    def make_session(self) -> AsyncSession:
+        """Make a session with read only connections, the caller closes it."""
+        return AsyncSession(self._engine, expire_on_commit=False)
+
+
+class ReadReplica:
+    """Engine of the optional read replica, shared by the whole application."""
+
+    def __init__(self, uri: str | None, engine_options: dict[str, Any]) -> None:
+        self._engine = None if uri is None else create_async_engine(uri, **engine_options)
+
+    @property
+    def engine(self) -> AsyncEngine | None:
+        return self._engine
+
+    def make_session(self) -> AsyncSession | None:
+        """Open a replica session, or return None if no replica is configured."""
+        if self._engine is None:
+            return None
+        return AsyncSession(self._engine, expire_on_commit=False)
+
+    def pool_statistics(self) -> connection_pool.PoolStatistics | None:
+        if self._engine is None:
+            return None
+        return connection_pool.collect_pool_statistics(self._engine)
+
+    async def dispose(self) -> None:
+        if self._engine is not None:
+            await self._engine.dispose()
@@ -0,0 +1,111 @@
+import uuid
+from datetime import UTC, datetime
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql.selectable import TypedReturnsRows
+
+from apps.company_structure.infrastructure import models, slug_allocator
+
+_UUID_ARRAY = postgresql.ARRAY(sa.Uuid)
+
+
+def _build_department_path(orm_department: models.Department) -> sa.ColumnElement[list[uuid.UUID]]:
+    if orm_department.parent_id is None:
+        return sa.literal([orm_department.id], _UUID_ARRAY)
+
+    parent_path = sa.select(models.Department.path).where(
+        models.Department.id == orm_department.parent_id
+    )
+    return sa.func.array_append(parent_path.scalar_subquery(), orm_department.id, type_=_UUID_ARRAY)
+
+
+def _insert_department(orm_department: models.Department) -> sa.CTE:
+    now = datetime.now(tz=UTC)
+    insert_statement = postgresql.insert(models.Department).values(
+        id=orm_department.id,
+        slug=slug_allocator.keep_or_allocate_slug(
+            models.Department,
+            slug_allocator.DEPARTMENT_SLUG_SCOPE,
+            orm_department.id,
+            orm_department.title,
+        ),
+        title=orm_department.title,
+        parent_id=orm_department.parent_id,
+        path=_build_department_path(orm_department),
+        created_at=now,
+        updated_at=now,
+    )
+    upsert_statement = insert_statement.on_conflict_do_update(
+        index_elements=[models.Department.id],
+        set_={
+            "title": insert_statement.excluded.title,
+            "parent_id": insert_statement.excluded.parent_id,
+            "path": insert_statement.excluded.path,
+            "updated_at": insert_statement.excluded.updated_at,
+        },
+    )
+    return upsert_statement.returning(models.Department.slug, models.Department.path).cte("saved")
+
+
+def _rebase_descendants(department_id: uuid.UUID, previous: sa.CTE, saved: sa.CTE) -> sa.CTE:
+    """Replace the previous path prefix of the descendants with the saved one."""
+    tail_start = sa.func.cardinality(previous.c.path) + 1
+    descendant_path_tail = models.Department.path[
+        tail_start : sa.func.cardinality(models.Department.path)
+    ]
+    rebase_statement = (
+        sa.update(models.Department)
+        .where(
+            models.Department.path.contains([department_id]),
+            models.Department.id != department_id,
+            previous.c.path != saved.c.path,
+        )
+        .values(path=saved.c.path + descendant_path_tail)
+    )
+    return rebase_statement.cte("rebased")
+
+
+def build_department_upsert(orm_department: models.Department) -> sa.Select[str]:
+    """Build one statement inserting or updating the department, returning its slug.
+
+    All parts of the statement see the rows as they were before it, so the descendants
+    are found by the previous path and rebased when the department changes its parent.
+    """
+    previous = (
+        sa.select(models.Department.path)
+        .where(models.Department.id == orm_department.id)
+        .cte("previous")
+    )
+    saved = _insert_department(orm_department)
+    rebased = _rebase_descendants(orm_department.id, previous, saved)
+    return sa.select(saved.c.slug).add_cte(previous, rebased)
+
+
+def build_employee_upsert(orm_employee: models.Employee) -> TypedReturnsRows[str]:
+    """Build one statement inserting or updating the employee, returning its slug."""
+    now = datetime.now(tz=UTC)
+    insert_statement = postgresql.insert(models.Employee).values(
+        id=orm_employee.id,
+        slug=slug_allocator.keep_or_allocate_slug(
+            models.Employee,
+            slug_allocator.EMPLOYEE_SLUG_SCOPE,
+            orm_employee.id,
+            orm_employee.name,
+        ),
+        name=orm_employee.name,
+        manager_id=orm_employee.manager_id,
+        department_id=orm_employee.department_id,
+        created_at=now,
+        updated_at=now,
+    )
+    upsert_statement = insert_statement.on_conflict_do_update(
+        index_elements=[models.Employee.id],
+        set_={
+            "name": insert_statement.excluded.name,
+            "manager_id": insert_statement.excluded.manager_id,
+            "department_id": insert_statement.excluded.department_id,
+            "updated_at": insert_statement.excluded.updated_at,
+        },
+    )
+    return upsert_statement.returning(models.Employee.slug)
@@ -6,19 +6,112 @@ from dishka import Provider, Scope, WithParents, provide, provide_all
 from litestar.types.protocols import Logger
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from apps.company_structure.application import services
-from apps.company_structure.infrastructure import gateways, repositories
+from apps.company_structure.application import (
+    department_import_services,
+    department_tree_services,
+    department_update_services,
+    employee_import_services,
+    export_services,
+    org_structure_version_services,
+    search_services,
+    services,
+)
+from apps.company_structure.infrastructure import (
+    caches,
+    configs,
+    gateways,
+    repositories,
+    response_cache,
+    transactions,
+)
+
+_READ_ONLY_HTTP_METHODS = frozenset(("GET", "HEAD", "OPTIONS"))
 
 
 class InfrastructureProvider(Provider):
-    @provide(scope=Scope.REQUEST)
-    async def transaction(self, request: litestar.Request) -> AsyncIterable[AsyncSession]:  # type: ignore[type-arg]  # reason: to correctly build dependencies tree
-        db_session = await request.app.dependencies["db_session"](
-            state=request.app.state,
-            scope=request.scope,
+    forest_cache = provide(caches.DepartmentForestCache, scope=Scope.APP)
+    headcount_cache = provide(caches.DepartmentHeadcountCache, scope=Scope.APP)
+    unit_of_work = provide(
+        WithParents[transactions.SQLAlchemyUnitOfWork],  # type: ignore[misc]
+        scope=Scope.REQUEST,
+    )
+
+    def __init__(self, app_config: configs.AppConfig) -> None:
+        super().__init__()
+        self._app_config = app_config
+
+    @provide(scope=Scope.APP)
+    def app_config(self) -> configs.AppConfig:
+        return self._app_config
+
+    @provide(scope=Scope.APP)
+    def row_count_cache(self, app_config: configs.AppConfig) -> caches.RowCountCache:
+        return caches.RowCountCache(app_config.count_cache_ttl_seconds)
+
+    @provide(scope=Scope.APP)
+    async def read_replica(
+        self, app_config: configs.AppConfig
+    ) -> AsyncIterable[transactions.ReadReplica]:
+        read_replica = transactions.ReadReplica(
+            app_config.postgres.replica_uri,
+            engine_options=app_config.postgres.engine_options,
         )
-        async with db_session.begin():
+        yield read_replica
+        await read_replica.dispose()
+
+    @provide(scope=Scope.REQUEST)
+    async def transaction(
+        self,
+        request: litestar.Request,  # type: ignore[type-arg]  # reason: to correctly build dependencies tree
+        app_config: configs.AppConfig,
+        read_replica: transactions.ReadReplica,
+    ) -> AsyncIterable[AsyncSession]:
+        """Open the request session, read only requests go to the replica if there is one.
+
+        Requests with writes use the primary for all their queries, so they read their writes.
+        """
+        is_read_only = request.method in _READ_ONLY_HTTP_METHODS
+        db_session = read_replica.make_session() if is_read_only else None
+        if db_session is None:
+            db_session = await request.app.dependencies["db_session"](
+                state=request.app.state,
+                scope=request.scope,
+            )
+        if is_read_only:
+            await db_session.connection(
+                execution_options=app_config.postgres.read_only_execution_options,
+            )
+        try:
             yield db_session
+        finally:
+            # Writes are kept only when committed by the unit of work of a use case
+            await db_session.close()
+
+    @provide(scope=Scope.REQUEST)
+    async def detached_session_maker(
+        self,
+        request: litestar.Request,  # type: ignore[type-arg]  # reason: to correctly build dependencies tree
+        app_config: configs.AppConfig,
+        read_replica: transactions.ReadReplica,
+    ) -> transactions.DetachedSessionMaker:
+        """Read from the replica if there is one, like the read only request sessions."""
+        engine = read_replica.engine
+        if engine is None:
+            engine = await request.app.dependencies["db_engine"](state=request.app.state)
+        return transactions.DetachedSessionMaker(
+            engine,
+            read_only_execution_options=app_config.postgres.read_only_execution_options,
+        )
+
+    @provide(scope=Scope.REQUEST)
+    def response_cache_tags(
+        self,
+        request: litestar.Request,  # type: ignore[type-arg]  # reason: to correctly build dependencies tree
+    ) -> response_cache.ResponseCacheTags:
+        """Use the store the application caches responses in, whichever it is."""
+        return response_cache.ResponseCacheTags(
+            request.app.response_cache_config.get_store_from_app(request.app),
+        )
 
     @provide(scope=Scope.REQUEST)
     async def logger(self, request: litestar.Request) -> Logger:  # type: ignore[type-arg]  # reason: to correctly build dependencies tree
@@ -44,12 +137,24 @@ class AppProvider(Provider):
 
     services = provide_all(
         WithParents[services.DepartmentService],  # type: ignore[misc]
-        WithParents[services.DepartmentTreeService],  # type: ignore[misc]
         WithParents[services.EmployeeService],  # type: ignore[misc]
+        WithParents[department_import_services.DepartmentImportService],  # type: ignore[misc]
+        WithParents[department_tree_services.DepartmentTreeService],  # type: ignore[misc]
+        WithParents[department_update_services.DepartmentUpdateService],  # type: ignore[misc]
+        WithParents[employee_import_services.EmployeeImportService],  # type: ignore[misc]
+        WithParents[export_services.ExportService],  # type: ignore[misc]
+        WithParents[org_structure_version_services.OrgStructureVersionService],  # type: ignore[misc]
+        WithParents[search_services.SearchService],  # type: ignore[misc]
     )
 
     repositories = provide_all(
         WithParents[repositories.department_repository.DepartmentRepository],  # type: ignore[misc]
         WithParents[repositories.department_repository.DepartmentTreeRepository],  # type: ignore[misc]
+        WithParents[repositories.department_hierarchy_repository.DepartmentHierarchyRepository],  # type: ignore[misc]
+        WithParents[repositories.department_import_repository.DepartmentImportRepository],  # type: ignore[misc]
         WithParents[repositories.employee_repository.EmployeeRepository],  # type: ignore[misc]
+        WithParents[repositories.employee_import_repository.EmployeeImportRepository],  # type: ignore[misc]
+        WithParents[repositories.export_repository.ExportRepository],  # type: ignore[misc]
+        WithParents[repositories.org_structure_version_repository.OrgStructureVersionRepository],  # type: ignore[misc]
+        WithParents[repositories.search_repository.SearchRepository],  # type: ignore[misc]
     )
@@ -3,8 +3,9 @@ import tomllib
 from pathlib import Path
 
 from litestar.config import allowed_hosts, compression, cors, csrf
+from litestar.config.response_cache import ResponseCacheConfig
 from litestar.contrib.jinja import JinjaTemplateEngine
-from litestar.contrib.sqlalchemy.plugins import SQLAlchemyAsyncConfig
+from litestar.contrib.sqlalchemy.plugins import EngineConfig, SQLAlchemyAsyncConfig
 from litestar.middleware.rate_limit import RateLimitConfig
 from litestar.openapi import OpenAPIConfig
 from litestar.openapi.plugins import SwaggerRenderPlugin
@@ -22,10 +23,12 @@ class Config(BaseModel):
 
 
 service_config = Config()
+_postgres_config = service_config.company_structure_app_config.postgres
 db_config = SQLAlchemyAsyncConfig(
-    connection_string=service_config.company_structure_app_config.postgres.uri,
+    connection_string=_postgres_config.uri,
     metadata=company_structure.CompanyStructureBase.metadata,
     create_all=True,
+    engine_config=EngineConfig(**_postgres_config.engine_options),
 )
 cors_config = cors.CORSConfig(allow_origins=os.environ["ALLOW_ORIGINS"].split(","))
 csrf_config = csrf.CSRFConfig(secret=os.environ["CSRF_SECRET"])
@@ -34,6 +37,14 @@ allowed_hosts_config = allowed_hosts.AllowedHostsConfig(
 )
 compression_config = compression.CompressionConfig(backend="gzip", gzip_compress_level=9)
 rate_limit_config = RateLimitConfig(rate_limit=("second", 100), exclude=["/docs"])
+response_cache_config = ResponseCacheConfig(
+    default_expiration=service_config.company_structure_app_config.response_cache_expiration_seconds,
+)
+response_cache_stores = {
+    response_cache_config.store: company_structure.make_response_cache_store(
+        service_config.company_structure_app_config
+    ),
+}
 template_config = TemplateConfig(directory=Path("templates"), engine=JinjaTemplateEngine)
 
 _pyproject_path = Path(__file__).parent.parent / "pyproject.toml"
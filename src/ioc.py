@@ -1,10 +1,11 @@
 from dishka import make_async_container
 from dishka.integrations import litestar as litestar_integration
 
+import config
 from apps.company_structure import ioc
 
 container = make_async_container(
-    ioc.InfrastructureProvider(),
+    ioc.InfrastructureProvider(config.service_config.company_structure_app_config),
     ioc.LitestarRepositoryProvider(),
     ioc.AppProvider(),
     litestar_integration.LitestarProvider(),
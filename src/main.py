@@ -36,6 +36,8 @@ def get_app() -> Litestar:
         # csrf_config=config.csrf_config,  # noqa: ERA001  # reason: disabled while development
         allowed_hosts=config.allowed_hosts_config,
         compression_config=config.compression_config,
+        response_cache_config=config.response_cache_config,
+        stores=config.response_cache_stores,
         dependencies={"limit_offset": litestar_utils.provide_limit_offset_pagination},
         debug=config.service_config.debug,
         template_config=config.template_config,
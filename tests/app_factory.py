@@ -0,0 +1,27 @@
+from collections.abc import Sequence
+
+from dishka import Provider, make_async_container
+from dishka.integrations.litestar import LitestarProvider, setup_dishka
+from litestar import Litestar
+from litestar.di import Provide
+from litestar.testing import TestClient
+from litestar.types import ControllerRouterHandler
+
+import litestar_utils
+
+
+def build_test_client(
+    route_handlers: Sequence[ControllerRouterHandler],
+    *providers: Provider,
+) -> TestClient[Litestar]:
+    """Serve the handlers like the application does, with use cases given by the providers."""
+    litestar_app = Litestar(
+        route_handlers=route_handlers,
+        dependencies={
+            "limit_offset": Provide(
+                litestar_utils.provide_limit_offset_pagination, sync_to_thread=False
+            ),
+        },
+    )
+    setup_dishka(make_async_container(*providers, LitestarProvider()), litestar_app)
+    return TestClient(litestar_app)
@@ -0,0 +1,127 @@
+import asyncio
+import uuid
+from collections.abc import Sequence
+from typing import override
+
+import pytest
+
+from apps.company_structure.application import (
+    department_import_services,
+    import_schemas,
+    ports,
+    schemas,
+)
+from apps.company_structure.domain import exceptions as domain_exceptions
+
+_EXISTING_PARENT_ID = uuid.uuid4()
+
+
+class _Storage(ports.GenericBulkSavePort[schemas.DepartmentSchema], ports.UnitOfWorkPort):
+    """Bulk save port and unit of work keeping the saved departments in a list."""
+
+    def __init__(self, *missing_parent_ids: uuid.UUID) -> None:
+        self.saved_departments: list[schemas.DepartmentSchema] = []
+        self._missing_parent_ids = missing_parent_ids
+        self.is_committed = False
+
+    @override
+    async def save_all(self, entities: Sequence[schemas.DepartmentSchema]) -> None:
+        if self._missing_parent_ids:
+            raise domain_exceptions.ParentDepartmentsNotFoundError(self._missing_parent_ids)
+        self.saved_departments.extend(entities)
+
+    @override
+    async def commit(self) -> None:
+        self.is_committed = True
+
+
+def _make_row(
+    key: str,
+    parent_key: str | None = None,
+    parent_id: uuid.UUID | None = None,
+) -> import_schemas.DepartmentImportRowSchema:
+    return import_schemas.DepartmentImportRowSchema(
+        key=key, title=key.title(), parent_key=parent_key, parent_id=parent_id
+    )
+
+
+def _collect_errors(
+    rows: Sequence[import_schemas.DepartmentImportRowSchema],
+    storage: _Storage | None = None,
+) -> list[str]:
+    storage = storage or _Storage()
+    import_service = department_import_services.DepartmentImportService(storage, storage)
+    try:
+        asyncio.run(import_service.import_departments(rows))
+    except department_import_services.DepartmentImportValidationError as import_error:
+        return import_error.errors
+    pytest.fail("The departments were imported")
+
+
+def test_parents_saved_before_children() -> None:
+    storage = _Storage()
+    import_service = department_import_services.DepartmentImportService(storage, storage)
+
+    import_result = asyncio.run(
+        import_service.import_departments(
+            [
+                _make_row("team", parent_key="sales"),
+                _make_row("sales", parent_id=_EXISTING_PARENT_ID),
+            ]
+        )
+    )
+
+    sales, team = storage.saved_departments
+    assert (sales.title, team.title) == ("Sales", "Team")
+    assert sales.parent_id == _EXISTING_PARENT_ID
+    assert team.parent_id == import_result.ids["sales"] == sales.id
+    assert import_result.created_count == len(storage.saved_departments)
+    assert storage.is_committed
+
+
+def test_duplicate_keys_and_two_parents_rejected() -> None:
+    errors = _collect_errors(
+        [
+            _make_row("support"),
+            _make_row("support"),
+            _make_row("desk", parent_key="support", parent_id=uuid.uuid4()),
+        ]
+    )
+
+    assert errors == [
+        "Duplicate department key 'support'",
+        "Department 'desk' has both parent_key and parent_id",
+    ]
+
+
+def test_unknown_parents_and_cycles_rejected() -> None:
+    errors = _collect_errors(
+        [
+            _make_row("root"),
+            _make_row("orphan", parent_key="missing"),
+            _make_row("first", parent_key="second"),
+            _make_row("second", parent_key="first"),
+        ]
+    )
+
+    assert errors == [
+        "Department 'orphan' refers to unknown parent_key 'missing'",
+        "Department 'first' is in a parent_key cycle or under an invalid department",
+        "Department 'second' is in a parent_key cycle or under an invalid department",
+    ]
+
+
+def test_missing_parent_id_rejected() -> None:
+    missing_parent_id = uuid.uuid4()
+
+    errors = _collect_errors(
+        [
+            _make_row("branch", parent_id=_EXISTING_PARENT_ID),
+            _make_row("office", parent_id=missing_parent_id),
+        ],
+        _Storage(missing_parent_id),
+    )
+
+    assert errors == [
+        f"Department 'office' in row 2 refers to missing parent_id {missing_parent_id}",
+    ]
@@ -0,0 +1,130 @@
+import asyncio
+import uuid
+from collections.abc import Collection, Sequence
+from typing import override
+
+import pytest
+
+from apps.company_structure.application import (
+    employee_import_services,
+    import_schemas,
+    ports,
+    schemas,
+)
+
+_SALES_SLUG = "sales"
+_SALES_ID = uuid.uuid4()
+_MANAGER_ID = uuid.uuid4()
+_DUPLICATE_KEY = "ann"
+_CYCLE_MESSAGE = "Employee is in a manager_key cycle or under an invalid employee"
+
+
+class _LookupPort(ports.EmployeeImportLookupPort):
+    """Knows the sales department, by id and by slug, and one manager."""
+
+    @override
+    async def fetch_department_ids_by_slug(self, slugs: Collection[str], /) -> dict[str, uuid.UUID]:
+        return {_SALES_SLUG: _SALES_ID} if _SALES_SLUG in slugs else {}
+
+    @override
+    async def fetch_existing_department_ids(
+        self, department_ids: Collection[uuid.UUID], /
+    ) -> set[uuid.UUID]:
+        return {_SALES_ID} & set(department_ids)
+
+    @override
+    async def fetch_existing_employee_ids(
+        self, employee_ids: Collection[uuid.UUID], /
+    ) -> set[uuid.UUID]:
+        return {_MANAGER_ID} & set(employee_ids)
+
+
+class _Storage(ports.GenericBulkSavePort[schemas.EmployeeSchema], ports.UnitOfWorkPort):
+    """Bulk save port and unit of work keeping the saved employees in a list."""
+
+    def __init__(self) -> None:
+        self.saved_employees: list[schemas.EmployeeSchema] = []
+        self.is_committed = False
+
+    @override
+    async def save_all(self, entities: Sequence[schemas.EmployeeSchema]) -> None:
+        self.saved_employees.extend(entities)
+
+    @override
+    async def commit(self) -> None:
+        self.is_committed = True
+
+
+def _make_row(key: str, **references: uuid.UUID | str) -> import_schemas.EmployeeImportRowSchema:
+    return import_schemas.EmployeeImportRowSchema(key=key, name=key.title(), **references)
+
+
+def _collect_errors(
+    rows: Sequence[import_schemas.EmployeeImportRowSchema],
+) -> list[tuple[int, str | None, str]]:
+    storage = _Storage()
+    import_service = employee_import_services.EmployeeImportService(_LookupPort(), storage, storage)
+    try:
+        asyncio.run(import_service.import_employees(rows))
+    except employee_import_services.EmployeeImportValidationError as import_error:
+        return [(error.row, error.key, error.message) for error in import_error.errors]
+    pytest.fail("The employees were imported")
+
+
+def test_managers_saved_before_their_reports() -> None:
+    storage = _Storage()
+    import_service = employee_import_services.EmployeeImportService(_LookupPort(), storage, storage)
+
+    import_result = asyncio.run(
+        import_service.import_employees(
+            [
+                _make_row("lea", department_slug=_SALES_SLUG, manager_key="boss"),
+                _make_row("boss", department_id=_SALES_ID, manager_id=_MANAGER_ID),
+            ]
+        )
+    )
+
+    boss, lea = storage.saved_employees
+    assert boss.manager_id == _MANAGER_ID
+    assert lea.manager_id == import_result.ids["boss"] == boss.id
+    assert lea.department_id == boss.department_id == _SALES_ID
+    assert storage.is_committed
+
+
+def test_invalid_rows_reported_together() -> None:
+    errors = _collect_errors(
+        [
+            _make_row(_DUPLICATE_KEY, department_slug=_SALES_SLUG),
+            _make_row(_DUPLICATE_KEY, department_slug=_SALES_SLUG, manager_key=_DUPLICATE_KEY),
+            _make_row(
+                "bob",
+                department_slug=_SALES_SLUG,
+                manager_key=_DUPLICATE_KEY,
+                manager_id=_MANAGER_ID,
+            ),
+            _make_row("eve", department_slug="unknown", manager_id=uuid.uuid4()),
+        ]
+    )
+
+    assert errors == [
+        (2, _DUPLICATE_KEY, "Duplicate employee key 'ann'"),
+        (3, "bob", "Set either manager_key or manager_id, not both"),
+        (4, "eve", "Department not found"),
+        (4, "eve", "Manager not found"),
+    ]
+
+
+def test_unknown_managers_and_cycles_reported() -> None:
+    errors = _collect_errors(
+        [
+            _make_row("amy", department_id=_SALES_ID, manager_key="missing"),
+            _make_row("dan", department_id=_SALES_ID, manager_key="kim"),
+            _make_row("kim", department_id=_SALES_ID, manager_key="dan"),
+        ]
+    )
+
+    assert errors == [
+        (1, "amy", "Unknown manager_key 'missing'"),
+        (2, "dan", _CYCLE_MESSAGE),
+        (3, "kim", _CYCLE_MESSAGE),
+    ]
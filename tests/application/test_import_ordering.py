@@ -0,0 +1,68 @@
+from operator import itemgetter
+
+from apps.company_structure.application import import_ordering
+
+type _Row = tuple[str, str | None]
+
+_ROOT_KEY = "root"
+
+
+def _order(rows: list[_Row]) -> tuple[list[str], list[str]]:
+    ordered_rows, unreachable_rows = import_ordering.order_parents_first(
+        rows, get_key=itemgetter(0), get_parent_key=itemgetter(1)
+    )
+    return [row[0] for row in ordered_rows], [row[0] for row in unreachable_rows]
+
+
+def test_parents_ordered_first_in_pre_order() -> None:
+    ordered_keys, unreachable_keys = _order(
+        [
+            ("sales", _ROOT_KEY),
+            (_ROOT_KEY, None),
+            ("support", _ROOT_KEY),
+            ("north", "sales"),
+        ]
+    )
+
+    assert ordered_keys == [_ROOT_KEY, "sales", "north", "support"]
+    assert not unreachable_keys
+
+
+def test_rows_under_unknown_parent_unreachable() -> None:
+    ordered_keys, unreachable_keys = _order(
+        [
+            (_ROOT_KEY, None),
+            ("orphan", "missing"),
+            ("orphan_child", "orphan"),
+        ]
+    )
+
+    assert ordered_keys == [_ROOT_KEY]
+    assert unreachable_keys == ["orphan", "orphan_child"]
+
+
+def test_rows_in_cycle_unreachable() -> None:
+    ordered_keys, unreachable_keys = _order(
+        [
+            ("first", "second"),
+            ("second", "first"),
+            ("own_parent", "own_parent"),
+            (_ROOT_KEY, None),
+        ]
+    )
+
+    assert ordered_keys == [_ROOT_KEY]
+    assert unreachable_keys == ["first", "second", "own_parent"]
+
+
+def test_duplicate_keys_emitted_once() -> None:
+    ordered_keys, unreachable_keys = _order(
+        [
+            (_ROOT_KEY, None),
+            (_ROOT_KEY, _ROOT_KEY),
+            ("legal", _ROOT_KEY),
+        ]
+    )
+
+    assert ordered_keys == [_ROOT_KEY, "legal"]
+    assert not unreachable_keys
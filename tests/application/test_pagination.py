@@ -0,0 +1,73 @@
+import pytest
+
+from apps.company_structure.application import pagination
+
+_PAGE_SIZE = 2
+_AMY = "Amy"
+_BOB = "Bob"
+_CAT = "Cat"
+_DAN = "Dan"
+
+
+def _get_key(name: str) -> tuple[str, ...]:
+    return (name,)
+
+
+def test_cursor_round_trips() -> None:
+    cursor = pagination.KeysetCursor(key=("Ann", "42"), is_backward=True)
+
+    encoded_cursor = cursor.encode()
+
+    assert "=" not in encoded_cursor
+    assert pagination.KeysetCursor.decode(encoded_cursor) == cursor
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not base64!",
+        "e30",  # {}
+        "W10",  # []
+        "WyJ4Il0",  # ["x"]
+        "W3RydWUsMV0",  # [true,1]
+    ],
+)
+def test_invalid_cursor_rejected(cursor: str) -> None:
+    with pytest.raises(pagination.InvalidCursorError):
+        pagination.KeysetCursor.decode(cursor)
+
+
+def test_first_page_points_forward_only() -> None:
+    page = pagination.build_cursor_page([_AMY, _BOB, _CAT], _PAGE_SIZE, None, _get_key)
+
+    assert page.items == [_AMY, _BOB]
+    assert page.next_cursor == pagination.KeysetCursor((_BOB,)).encode()
+    assert page.prev_cursor is None
+
+
+def test_last_forward_page_points_back() -> None:
+    cursor = pagination.KeysetCursor((_BOB,))
+
+    page = pagination.build_cursor_page([_CAT], _PAGE_SIZE, cursor, _get_key)
+
+    assert page.items == [_CAT]
+    assert page.next_cursor is None
+    assert page.prev_cursor == pagination.KeysetCursor((_CAT,), is_backward=True).encode()
+
+
+def test_backward_page_reversed() -> None:
+    cursor = pagination.KeysetCursor((_DAN,), is_backward=True)
+
+    page = pagination.build_cursor_page([_CAT, _BOB, _AMY], _PAGE_SIZE, cursor, _get_key)
+
+    assert page.items == [_BOB, _CAT]
+    assert page.next_cursor == pagination.KeysetCursor((_CAT,)).encode()
+    assert page.prev_cursor == pagination.KeysetCursor((_BOB,), is_backward=True).encode()
+
+
+def test_empty_page_has_no_cursors() -> None:
+    cursor = pagination.KeysetCursor((_DAN,))
+
+    page = pagination.build_cursor_page([], _PAGE_SIZE, cursor, _get_key)
+
+    assert page == pagination.CursorPage(items=[], next_cursor=None, prev_cursor=None)
@@ -0,0 +1,18 @@
+import uuid
+
+import pytest
+
+from apps.company_structure.domain import entities
+
+
+@pytest.fixture
+def employee() -> entities.EmployeeEntity:
+    """Employee with a manager, so DTOs have a nested entity to encode."""
+    department_id = uuid.uuid4()
+    manager = entities.EmployeeEntity(id=uuid.uuid4(), name="Boss", department_id=department_id)
+    return entities.EmployeeEntity(
+        id=uuid.uuid4(),
+        name="Ann",
+        department_id=department_id,
+        manager=manager,
+    )
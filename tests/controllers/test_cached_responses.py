@@ -0,0 +1,74 @@
+import uuid
+from typing import override
+
+from dishka import Provider, Scope, provide
+from dishka.integrations.litestar import FromDishka, inject
+from litestar import get, status_codes
+from litestar.stores.memory import MemoryStore
+
+from apps.company_structure.application import use_cases
+from apps.company_structure.controllers import cached_responses
+from apps.company_structure.domain import entities
+from apps.company_structure.infrastructure import response_cache
+from tests import app_factory
+
+_CACHED_PATH = "/cached"
+# Written by another worker, so the tags of this one are not invalidated
+_WRITTEN_VERSION = entities.OrgStructureVersion(
+    department_version=2, employee_version=1, modified_at=None
+)
+
+
+class _VersionUseCase(use_cases.GetOrgStructureVersionUseCase):
+    def __init__(self) -> None:
+        self.version = entities.OrgStructureVersion(
+            department_version=1, employee_version=1, modified_at=None
+        )
+
+    @override
+    async def get_version(self) -> entities.OrgStructureVersion:  # noqa: WPS615  # reason: implements the use case
+        return self.version
+
+
+class _CacheProvider(Provider):
+    scope = Scope.REQUEST
+
+    def __init__(self, version_use_case: _VersionUseCase) -> None:
+        super().__init__()
+        self._version_use_case = version_use_case
+        self._cache_tags = response_cache.ResponseCacheTags(MemoryStore())
+
+    @provide
+    def version_use_case(self) -> use_cases.GetOrgStructureVersionUseCase:
+        return self._version_use_case
+
+    @provide
+    def cache_tags(self) -> response_cache.ResponseCacheTags:
+        return self._cache_tags
+
+
+@get(
+    path=_CACHED_PATH,
+    cache=True,
+    cache_key_builder=cached_responses.build_tagged_cache_key,
+    middleware=[cached_responses.org_structure_tags_middleware],
+)
+@inject
+async def _get_cached(
+    use_case: FromDishka[use_cases.GetOrgStructureVersionUseCase],
+) -> dict[str, object]:
+    version = await use_case.get_version()
+    return {"department_version": version.department_version, "response_id": uuid.uuid4().hex}
+
+
+def test_database_version_change_skips_cache() -> None:
+    version_use_case = _VersionUseCase()
+    with app_factory.build_test_client([_get_cached], _CacheProvider(version_use_case)) as client:
+        first_response = client.get(_CACHED_PATH)
+        cached_response = client.get(_CACHED_PATH)
+        version_use_case.version = _WRITTEN_VERSION
+        fresh_response = client.get(_CACHED_PATH)
+
+    assert first_response.status_code == status_codes.HTTP_200_OK
+    assert cached_response.json() == first_response.json()
+    assert fresh_response.json()["department_version"] == _WRITTEN_VERSION.department_version
@@ -0,0 +1,60 @@
+import uuid
+from typing import override
+
+from dishka import Provider, Scope, provide
+from litestar import status_codes
+from litestar.repository import filters
+
+from apps.company_structure.application import schemas, use_cases
+from apps.company_structure.controllers.api import route_handlers, router
+from apps.company_structure.domain import entities
+from apps.company_structure.domain import exceptions as domain_exceptions
+from tests import app_factory
+
+
+class _DepartmentEmployeesUseCase(use_cases.GetDepartmentEmployeesUseCase):
+    def __init__(self, employee: entities.EmployeeEntity) -> None:
+        self._employee = employee
+
+    @override
+    async def get_employees(
+        self,
+        department_id: uuid.UUID,
+        limit_offset: filters.LimitOffset,
+        membership: schemas.DepartmentMembership = schemas.DepartmentMembership.all,
+    ) -> tuple[list[entities.EmployeeEntity], int]:
+        if department_id != self._employee.department_id:
+            raise domain_exceptions.DepartmentTreeNodeNotFoundError
+        return [self._employee], 1
+
+
+class _UseCaseProvider(Provider):
+    scope = Scope.REQUEST
+
+    def __init__(self, employee: entities.EmployeeEntity) -> None:
+        super().__init__()
+        self._employee = employee
+
+    @provide
+    def department_employees_use_case(self) -> use_cases.GetDepartmentEmployeesUseCase:
+        return _DepartmentEmployeesUseCase(self._employee)
+
+
+def test_department_employees_page_serialized(employee: entities.EmployeeEntity) -> None:
+    with app_factory.build_test_client(
+        [route_handlers.DepartmentHierarchyHTTPController], _UseCaseProvider(employee)
+    ) as client:
+        response = client.get(f"/departments/{employee.department_id}/employees")
+
+    assert response.status_code == status_codes.HTTP_200_OK
+    page = response.json()
+    assert page["total"] == 1
+    assert page["items"][0]["manager"]["name"] == employee.manager.name
+
+
+def test_unknown_department_employees_not_found(employee: entities.EmployeeEntity) -> None:
+    api_router = router.router
+    with app_factory.build_test_client([api_router], _UseCaseProvider(employee)) as client:
+        response = client.get(f"{api_router.path}/departments/{uuid.uuid4()}/employees")
+
+    assert response.status_code == status_codes.HTTP_404_NOT_FOUND
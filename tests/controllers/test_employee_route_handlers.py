@@ -0,0 +1,81 @@
+import builtins
+from typing import override
+
+from dishka import Provider, Scope, provide
+from litestar import status_codes
+from litestar.repository import filters
+
+from apps.company_structure.application import pagination, use_cases
+from apps.company_structure.controllers.api import route_handlers
+from apps.company_structure.domain import entities
+from tests import app_factory
+
+
+class _EmployeeListUseCase(  # noqa: WPS215  # reason: one fake for both listings
+    use_cases.GenericGetPaginatedListUseCase[entities.EmployeeEntity],
+    use_cases.GenericGetCursorPageUseCase[entities.EmployeeEntity],
+):
+    def __init__(self, employee: entities.EmployeeEntity) -> None:
+        self._employee = employee
+
+    @override
+    async def paginated_list(
+        self,
+        limit_offset: filters.LimitOffset,
+        count_strategy: pagination.CountStrategy = pagination.CountStrategy.exact,
+    ) -> tuple[builtins.list[entities.EmployeeEntity], int | None]:
+        return [self._employee], 1
+
+    @override
+    async def cursor_page(
+        self,
+        cursor: str | None,
+        limit: int,
+    ) -> pagination.CursorPage[entities.EmployeeEntity]:
+        return pagination.CursorPage(items=[self._employee], next_cursor="next", prev_cursor=None)
+
+
+class _UseCaseProvider(Provider):
+    scope = Scope.REQUEST
+
+    def __init__(self, employee: entities.EmployeeEntity) -> None:
+        super().__init__()
+        self._employee = employee
+
+    @provide
+    def paginated_list_use_case(
+        self,
+    ) -> use_cases.GenericGetPaginatedListUseCase[entities.EmployeeEntity]:
+        return _EmployeeListUseCase(self._employee)
+
+    @provide
+    def cursor_page_use_case(
+        self,
+    ) -> use_cases.GenericGetCursorPageUseCase[entities.EmployeeEntity]:
+        return _EmployeeListUseCase(self._employee)
+
+
+def test_offset_page_serialized_by_return_dto(employee: entities.EmployeeEntity) -> None:
+    with app_factory.build_test_client(
+        [route_handlers.EmployeeHTTPController], _UseCaseProvider(employee)
+    ) as client:
+        response = client.get("/employees", params={"count": "exact"})
+
+    assert response.status_code == status_codes.HTTP_200_OK
+    page = response.json()
+    assert page["total"] == 1
+    assert page["count_strategy"] == "exact"
+    assert page["items"][0]["manager"]["name"] == employee.manager.name
+
+
+def test_cursor_page_serialized_by_return_dto(employee: entities.EmployeeEntity) -> None:
+    with app_factory.build_test_client(
+        [route_handlers.EmployeeHTTPController], _UseCaseProvider(employee)
+    ) as client:
+        response = client.get("/employees/cursor")
+
+    assert response.status_code == status_codes.HTTP_200_OK
+    page = response.json()
+    assert page["next_cursor"] == "next"
+    assert page["items"][0]["name"] == employee.name
+    assert page["items"][0]["manager"]["name"] == employee.manager.name
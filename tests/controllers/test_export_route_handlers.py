@@ -0,0 +1,88 @@
+import json
+import uuid
+from collections.abc import AsyncIterator, Sequence
+from typing import Any, Self, override
+
+from dishka import Provider, Scope, WithParents, provide, provide_all
+from litestar import status_codes
+from sqlalchemy.sql import Executable
+
+from apps.company_structure.application import export_services
+from apps.company_structure.controllers.api import export_route_handlers
+from apps.company_structure.infrastructure import repositories, transactions
+from tests import app_factory
+
+type _Rows = Sequence[Sequence[Any]]
+
+
+class _StreamResult:
+    def __init__(self, rows: _Rows) -> None:
+        self._rows = rows
+
+    async def partitions(self) -> AsyncIterator[_Rows]:
+        yield self._rows
+
+
+class _Session:
+    """Session that only streams its rows, and remembers whether it was closed."""
+
+    def __init__(self, rows: _Rows) -> None:
+        self.rows = rows
+        self.streamed_query: Executable | None = None
+        self.is_closed = False
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.is_closed = True
+
+    async def stream(self, query: Executable) -> _StreamResult:
+        self.streamed_query = query
+        return _StreamResult(self.rows)
+
+
+class _SessionMaker(transactions.DetachedSessionMaker):
+    def __init__(self, db_session: _Session) -> None:  # noqa: WPS612  # reason: no engine to wrap
+        self.db_session = db_session
+
+    @override
+    def make_session(self) -> Any:
+        return self.db_session
+
+
+class _ExportProvider(Provider):
+    scope = Scope.REQUEST
+
+    export = provide_all(
+        WithParents[export_services.ExportService],  # type: ignore[misc]
+        WithParents[repositories.export_repository.ExportRepository],  # type: ignore[misc]
+    )
+
+    def __init__(self, session_maker: _SessionMaker) -> None:
+        super().__init__()
+        self._session_maker = session_maker
+
+    @provide
+    def session_maker(self) -> transactions.DetachedSessionMaker:
+        return self._session_maker
+
+
+def test_export_streamed_on_own_session() -> None:
+    department_id = uuid.uuid4()
+    db_session = _Session([(department_id, "root", "Root", None)])
+    with app_factory.build_test_client(
+        [export_route_handlers.ExportHTTPController], _ExportProvider(_SessionMaker(db_session))
+    ) as client:
+        response = client.get("/export/departments")
+
+    assert response.status_code == status_codes.HTTP_200_OK
+    assert json.loads(response.text) == {
+        "id": str(department_id),
+        "slug": "root",
+        "title": "Root",
+        "parent_id": None,
+    }
+    assert db_session.streamed_query is not None
+    assert db_session.streamed_query.get_execution_options()["yield_per"]
+    assert db_session.is_closed
@@ -0,0 +1,40 @@
+from collections.abc import Sequence
+from typing import override
+
+import pytest
+from dishka import Provider, Scope, provide
+from litestar import status_codes
+
+from apps.company_structure.application import import_schemas, use_cases
+from apps.company_structure.controllers.api import import_route_handlers
+from tests import app_factory
+
+
+class _ImportDepartmentsUseCase(use_cases.ImportDepartmentsUseCase):
+    @override
+    async def import_departments(
+        self,
+        rows: Sequence[import_schemas.DepartmentImportRowSchema],
+    ) -> import_schemas.ImportResultSchema:
+        pytest.fail("Rows of an unreadable file were imported")
+
+
+class _UseCaseProvider(Provider):
+    scope = Scope.REQUEST
+
+    @provide
+    def import_departments_use_case(self) -> use_cases.ImportDepartmentsUseCase:
+        return _ImportDepartmentsUseCase()
+
+
+def test_csv_not_in_utf8_rejected() -> None:
+    with app_factory.build_test_client(
+        [import_route_handlers.DepartmentImportHTTPController], _UseCaseProvider()
+    ) as client:
+        response = client.post(
+            "/departments/import/csv",
+            files={"data": ("departments.csv", "key,title\nsales,Ventes é".encode("latin-1"))},
+        )
+
+    assert response.status_code == status_codes.HTTP_400_BAD_REQUEST
+    assert "UTF-8" in response.json()["detail"]
@@ -0,0 +1,73 @@
+import uuid
+
+import pytest
+
+from apps.company_structure.domain import aggregates
+from apps.company_structure.domain import exceptions as domain_exceptions
+
+
+def _make_node(
+    title: str, *children: aggregates.DepartmentTreeNode
+) -> aggregates.DepartmentTreeNode:
+    return aggregates.DepartmentTreeNode(id=uuid.uuid4(), title=title, children=list(children))
+
+
+def _build_department_tree() -> aggregates.DepartmentTreeAggregate:
+    """Root with a sales department of two teams and a support department without any."""
+    sales = _make_node("Sales", _make_node("North"), _make_node("South"))
+    return aggregates.DepartmentTreeAggregate(root=_make_node("Root", sales, _make_node("Support")))
+
+
+def test_nodes_indexed_by_id() -> None:
+    department_tree = _build_department_tree()
+    nodes = list(department_tree)
+
+    assert len(department_tree) == len(nodes)
+    assert all(department_tree[node.id] is node for node in nodes)
+    assert uuid.uuid4() not in department_tree
+    with pytest.raises(domain_exceptions.DepartmentTreeNodeNotFoundError):
+        department_tree[uuid.uuid4()]
+
+
+def test_added_subtree_indexed() -> None:
+    department_tree = _build_department_tree()
+    sales = department_tree.root.children[0]
+    west = _make_node("West", _make_node("West team"))
+
+    department_tree.add_child(sales.id, west)
+
+    assert sales.children[-1] is west
+    assert department_tree[west.children[0].id] is west.children[0]
+    assert len(department_tree) == len(list(department_tree))
+
+
+def test_removed_subtree_unindexed() -> None:
+    department_tree = _build_department_tree()
+    sales, support = department_tree.root.children
+    north = sales.children[0]
+
+    department_tree.remove_with_children(sales.id)
+
+    assert department_tree.root.children == [support]
+    assert sales.id not in department_tree
+    assert north.id not in department_tree
+    assert len(department_tree) == len(list(department_tree))
+
+
+def test_only_childless_department_removed() -> None:
+    department_tree = _build_department_tree()
+    sales, support = department_tree.root.children
+
+    with pytest.raises(domain_exceptions.ForbiddenDeleteDepartmentWithChildrenError):
+        department_tree.remove_if_has_no_children(sales.id)
+    department_tree.remove_if_has_no_children(support.id)
+
+    assert support.id not in department_tree
+    assert department_tree.root.children == [sales]
+
+
+def test_root_not_removed() -> None:
+    department_tree = _build_department_tree()
+
+    with pytest.raises(domain_exceptions.ForbiddenDeleteRootDepartmentError):
+        department_tree.remove_with_children(department_tree.root.id)
@@ -0,0 +1,91 @@
+import uuid
+
+import pytest
+
+from apps.company_structure.domain import aggregates, compact_forest
+from apps.company_structure.domain import exceptions as domain_exceptions
+
+_ROOT_ID, _SALES_ID, _NORTH_ID, _SUPPORT_ID = (uuid.uuid4() for _ in range(4))
+
+
+def _build_forest() -> compact_forest.CompactDepartmentForest:
+    """Root with sales and support departments, children come before their parents."""
+    return compact_forest.CompactDepartmentForest(
+        [
+            compact_forest.DepartmentRecord(id=_NORTH_ID, title="North", parent_id=_SALES_ID),
+            compact_forest.DepartmentRecord(id=_SALES_ID, title="Sales", parent_id=_ROOT_ID),
+            compact_forest.DepartmentRecord(id=_SUPPORT_ID, title="Support", parent_id=_ROOT_ID),
+            compact_forest.DepartmentRecord(id=_ROOT_ID, title="Root", parent_id=None),
+        ]
+    )
+
+
+def test_records_linked_in_any_order() -> None:
+    forest = _build_forest()
+
+    assert [record.id for record in forest] == [_ROOT_ID, _SALES_ID, _NORTH_ID, _SUPPORT_ID]
+    assert forest.root_ids == [_ROOT_ID]
+    assert forest[_NORTH_ID] == compact_forest.DepartmentRecord(
+        id=_NORTH_ID, title="North", parent_id=_SALES_ID
+    )
+    with pytest.raises(domain_exceptions.DepartmentTreeNodeNotFoundError):
+        forest[uuid.uuid4()]
+
+
+def test_tree_built_from_any_department() -> None:
+    department_tree = _build_forest().to_tree(_NORTH_ID)
+
+    assert department_tree.root.id == _ROOT_ID
+    assert [child.id for child in department_tree.root.children] == [_SALES_ID, _SUPPORT_ID]
+    assert department_tree[_SALES_ID].children[0].id == _NORTH_ID
+
+
+def test_tree_built_down_to_max_depth() -> None:
+    forest = _build_forest()
+
+    department_tree = forest.to_tree(_ROOT_ID, max_depth=1)
+
+    assert [child.id for child in department_tree.root.children] == [_SALES_ID, _SUPPORT_ID]
+    assert department_tree[_SALES_ID].children == []
+    assert _NORTH_ID not in department_tree
+    assert forest.to_tree(_ROOT_ID, max_depth=0).root.children == []
+
+
+def test_added_subtree_linked() -> None:
+    forest = _build_forest()
+    team = aggregates.DepartmentTreeNode(id=uuid.uuid4(), title="Team", children=[])
+    west = aggregates.DepartmentTreeNode(id=uuid.uuid4(), title="West", children=[team])
+    other_root = aggregates.DepartmentTreeNode(id=uuid.uuid4(), title="Other", children=[])
+
+    forest.add_child(_SALES_ID, west)
+    forest.add_child(None, other_root)
+
+    assert forest[team.id].parent_id == west.id
+    assert [child.title for child in forest.to_tree(_ROOT_ID)[_SALES_ID].children] == [
+        "North",
+        "West",
+    ]
+    assert forest.root_ids == [_ROOT_ID, other_root.id]
+
+
+def test_removed_subtree_unlinked() -> None:
+    forest = _build_forest()
+
+    forest.remove_with_children(_SALES_ID)
+
+    assert _NORTH_ID not in forest
+    assert [record.id for record in forest] == [_ROOT_ID, _SUPPORT_ID]
+    assert len(forest) == len(list(forest))
+
+
+def test_only_childless_non_root_removed() -> None:
+    forest = _build_forest()
+
+    with pytest.raises(domain_exceptions.ForbiddenDeleteDepartmentWithChildrenError):
+        forest.remove_if_has_no_children(_SALES_ID)
+    with pytest.raises(domain_exceptions.ForbiddenDeleteRootDepartmentError):
+        forest.remove_with_children(_ROOT_ID)
+    forest.remove_if_has_no_children(_NORTH_ID)
+
+    assert _NORTH_ID not in forest
+    assert forest[_SALES_ID].parent_id == _ROOT_ID
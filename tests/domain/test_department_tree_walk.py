@@ -0,0 +1,55 @@
+import uuid
+
+from apps.company_structure.domain import aggregates
+
+# Deeper than the recursion limit, so a recursive walk would fail
+_DEEP_TREE_HEIGHT = 5000
+
+
+def _make_node(
+    title: str, *children: aggregates.DepartmentTreeNode
+) -> aggregates.DepartmentTreeNode:
+    return aggregates.DepartmentTreeNode(id=uuid.uuid4(), title=title, children=list(children))
+
+
+def _build_department_tree() -> aggregates.DepartmentTreeNode:
+    sales = _make_node("Sales", _make_node("North"), _make_node("South"))
+    return _make_node("Root", sales, _make_node("Support"))
+
+
+def test_walk_in_pre_order() -> None:
+    root = _build_department_tree()
+    sales, support = root.children
+
+    walk_steps = list(aggregates.walk_department_tree(root))
+
+    assert [step.node for step in walk_steps] == [root, sales, *sales.children, support]
+    assert [step.parent_id for step in walk_steps] == [
+        None,
+        root.id,
+        sales.id,
+        sales.id,
+        root.id,
+    ]
+    assert [step.depth for step in walk_steps] == [0, 1, 2, 2, 1]
+
+
+def test_walk_stops_at_max_depth() -> None:
+    root = _build_department_tree()
+
+    shallow_steps = list(aggregates.walk_department_tree(root, 1))
+    root_steps = list(aggregates.walk_department_tree(root, 0))
+
+    assert [step.node for step in shallow_steps] == [root, *root.children]
+    assert [step.node for step in root_steps] == [root]
+
+
+def test_walk_deep_tree() -> None:
+    root = _make_node("Leaf")
+    for _ in range(_DEEP_TREE_HEIGHT):
+        root = _make_node("Level", root)
+
+    walk_steps = list(aggregates.walk_department_tree(root))
+
+    assert len(walk_steps) == _DEEP_TREE_HEIGHT + 1
+    assert walk_steps[-1].depth == _DEEP_TREE_HEIGHT